@@ -1,7 +1,7 @@
 # bot.py
 import os
 
-import config.env
+from config.env import load_environment
 from telegram.ext import ApplicationBuilder, CommandHandler, MessageHandler, filters
 from handlers import (
     start,
@@ -19,15 +19,26 @@ from handlers import (
     confirmar_eliminar_cuenta,
     comandos_invalidos,
 )
+from bot_data_access import shutdown_db_executor
+from user_update_processor import PerUserUpdateProcessor
 
-TOKEN = os.getenv("TELEGRAM_BOT_TOKEN") or os.getenv("TELEGRAM_TOKEN", "")
+async def _post_shutdown(app):
+    shutdown_db_executor()
 
 def run_bot():
+    load_environment()
+    TOKEN = os.getenv("TELEGRAM_BOT_TOKEN") or os.getenv("TELEGRAM_TOKEN", "")
     if not TOKEN:
         raise ValueError(
             "Missing TELEGRAM_BOT_TOKEN or TELEGRAM_TOKEN in environment."
         )
-    app = ApplicationBuilder().token(TOKEN).build()
+    app = (
+        ApplicationBuilder()
+        .token(TOKEN)
+        .concurrent_updates(PerUserUpdateProcessor())
+        .post_shutdown(_post_shutdown)
+        .build()
+    )
 
     app.add_handler(CommandHandler("menu", menu))
     app.add_handler(CommandHandler("start", start))
@@ -1,18 +1,20 @@
 # monitor_workana/revisar_trabajos_en_workana.py
+import asyncio
 import os
 import sys
-import time
-from datetime import datetime, timedelta
+from datetime import datetime
 from typing import Optional
 
 # Ensure local imports resolve
 sys.path.append(os.path.dirname(__file__))
 
 from config_settings import load_settings
+from job_scheduler import JobScheduler
 from local_o_vps import entorno
 from projects_db import proyectosDatabase
 from projects_db_manager import ProjectRepository
 from run_scraper_and_store import Run as RunScraper
+from scrape_workana import close_driver_pool
 from telegram_flag_manager import gestionar_desde_telegram
 from workana_flag_manager import (
     debe_ejecutarse,
@@ -30,14 +32,16 @@ def VerifyConnection(db: proyectosDatabase) -> None:
         print(f"No se pudo verificar la conexión a la base de datos: {ex}")
 
 
-def scrape_all_projects() -> int:
-    """Scrape Workana without filters and persist results."""
+def scrape_all_projects(repo: Optional[ProjectRepository] = None, max_pages: int = 3) -> int:
+    """Scrape Workana without filters (pages 1..max_pages) and persist results."""
     url = "https://www.workana.com/jobs?language=es"
-    print(f"[SCRAPER] Ejecutando scrape completo: {url}")
-    return RunScraper(url)
+    print(f"[SCRAPER] Ejecutando scrape completo: {url} (hasta {max_pages} páginas)")
+    return RunScraper(url, max_pages=max_pages, repo=repo)
 
 
+# Estado heredado: solo se lee para inicializar la marca de agua en la DB
 STATE_FILE = "ultima_revision_skills.log"
+SKILL_SCAN_PAGE_SIZE = 200
 
 
 def _load_last_skill_scan() -> Optional[datetime]:
@@ -51,79 +55,105 @@ def _load_last_skill_scan() -> Optional[datetime]:
         return None
 
 
-def _persist_last_skill_scan(ts: datetime) -> None:
-    try:
-        with open(STATE_FILE, "w", encoding="utf-8") as f:
-            f.write(ts.isoformat())
-    except Exception as ex:
-        print(f"[SKILLS] No se pudo escribir el estado de escaneo: {ex}")
+def run_user_skill_scan(repo: ProjectRepository, page_size: int = SKILL_SCAN_PAGE_SIZE) -> None:
+    """Evaluate new projects (id > watermark) against user skills and enqueue alerts."""
+    last_id = repo.get_skill_scan_watermark(legacy_since=_load_last_skill_scan())
+    scanned = 0
+
+    while True:
+        projects = repo.get_projects_for_skill_scan(after_id=last_id, limit=page_size)
+        if not projects:
+            break
+
+        # La marca solo avanza si las alertas de la página quedaron en el outbox
+        if not repo.enqueue_notifications_for_projects(projects):
+            print("[SKILLS] No se pudieron encolar las notificaciones; se reintentará.")
+            return
+        page_last_id = max(int(p["id"]) for p in projects)
+        if not repo.advance_skill_scan_watermark(page_last_id):
+            print("[SKILLS] No se pudo guardar la marca de agua; se reintentará.")
+            return
+        last_id = page_last_id
+        scanned += len(projects)
+
+        if len(projects) < page_size:
+            break
+
+    if scanned:
+        print(f"[SKILLS] Proyectos revisados: {scanned} (último id: {last_id}).")
+    else:
+        print("[SKILLS] No hay proyectos nuevos para revisar.")
 
 
-def run_user_skill_scan(repo: ProjectRepository) -> None:
-    """Evaluate stored projects against user skills and send Telegram alerts."""
-    last_scan = _load_last_skill_scan()
-    projects = repo.get_projects_for_skill_scan(since=last_scan, limit=200)
+def run_outbox_delivery(repo: ProjectRepository) -> None:
+    """Send pending alerts from the notification outbox."""
+    delivered, failed = repo.deliver_pending_notifications()
+    if delivered or failed:
+        print(f"[OUTBOX] Enviados: {delivered} | Fallidos: {failed}")
 
-    if not projects:
-        print("[SKILLS] No hay proyectos nuevos para revisar.")
-        _persist_last_skill_scan(datetime.now())
+
+def run_general_scrape(repo: ProjectRepository, max_pages: int) -> None:
+    """Scrape job: honours the remote flag before hitting Workana."""
+    if not debe_scrapear_general():
+        reason = "por variable remota"
+        if not tiene_conexion_config():
+            reason = "por falta de conexión con la base de variables"
+        print(f"[SCRAPER] Scraper general desactivado {reason}; se omite esta ejecución.")
         return
+    inserted = scrape_all_projects(repo, max_pages)
+    print(f"[SCRAPER] Insertados/actualizados: {inserted}")
 
-    repo.notify_users_for_projects(projects)
-    _persist_last_skill_scan(datetime.now())
+
+def build_scheduler(
+    interval_scrape: int,
+    interval_skill_scan: int,
+    interval_delivery_seconds: int = 15,
+    scrape_max_pages: int = 3,
+) -> JobScheduler:
+    """Register the scrape, match and deliver jobs (intervals in minutes/seconds)."""
+    # Cada job usa su propio repositorio: WorkanaBotDatabase guarda la
+    # transacción abierta por instancia y los jobs corren en paralelo
+    scrape_repo = ProjectRepository()
+    # Índice de urls ya guardadas: snapshot en disco + proyectos nuevos de la DB
+    scrape_repo.warm_seen_urls()
+    match_repo = ProjectRepository()
+    deliver_repo = ProjectRepository()
+
+    scheduler = JobScheduler()
+    scheduler.add_job(
+        "scrape", lambda: run_general_scrape(scrape_repo, scrape_max_pages), interval_scrape * 60
+    )
+    scheduler.add_job("match", lambda: run_user_skill_scan(match_repo), interval_skill_scan * 60)
+    scheduler.add_job("deliver", lambda: run_outbox_delivery(deliver_repo), interval_delivery_seconds)
+    return scheduler
 
 
 def schedule_loop(
     interval_scrape: int,
     interval_skill_scan: int,
+    interval_delivery_seconds: int = 15,
+    scrape_max_pages: int = 3,
 ) -> None:
-    """Main scheduler loop to run tasks every configured minutes."""
-    project_db = proyectosDatabase()
-    repo = ProjectRepository()
-    VerifyConnection(project_db)
-
-    next_scrape = datetime.now()
-    next_skill_scan = datetime.now()
+    """Run the scrape, match and deliver jobs concurrently until interrupted."""
+    VerifyConnection(proyectosDatabase())
+    scheduler = build_scheduler(
+        interval_scrape, interval_skill_scan, interval_delivery_seconds, scrape_max_pages
+    )
+    for job in scheduler.Jobs:
+        print(f"[SCHEDULE] Job '{job.name}' cada {job.interval_seconds:.0f} s")
 
     try:
-        while True:
-            now = datetime.now()
-            ran_task = False
-
-            if now >= next_scrape:
-                run_scraper = debe_scrapear_general()
-
-                if run_scraper:
-                    try:
-                        inserted = scrape_all_projects()
-                        print(f"[SCRAPER] Insertados/actualizados: {inserted}")
-                    except Exception as ex:
-                        print(f"[SCRAPER] Error: {ex}")
-                else:
-                    reason = "por variable remota"
-                    if not tiene_conexion_config():
-                        reason = "por falta de conexión con la base de variables"
-                    print(
-                        f"[SCRAPER] Scraper general desactivado {reason}; se omite esta ejecución."
-                    )
-                next_scrape = now + timedelta(minutes=interval_scrape)
-                ran_task = True
-
-            if now >= next_skill_scan:
-                try:
-                    run_user_skill_scan(repo)
-                except Exception as ex:
-                    print(f"[SKILLS] Error: {ex}")
-                next_skill_scan = now + timedelta(minutes=interval_skill_scan)
-                ran_task = True
-
-            if ran_task:
-                proxima = min(next_scrape, next_skill_scan).strftime("%H:%M:%S")
-                print(f"[SCHEDULE] Próxima ejecución programada a las {proxima}")
-
-            time.sleep(5)
+        asyncio.run(scheduler.run())
     except KeyboardInterrupt:
         print("Scheduler detenido manualmente.")
+    finally:
+        for name, stats in scheduler.stats().items():
+            if stats.runs:
+                print(
+                    f"[SCHEDULE] {name}: {stats.runs} ejecuciones, {stats.failures} fallidas, "
+                    f"última duración {stats.last_duration:.1f} s, retraso {stats.last_lag:.1f} s"
+                )
+        close_driver_pool()
 
 
 def main():
@@ -142,6 +172,8 @@ def main():
     schedule_loop(
         interval_scrape=intervals.get("scrape_all_minutes", 5),
         interval_skill_scan=intervals.get("user_skill_scan_minutes", 5),
+        interval_delivery_seconds=intervals.get("outbox_delivery_seconds", 15),
+        scrape_max_pages=intervals.get("scrape_max_pages", 3),
     )
 
 
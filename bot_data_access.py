@@ -0,0 +1,51 @@
+# bot_data_access.py
+"""Ejecuta el acceso a la base de datos de los handlers fuera del event loop.
+
+El driver mariadb es sincrónico: cada consulta hecha directamente en un handler
+bloquea el loop de python-telegram-bot y frena a todos los demás usuarios. Los
+handlers agrupan su trabajo de DB en funciones sincrónicas y las esperan con
+run_db(), que las corre en un pool de threads del mismo tamaño que el pool de
+conexiones (DB_POOL_SIZE).
+"""
+import asyncio
+import functools
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Optional
+
+from config.env import load_environment
+
+DEFAULT_DB_WORKERS = 5
+
+_executor: Optional[ThreadPoolExecutor] = None
+_executor_lock = threading.Lock()
+
+
+def _get_executor() -> ThreadPoolExecutor:
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            load_environment()
+            try:
+                workers = int(os.getenv("DB_POOL_SIZE", DEFAULT_DB_WORKERS))
+            except ValueError:
+                workers = DEFAULT_DB_WORKERS
+            _executor = ThreadPoolExecutor(
+                max_workers=max(1, workers), thread_name_prefix="bot-db"
+            )
+        return _executor
+
+
+async def run_db(func: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+    """Corre func(*args, **kwargs) en el pool de threads de DB y espera el resultado."""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_get_executor(), functools.partial(func, *args, **kwargs))
+
+
+def shutdown_db_executor() -> None:
+    global _executor
+    with _executor_lock:
+        executor, _executor = _executor, None
+    if executor is not None:
+        executor.shutdown(wait=True)
@@ -0,0 +1,151 @@
+# check_query_plans.py
+"""
+Verifica con EXPLAIN que las consultas frecuentes de projects_db.py y
+projects_db_manager.py usen índices.
+
+Falla (exit 1) si alguna tabla base se lee con access_type ALL (full scan) y
+además no tiene ningún índice utilizable o el optimizador estima al menos
+--min-rows filas. Con tablas chicas el optimizador puede preferir un scan aunque
+exista el índice; eso no se considera un error. Las tablas derivadas
+(<derived2>, <union1,2>) se ignoran: su tamaño ya está acotado por el LIMIT de
+cada rama.
+
+Uso: python check_query_plans.py [--min-rows 1000]
+Después de aplicar migrations/20261021_add_hot_query_indexes.sql.
+"""
+import argparse
+import json
+import sys
+from typing import Any, Dict, Iterator, List, Tuple
+
+import projects_db
+from project_url import url_hash
+from projects_db_manager import USER_SKILL_MAP_QUERY
+from workana_bot_database_model import WorkanaBotDatabase
+
+SAMPLE_URL = "https://www.workana.com/job/check-query-plans"
+SAMPLE_URL_HASH = url_hash(SAMPLE_URL)
+SAMPLE_SEARCH = 'python "microsoft excel"'
+
+# (consulta, parámetros de ejemplo, permite full scan). Las cadenas son las
+# mismas constantes que se ejecutan en runtime.
+HOT_QUERIES: Dict[str, Tuple[str, tuple, bool]] = {
+    "projects_db.proyecto_exists_by_url": (projects_db.EXISTS_BY_URL_HASH_QUERY, (SAMPLE_URL_HASH,), False),
+    "projects_db.get_id_by_url": (projects_db.ID_BY_URL_HASH_QUERY, (SAMPLE_URL_HASH,), False),
+    "projects_db.upsert_by_url": (
+        projects_db.ID_AND_CONTENT_HASH_BY_URL_HASH_QUERY,
+        (SAMPLE_URL_HASH,),
+        False,
+    ),
+    "projects_db.get_by_url": (projects_db.GET_BY_URL_HASH_QUERY, (SAMPLE_URL_HASH,), False),
+    "projects_db.get_ids_by_urls": (
+        projects_db.IDS_BY_URL_HASHES_QUERY.format(placeholders=projects_db.in_placeholders(2)),
+        (SAMPLE_URL_HASH, url_hash(SAMPLE_URL + "-2")),
+        False,
+    ),
+    "projects_db.get_recent": (projects_db.RECENT_PROJECTS_QUERY, (50, 50, 50), False),
+    "projects_db.get_projects_with_skills_after_id": (projects_db.PROJECTS_AFTER_ID_QUERY, (0, 200), False),
+    "projects_db.get_url_hashes_after_id": (projects_db.URL_HASHES_AFTER_ID_QUERY, (0, 5000), False),
+    "projects_db.get_projects_identity": (projects_db.PROJECTS_IDENTITY_QUERY, (5000,), False),
+    "projects_db.get_max_project_id": (
+        projects_db.MAX_PROJECT_ID_BEFORE_QUERY,
+        ("2026-01-01 00:00:00",),
+        False,
+    ),
+    "projects_db.get_id_before_latest": (projects_db.ID_BEFORE_LATEST_QUERY, (200,), False),
+    "projects_db._attach_skills": (
+        projects_db.SKILLS_FOR_PROJECTS_QUERY.format(placeholders=projects_db.in_placeholders(3)),
+        (1, 2, 3),
+        False,
+    ),
+    "projects_db.replace_skills_for_projects": (
+        projects_db.STORED_SKILLS_FOR_PROJECTS_QUERY.format(placeholders=projects_db.in_placeholders(3)),
+        (1, 2, 3),
+        False,
+    ),
+    "projects_db.search_by_skills_ranked": (
+        projects_db.RANKED_SEARCH_QUERY.format(keyset=""),
+        (SAMPLE_SEARCH, SAMPLE_SEARCH, 100),
+        False,
+    ),
+    # LIKE '%skill%' no puede usar índices; es el fallback cuando no hay FULLTEXT
+    "projects_db.search_by_skills (LIKE)": (
+        projects_db.LIKE_SEARCH_QUERY.format(conditions=projects_db.LIKE_SEARCH_CONDITION),
+        ("%python%", 100),
+        True,
+    ),
+    "projects_db_manager._get_user_skill_map": (USER_SKILL_MAP_QUERY, (), False),
+}
+
+
+def _iter_table_accesses(node: Any) -> Iterator[Dict[str, Any]]:
+    """Recorre el plan de EXPLAIN FORMAT=JSON y devuelve cada acceso a tabla."""
+    if isinstance(node, dict):
+        if "access_type" in node and "table_name" in node:
+            yield node
+        for value in node.values():
+            yield from _iter_table_accesses(value)
+    elif isinstance(node, list):
+        for item in node:
+            yield from _iter_table_accesses(item)
+
+
+def find_full_scans(plan: Dict[str, Any], min_rows: int) -> List[str]:
+    problems: List[str] = []
+    for access in _iter_table_accesses(plan):
+        table = str(access.get("table_name", ""))
+        if table.startswith("<"):
+            continue
+        if access.get("access_type") != "ALL":
+            continue
+        possible_keys = access.get("possible_keys") or []
+        rows = int(access.get("rows") or 0)
+        if not possible_keys or rows >= min_rows:
+            keys = ", ".join(possible_keys) if possible_keys else "ninguno"
+            problems.append(f"{table}: full scan (~{rows} filas, índices posibles: {keys})")
+    return problems
+
+
+def check_query_plans(db: WorkanaBotDatabase, min_rows: int) -> bool:
+    all_ok = True
+    for name, (sql, params, allow_full_scan) in HOT_QUERIES.items():
+        raw_plan = db.execute_scalar(f"EXPLAIN FORMAT=JSON {sql}", params)
+        if raw_plan is None:
+            print(f"❌ {name}: no se pudo obtener el plan.")
+            all_ok = False
+            continue
+        problems = find_full_scans(json.loads(raw_plan), min_rows)
+        if not problems:
+            print(f"✅ {name}")
+        elif allow_full_scan:
+            print(f"⚠️ {name} (permitido): {'; '.join(problems)}")
+        else:
+            print(f"❌ {name}: {'; '.join(problems)}")
+            all_ok = False
+    return all_ok
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument(
+        "--min-rows",
+        type=int,
+        default=1000,
+        help="Filas estimadas a partir de las cuales un full scan con índice disponible es un error.",
+    )
+    args = parser.parse_args()
+
+    db = WorkanaBotDatabase()
+    db.connect()
+    if not db.IsConnected:
+        print("No es posible conectarse a la base de datos.")
+        return 2
+    try:
+        ok = check_query_plans(db, args.min_rows)
+    finally:
+        db.disconnect()
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
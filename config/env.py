@@ -1,11 +1,15 @@
-"""Environment loader using python-dotenv."""
+"""Environment loader using python-dotenv.
+
+The .env file is read on first use through load_environment(), not at import
+time, so importing the bot (or a test) does not touch the filesystem or print.
+"""
 from pathlib import Path
 import os
+import threading
 
 from dotenv import load_dotenv
 
 BASE_DIR = Path(__file__).resolve().parent.parent
-BOT_ENV = os.getenv("BOT_ENV", "dev").lower()
 
 ENV_FILES = {
     "dev": ".env.dev",
@@ -13,6 +17,20 @@ ENV_FILES = {
     "laptop": ".env.laptop",
 }
 
-env_file = ENV_FILES.get(BOT_ENV, ENV_FILES["dev"])
-print(f"🔧 BOT_ENV={BOT_ENV} -> cargando {env_file}")
-load_dotenv(BASE_DIR / env_file)
+_loaded = False
+_load_lock = threading.Lock()
+
+
+def load_environment() -> None:
+    """Load the .env file selected by BOT_ENV once per process."""
+    global _loaded
+    if _loaded:
+        return
+    with _load_lock:
+        if _loaded:
+            return
+        bot_env = os.getenv("BOT_ENV", "dev").lower()
+        env_file = ENV_FILES.get(bot_env, ENV_FILES["dev"])
+        print(f"🔧 BOT_ENV={bot_env} -> cargando {env_file}")
+        load_dotenv(BASE_DIR / env_file)
+        _loaded = True
@@ -3,22 +3,42 @@ from __future__ import annotations
 
 import json
 import os
-from typing import Dict
+from typing import Any, Dict
 
 DEFAULT_INTERVAL_MINUTES = 5
 DEFAULT_MAX_USERS = 1
+DEFAULT_OUTBOX_DELIVERY_SECONDS = 15
+DEFAULT_SCRAPE_MAX_PAGES = 3
+DEFAULT_SCRAPE_BROWSER_POOL_SIZE = 2
+DEFAULT_SCRAPE_BROWSER_MAX_PAGE_LOADS = 20
+DEFAULT_SCRAPE_FETCH_MODE = "selenium"
+SCRAPE_FETCH_MODES = ("http", "selenium", "replay")
+DEFAULT_SCRAPE_RECORD_FIXTURES = False
+DEFAULT_SCRAPE_FIXTURES_DIR = "fixtures/listings"
 CONFIG_PATH = os.path.join(os.path.dirname(__file__), "config_settings.json")
 
 
-def _default_settings() -> Dict[str, int]:
+def _default_settings() -> Dict[str, Any]:
     return {
         "scrape_all_minutes": DEFAULT_INTERVAL_MINUTES,
         "user_skill_scan_minutes": DEFAULT_INTERVAL_MINUTES,
         "max_users": DEFAULT_MAX_USERS,
+        "outbox_delivery_seconds": DEFAULT_OUTBOX_DELIVERY_SECONDS,
+        "scrape_max_pages": DEFAULT_SCRAPE_MAX_PAGES,
+        "scrape_browser_pool_size": DEFAULT_SCRAPE_BROWSER_POOL_SIZE,
+        "scrape_browser_max_page_loads": DEFAULT_SCRAPE_BROWSER_MAX_PAGE_LOADS,
+        "scrape_fetch_mode": DEFAULT_SCRAPE_FETCH_MODE,
+        "scrape_record_fixtures": DEFAULT_SCRAPE_RECORD_FIXTURES,
+        "scrape_fixtures_dir": _resolve_path(DEFAULT_SCRAPE_FIXTURES_DIR),
     }
 
 
-def load_settings(config_path: str | None = None) -> Dict[str, int]:
+def _resolve_path(path: str) -> str:
+    """Rutas relativas se toman desde la carpeta del proyecto."""
+    return path if os.path.isabs(path) else os.path.join(os.path.dirname(__file__), path)
+
+
+def load_settings(config_path: str | None = None) -> Dict[str, Any]:
     """Load general configuration values from JSON, falling back to defaults."""
     path = config_path or CONFIG_PATH
     defaults = _default_settings()
@@ -32,8 +52,29 @@ def load_settings(config_path: str | None = None) -> Dict[str, int]:
     except Exception:
         return defaults
 
+    fetch_mode = str(data.get("scrape_fetch_mode", DEFAULT_SCRAPE_FETCH_MODE)).strip().lower()
+    if fetch_mode not in SCRAPE_FETCH_MODES:
+        fetch_mode = DEFAULT_SCRAPE_FETCH_MODE
+
     return {
         "scrape_all_minutes": int(data.get("scrape_all_minutes", DEFAULT_INTERVAL_MINUTES)),
         "user_skill_scan_minutes": int(data.get("user_skill_scan_minutes", DEFAULT_INTERVAL_MINUTES)),
         "max_users": int(data.get("max_users", DEFAULT_MAX_USERS)),
+        "outbox_delivery_seconds": int(
+            data.get("outbox_delivery_seconds", DEFAULT_OUTBOX_DELIVERY_SECONDS)
+        ),
+        "scrape_max_pages": int(data.get("scrape_max_pages", DEFAULT_SCRAPE_MAX_PAGES)),
+        "scrape_browser_pool_size": int(
+            data.get("scrape_browser_pool_size", DEFAULT_SCRAPE_BROWSER_POOL_SIZE)
+        ),
+        "scrape_browser_max_page_loads": int(
+            data.get("scrape_browser_max_page_loads", DEFAULT_SCRAPE_BROWSER_MAX_PAGE_LOADS)
+        ),
+        "scrape_fetch_mode": fetch_mode,
+        "scrape_record_fixtures": bool(
+            data.get("scrape_record_fixtures", DEFAULT_SCRAPE_RECORD_FIXTURES)
+        ),
+        "scrape_fixtures_dir": _resolve_path(
+            str(data.get("scrape_fixtures_dir") or DEFAULT_SCRAPE_FIXTURES_DIR)
+        ),
     }
@@ -21,6 +21,9 @@ from workana_flag_manager import (
 from workana_bot_database_model import WorkanaBotDatabase
 from user_model import User
 from user_skills_model import UserSkills
+from bot_data_access import run_db
+
+MENSAJE_SIN_DB = "No es posible conectarse a la base de datos."
 
 
 def _get_message(update: Update) -> Message | None:
@@ -62,25 +65,8 @@ async def start(update: Update, context: ContextTypes.DEFAULT_TYPE):
     if message is None:
         return
 
-    if not tiene_conexion_config():
-        await message.reply_text(
-            "No se pudo conectar a la base de datos de configuración.\n"
-            "Contactá a Servicio Técnico e informá el código de error: "
-            f"{obtener_codigo_error_conexion()}."
-        )
-        return
-
-    if activar_script():
-        await message.reply_text(
-            "Monitoreo iniciado correctamente.\n"
-            "Puedes usar los comandos disponibles para modificar la configuración."
-        )
-    else:
-        await message.reply_text(
-            "No se pudo iniciar el monitoreo.\n"
-            "Contactá a Servicio Técnico e informá el código de error: "
-            f"{obtener_codigo_error_conexion()}."
-        )
+    mensaje = await run_db(_activar_monitoreo)
+    await message.reply_text(mensaje)
 
 async def registrar(update: Update, context: ContextTypes.DEFAULT_TYPE):
     message = _get_message(update)
@@ -94,66 +80,16 @@ async def registrar(update: Update, context: ContextTypes.DEFAULT_TYPE):
     TelegramUserID = user.id
     TelegramUsername = user.username or "sin_usuario"
 
-    Database = WorkanaBotDatabase()
-    Database.connect()
-
-    if not Database.IsConnected:
-        await message.reply_text("No es posible conectarse a la base de datos.")
-        return
-
-    BotUser = User(TelegramUserID, Database)
-
-    if BotUser.IsRegistered:
-        await message.reply_text("Ya estás registrado.")
-    else:
-        settings = load_settings()
-        try:
-            max_users = int(settings.get("max_users", 1))
-        except (TypeError, ValueError):
-            max_users = 1
-
-        if max_users <= 0:
-            max_users = 1
-
-        usuarios_activos = User.CountActive(Database)
-        if usuarios_activos >= max_users:
-            await message.reply_text(
-                "No hay invitaciones disponibles en este momento. "
-                "Pronto se habilitarán más cupos."
-            )
-            Database.disconnect()
-            return
-
-        RegistrationSuccess = BotUser.Register(TelegramUsername)
-        if RegistrationSuccess:
-            estado = "reactivado" if BotUser.IsActivated else "registrado"
-            await message.reply_text(f"Usuario {estado} correctamente.")
-        else:
-            await message.reply_text("No fue posible registrar el usuario.")
-
-    Database.disconnect()
+    mensaje = await run_db(_registrar_usuario, TelegramUserID, TelegramUsername)
+    await message.reply_text(mensaje)
 
 async def stop(update: Update, context: ContextTypes.DEFAULT_TYPE):
     message = _get_message(update)
     if message is None:
         return
 
-    if not tiene_conexion_config():
-        await message.reply_text(
-            "No se pudo conectar a la base de datos de configuración.\n"
-            "Contactá a Servicio Técnico e informá el código de error: "
-            f"{obtener_codigo_error_conexion()}."
-        )
-        return
-
-    if desactivar_script():
-        await message.reply_text("Monitoreo detenido.")
-    else:
-        await message.reply_text(
-            "No se pudo detener el monitoreo.\n"
-            "Contactá a Servicio Técnico e informá el código de error: "
-            f"{obtener_codigo_error_conexion()}."
-        )
+    mensaje = await run_db(_detener_monitoreo)
+    await message.reply_text(mensaje)
 
 async def eliminar_cuenta(update: Update, context: ContextTypes.DEFAULT_TYPE):
     message = _get_message(update)
@@ -165,33 +101,15 @@ async def eliminar_cuenta(update: Update, context: ContextTypes.DEFAULT_TYPE):
         return
 
     TelegramUserID = user.id
-
-    Database = WorkanaBotDatabase()
-    Database.connect()
-
-    if not Database.IsConnected:
-        await message.reply_text("No es posible conectarse a la base de datos.")
-        return
-
-    usuario = User(TelegramUserID, Database)
     bot_username = update.get_bot().username or ""
 
-    if not usuario.IsRegistered:
-        Database.disconnect()
-        await message.reply_text("No estás registrado. Usá /registrar para crear tu cuenta.")
+    mensaje, es_html = await run_db(_preparar_eliminar_cuenta, TelegramUserID, bot_username)
+    if not es_html:
+        await message.reply_text(mensaje)
         return
 
-    comando_confirmacion = _formatear_comando_enlace(
-        "/confirmar_eliminar_cuenta", bot_username
-    )
-    Database.disconnect()
-
     await message.reply_text(
-        (
-            "Vas a eliminar tu cuenta del bot.\n"
-            f"Confirmá tocando {comando_confirmacion} o cancelá con /menu.\n"
-            "Si no se completa automáticamente, copiá y enviá la línea mostrada."
-        ),
+        mensaje,
         parse_mode=ParseMode.HTML,
         disable_web_page_preview=True,
     )
@@ -209,7 +127,7 @@ async def confirmar_eliminar_cuenta(update: Update, context: ContextTypes.DEFAUL
     TelegramUserID = user.id
     bot_username = update.get_bot().username or ""
 
-    mensaje = _eliminar_cuenta_confirmada(TelegramUserID, bot_username)
+    mensaje = await run_db(_eliminar_cuenta_confirmada, TelegramUserID, bot_username)
     await message.reply_text(
         mensaje,
         parse_mode=ParseMode.HTML,
@@ -284,7 +202,7 @@ async def manejar_callback(update: Update, context: ContextTypes.DEFAULT_TYPE):
 
     if data.startswith("elim_confirm:"):
         skill_slug = data.split(":", 1)[1]
-        mensaje = _eliminar_habilidad_confirmada(TelegramUserID, skill_slug)
+        mensaje = await run_db(_eliminar_habilidad_confirmada, TelegramUserID, skill_slug)
         await query.answer()
         if message is None:
             return
@@ -293,24 +211,17 @@ async def manejar_callback(update: Update, context: ContextTypes.DEFAULT_TYPE):
 
     if data == "elim_cancel":
         await query.answer("Operación cancelada")
-        Database = WorkanaBotDatabase()
-        Database.connect()
-        if not Database.IsConnected:
-            if message is None:
-                return
-            await message.reply_text("No es posible conectarse a la base de datos.")
-            Database.disconnect()
-            return
-        SkillsManager = UserSkills(TelegramUserID, Database)
-        estado = _formatear_estado_habilidades(SkillsManager)
-        Database.disconnect()
+        estado = await run_db(_consultar_estado_habilidades, TelegramUserID)
         if message is None:
             return
+        if estado is None:
+            await message.reply_text(MENSAJE_SIN_DB)
+            return
         await message.reply_text(f"Cancelaste la eliminación.\n\n{estado}")
         return
 
     if data == "limpiar_confirm":
-        mensaje = _limpiar_habilidades_confirmado(TelegramUserID)
+        mensaje = await run_db(_limpiar_habilidades_confirmado, TelegramUserID)
         await query.answer()
         if message is None:
             return
@@ -319,19 +230,12 @@ async def manejar_callback(update: Update, context: ContextTypes.DEFAULT_TYPE):
 
     if data == "limpiar_cancel":
         await query.answer("Operación cancelada")
-        Database = WorkanaBotDatabase()
-        Database.connect()
-        if not Database.IsConnected:
-            if message is None:
-                return
-            await message.reply_text("No es posible conectarse a la base de datos.")
-            Database.disconnect()
-            return
-        SkillsManager = UserSkills(TelegramUserID, Database)
-        estado = _formatear_estado_habilidades(SkillsManager)
-        Database.disconnect()
+        estado = await run_db(_consultar_estado_habilidades, TelegramUserID)
         if message is None:
             return
+        if estado is None:
+            await message.reply_text(MENSAJE_SIN_DB)
+            return
         await message.reply_text(f"Cancelaste la limpieza.\n\n{estado}")
         return
 
@@ -348,18 +252,8 @@ async def habilidades(update: Update, context: ContextTypes.DEFAULT_TYPE):
 
     TelegramUserID = user.id
 
-    Database = WorkanaBotDatabase()
-    Database.connect()
-
-    if not Database.IsConnected:
-        await message.reply_text("No es posible conectarse a la base de datos.")
-        return
-
-    SkillsManager = UserSkills(TelegramUserID, Database)
-    mensaje = _formatear_estado_habilidades(SkillsManager)
-
-    await message.reply_text(mensaje)
-    Database.disconnect()
+    mensaje = await run_db(_consultar_estado_habilidades, TelegramUserID)
+    await message.reply_text(mensaje if mensaje is not None else MENSAJE_SIN_DB)
 
 
 async def agregar(update: Update, context: ContextTypes.DEFAULT_TYPE):
@@ -381,35 +275,8 @@ async def agregar(update: Update, context: ContextTypes.DEFAULT_TYPE):
         )
         return
 
-    Database = WorkanaBotDatabase()
-    Database.connect()
-
-    if not Database.IsConnected:
-        await message.reply_text("No es posible conectarse a la base de datos.")
-        return
-
-    SkillsManager = UserSkills(TelegramUserID, Database)
-    if not SkillsManager.is_registered:
-        Database.disconnect()
-        await message.reply_text(
-            "No estás registrado. Usá /registrar para crear tu cuenta antes de agregar habilidades."
-        )
-        return
-    skill_slug = SkillsManager.normalize_skill(skill)
-
-    if SkillsManager.HasSkill(skill):
-        mensaje = f"La habilidad ya estaba registrada: {skill_slug}."
-    else:
-        agregado = SkillsManager.Add(skill)
-        if agregado:
-            mensaje = f"Habilidad agregada: {skill_slug}."
-        else:
-            mensaje = "No se pudo agregar la habilidad. Intentá nuevamente más tarde."
-
-    estado_habilidades = _formatear_estado_habilidades(SkillsManager)
-
-    Database.disconnect()
-    await message.reply_text(f"{mensaje}\n\n{estado_habilidades}")
+    mensaje = await run_db(_agregar_habilidad, TelegramUserID, skill)
+    await message.reply_text(mensaje)
 
 
 async def eliminar(update: Update, context: ContextTypes.DEFAULT_TYPE):
@@ -424,67 +291,20 @@ async def eliminar(update: Update, context: ContextTypes.DEFAULT_TYPE):
     TelegramUserID = user.id
     args = context.args or []
     skill = " ".join(args).strip()
+    bot_username = update.get_bot().username or ""
 
-    Database = WorkanaBotDatabase()
-    Database.connect()
-
-    if not Database.IsConnected:
-        await message.reply_text("No es posible conectarse a la base de datos.")
-        return
-
-    SkillsManager = UserSkills(TelegramUserID, Database)
-    habilidades_actuales = SkillsManager.GetAll()
-
-    if not skill:
-        if not habilidades_actuales:
-            estado_habilidades = _formatear_estado_habilidades(SkillsManager)
-            await message.reply_text(estado_habilidades)
-        else:
-            bot_username = update.get_bot().username or ""
-            comandos = "\n".join(
-                _formatear_comando_enlace(f"/eliminar_habilidad {s}", bot_username)
-                for s in habilidades_actuales
-            )
-            await message.reply_text(
-                (
-                    "Elegí qué habilidad querés eliminar tocando uno de estos enlaces:\n"
-                    f"{comandos}\n\n"
-                    "Si no se completa automáticamente, copiá y enviá la línea mostrada.\n"
-                    "Se pedirá confirmación antes de borrar."
-                ),
-                parse_mode=ParseMode.HTML,
-                disable_web_page_preview=True,
-            )
-
-        Database.disconnect()
-        return
-
-    skill_slug = SkillsManager.normalize_skill(skill)
-
-    if not SkillsManager.HasSkill(skill_slug):
-        mensaje = "La habilidad indicada no está registrada."
-    else:
-        bot_username = update.get_bot().username or ""
-        comando_confirmacion = _formatear_comando_enlace(
-            f"/confirmar_eliminar_habilidad {skill_slug}", bot_username
-        )
-
-        Database.disconnect()
-        await message.reply_text(
-            (
-                f"Vas a eliminar la habilidad: {skill_slug}.\n"
-                f"Confirmá tocando {comando_confirmacion} o cancelá con /habilidades.\n"
-                "Si no se completa automáticamente, copiá y enviá la línea mostrada."
-            ),
-            parse_mode=ParseMode.HTML,
-            disable_web_page_preview=True,
-        )
+    mensaje, es_html = await run_db(
+        _preparar_eliminar_habilidad, TelegramUserID, skill, bot_username
+    )
+    if not es_html:
+        await message.reply_text(mensaje)
         return
 
-    estado_habilidades = _formatear_estado_habilidades(SkillsManager)
-
-    Database.disconnect()
-    await message.reply_text(f"{mensaje}\n\n{estado_habilidades}")
+    await message.reply_text(
+        mensaje,
+        parse_mode=ParseMode.HTML,
+        disable_web_page_preview=True,
+    )
 
 
 async def limpiar(update: Update, context: ContextTypes.DEFAULT_TYPE):
@@ -498,33 +318,8 @@ async def limpiar(update: Update, context: ContextTypes.DEFAULT_TYPE):
 
     TelegramUserID = user.id
 
-    Database = WorkanaBotDatabase()
-    Database.connect()
-
-    if not Database.IsConnected:
-        await message.reply_text("No es posible conectarse a la base de datos.")
-        return
-
-    SkillsManager = UserSkills(TelegramUserID, Database)
-    habilidades_actuales = SkillsManager.GetAll()
-
-    if not habilidades_actuales:
-        mensaje = "No tenés habilidades para limpiar."
-    else:
-        Database.disconnect()
-        await message.reply_text(
-            (
-                "Vas a eliminar todas tus habilidades. ¿Confirmás?\n"
-                "Esta acción no se puede deshacer.\n\n"
-                "Enviá /confirmar_limpiar para continuar o /habilidades para cancelar."
-            )
-        )
-        return
-
-    estado_habilidades = _formatear_estado_habilidades(SkillsManager)
-
-    Database.disconnect()
-    await message.reply_text(f"{mensaje}\n\n{estado_habilidades}")
+    mensaje = await run_db(_preparar_limpieza, TelegramUserID)
+    await message.reply_text(mensaje)
 
 
 async def confirmar_eliminar(update: Update, context: ContextTypes.DEFAULT_TYPE):
@@ -547,7 +342,7 @@ async def confirmar_eliminar(update: Update, context: ContextTypes.DEFAULT_TYPE)
         )
         return
 
-    mensaje = _eliminar_habilidad_confirmada(TelegramUserID, skill)
+    mensaje = await run_db(_eliminar_habilidad_confirmada, TelegramUserID, skill)
     await message.reply_text(mensaje)
 
 
@@ -561,36 +356,216 @@ async def confirmar_limpiar(update: Update, context: ContextTypes.DEFAULT_TYPE):
         return
 
     TelegramUserID = user.id
-    mensaje = _limpiar_habilidades_confirmado(TelegramUserID)
+    mensaje = await run_db(_limpiar_habilidades_confirmado, TelegramUserID)
     await message.reply_text(mensaje)
 
 
-def _eliminar_cuenta_confirmada(user_id: int, bot_username: str) -> str:
-    Database = WorkanaBotDatabase()
-    Database.connect()
+# ---------------------------------------------------------------------------
+# Trabajo sincrónico con la base de datos (se ejecuta con run_db, fuera del loop)
+# ---------------------------------------------------------------------------
+
+def _error_config_db(accion: str) -> str:
+    return (
+        f"{accion}\n"
+        "Contactá a Servicio Técnico e informá el código de error: "
+        f"{obtener_codigo_error_conexion()}."
+    )
+
+
+def _activar_monitoreo() -> str:
+    if not tiene_conexion_config():
+        return _error_config_db("No se pudo conectar a la base de datos de configuración.")
+
+    if activar_script():
+        return (
+            "Monitoreo iniciado correctamente.\n"
+            "Puedes usar los comandos disponibles para modificar la configuración."
+        )
+    return _error_config_db("No se pudo iniciar el monitoreo.")
 
-    if not Database.IsConnected:
-        Database.disconnect()
-        return "No es posible conectarse a la base de datos."
 
-    usuario = User(user_id, Database)
-    SkillsManager = UserSkills(user_id, Database)
+def _detener_monitoreo() -> str:
+    if not tiene_conexion_config():
+        return _error_config_db("No se pudo conectar a la base de datos de configuración.")
+
+    if desactivar_script():
+        return "Monitoreo detenido."
+    return _error_config_db("No se pudo detener el monitoreo.")
+
+
+def _registrar_usuario(user_id: int, username: str) -> str:
+    with WorkanaBotDatabase().connection() as Database:
+        if not Database.IsConnected:
+            return MENSAJE_SIN_DB
+
+        BotUser = User(user_id, Database)
+
+        if BotUser.IsRegistered:
+            return "Ya estás registrado."
+
+        settings = load_settings()
+        try:
+            max_users = int(settings.get("max_users", 1))
+        except (TypeError, ValueError):
+            max_users = 1
+
+        if max_users <= 0:
+            max_users = 1
+
+        usuarios_activos = User.CountActive(Database)
+        if usuarios_activos >= max_users:
+            return (
+                "No hay invitaciones disponibles en este momento. "
+                "Pronto se habilitarán más cupos."
+            )
+        if BotUser.Register(username):
+            estado = "reactivado" if BotUser.IsActivated else "registrado"
+            return f"Usuario {estado} correctamente."
+        return "No fue posible registrar el usuario."
+
+
+def _preparar_eliminar_cuenta(user_id: int, bot_username: str) -> tuple[str, bool]:
+    """Devuelve (mensaje, es_html) para el pedido de confirmación de /eliminar_cuenta."""
+    with WorkanaBotDatabase().connection() as Database:
+        if not Database.IsConnected:
+            return MENSAJE_SIN_DB, False
+
+        usuario = User(user_id, Database)
 
     if not usuario.IsRegistered:
-        mensaje = "No estás registrado. Usá /registrar para crear tu cuenta."
-    else:
-        habilidades_borradas = SkillsManager.ClearAll()
-        borrado = habilidades_borradas and usuario.Delete()
-        if borrado:
-            mensaje = (
-                "Tu cuenta fue eliminada del bot.\n"
-                "Si querés volver a usarlo, tendrás que registrarte nuevamente con /registrar."
+        return "No estás registrado. Usá /registrar para crear tu cuenta.", False
+
+    comando_confirmacion = _formatear_comando_enlace(
+        "/confirmar_eliminar_cuenta", bot_username
+    )
+    return (
+        "Vas a eliminar tu cuenta del bot.\n"
+        f"Confirmá tocando {comando_confirmacion} o cancelá con /menu.\n"
+        "Si no se completa automáticamente, copiá y enviá la línea mostrada."
+    ), True
+
+
+def _consultar_estado_habilidades(user_id: int) -> str | None:
+    """Estado de habilidades del usuario o None si no hay conexión a la DB."""
+    with WorkanaBotDatabase().connection() as Database:
+        if not Database.IsConnected:
+            return None
+
+        SkillsManager = UserSkills(user_id, Database)
+        return _formatear_estado_habilidades(SkillsManager)
+
+
+def _agregar_habilidad(user_id: int, skill: str) -> str:
+    with WorkanaBotDatabase().connection() as Database:
+        if not Database.IsConnected:
+            return MENSAJE_SIN_DB
+
+        SkillsManager = UserSkills(user_id, Database)
+        if not SkillsManager.is_registered:
+            return (
+                "No estás registrado. Usá /registrar para crear tu cuenta antes de agregar habilidades."
             )
+        skill_slug = SkillsManager.normalize_skill(skill)
+
+        if SkillsManager.HasSkill(skill):
+            mensaje = f"La habilidad ya estaba registrada: {skill_slug}."
         else:
-            mensaje = "No se pudo borrar la cuenta. Intentá nuevamente más tarde."
+            agregado = SkillsManager.Add(skill)
+            if agregado:
+                mensaje = f"Habilidad agregada: {skill_slug}."
+            else:
+                mensaje = "No se pudo agregar la habilidad. Intentá nuevamente más tarde."
 
-    Database.disconnect()
-    return mensaje
+        estado_habilidades = _formatear_estado_habilidades(SkillsManager)
+
+    return f"{mensaje}\n\n{estado_habilidades}"
+
+
+def _preparar_eliminar_habilidad(user_id: int, skill: str, bot_username: str) -> tuple[str, bool]:
+    """Devuelve (mensaje, es_html) para /eliminar_habilidad con o sin argumento."""
+    with WorkanaBotDatabase().connection() as Database:
+        if not Database.IsConnected:
+            return MENSAJE_SIN_DB, False
+
+        SkillsManager = UserSkills(user_id, Database)
+        habilidades_actuales = SkillsManager.GetAll()
+
+        if not skill:
+            if not habilidades_actuales:
+                return _formatear_estado_habilidades(SkillsManager), False
+            skill_slug = None
+        else:
+            skill_slug = SkillsManager.normalize_skill(skill)
+            if not SkillsManager.HasSkill(skill_slug):
+                mensaje = "La habilidad indicada no está registrada."
+                estado_habilidades = _formatear_estado_habilidades(SkillsManager)
+                return f"{mensaje}\n\n{estado_habilidades}", False
+
+    if skill_slug is None:
+        comandos = "\n".join(
+            _formatear_comando_enlace(f"/eliminar_habilidad {s}", bot_username)
+            for s in habilidades_actuales
+        )
+        return (
+            "Elegí qué habilidad querés eliminar tocando uno de estos enlaces:\n"
+            f"{comandos}\n\n"
+            "Si no se completa automáticamente, copiá y enviá la línea mostrada.\n"
+            "Se pedirá confirmación antes de borrar."
+        ), True
+
+    comando_confirmacion = _formatear_comando_enlace(
+        f"/confirmar_eliminar_habilidad {skill_slug}", bot_username
+    )
+    return (
+        f"Vas a eliminar la habilidad: {skill_slug}.\n"
+        f"Confirmá tocando {comando_confirmacion} o cancelá con /habilidades.\n"
+        "Si no se completa automáticamente, copiá y enviá la línea mostrada."
+    ), True
+
+
+def _preparar_limpieza(user_id: int) -> str:
+    with WorkanaBotDatabase().connection() as Database:
+        if not Database.IsConnected:
+            return MENSAJE_SIN_DB
+
+        SkillsManager = UserSkills(user_id, Database)
+        habilidades_actuales = SkillsManager.GetAll()
+
+        if habilidades_actuales:
+            return (
+                "Vas a eliminar todas tus habilidades. ¿Confirmás?\n"
+                "Esta acción no se puede deshacer.\n\n"
+                "Enviá /confirmar_limpiar para continuar o /habilidades para cancelar."
+            )
+
+        mensaje = "No tenés habilidades para limpiar."
+        estado_habilidades = _formatear_estado_habilidades(SkillsManager)
+
+    return f"{mensaje}\n\n{estado_habilidades}"
+
+
+def _eliminar_cuenta_confirmada(user_id: int, bot_username: str) -> str:
+    with WorkanaBotDatabase().connection() as Database:
+        if not Database.IsConnected:
+            return MENSAJE_SIN_DB
+
+        usuario = User(user_id, Database)
+        SkillsManager = UserSkills(user_id, Database)
+
+        if not usuario.IsRegistered:
+            return "No estás registrado. Usá /registrar para crear tu cuenta."
+
+        # Skills y usuario se borran juntos o no se borra nada
+        with Database.transaction() as tx:
+            borrado = SkillsManager.ClearAll() and usuario.Delete()
+        borrado = borrado and tx.IsCommitted
+
+    if borrado:
+        return (
+            "Tu cuenta fue eliminada del bot.\n"
+            "Si querés volver a usarlo, tendrás que registrarte nuevamente con /registrar."
+        )
+    return "No se pudo borrar la cuenta. Intentá nuevamente más tarde."
 
 
 def _formatear_comando_enlace(comando: str, bot_username: str) -> str:
@@ -620,49 +595,41 @@ def _formatear_estado_habilidades(skills_manager: UserSkills) -> str:
 
 
 def _eliminar_habilidad_confirmada(user_id: int, skill_slug: str) -> str:
-    Database = WorkanaBotDatabase()
-    Database.connect()
-
-    if not Database.IsConnected:
-        Database.disconnect()
-        return "No es posible conectarse a la base de datos."
+    with WorkanaBotDatabase().connection() as Database:
+        if not Database.IsConnected:
+            return MENSAJE_SIN_DB
 
-    SkillsManager = UserSkills(user_id, Database)
+        SkillsManager = UserSkills(user_id, Database)
 
-    if not SkillsManager.HasSkill(skill_slug):
-        mensaje = "La habilidad indicada no está registrada."
-    else:
-        eliminado = SkillsManager.Remove(skill_slug)
-        if eliminado:
-            mensaje = f"Habilidad eliminada: {skill_slug}."
+        if not SkillsManager.HasSkill(skill_slug):
+            mensaje = "La habilidad indicada no está registrada."
         else:
-            mensaje = "No se pudo eliminar la habilidad. Intentá nuevamente más tarde."
+            eliminado = SkillsManager.Remove(skill_slug)
+            if eliminado:
+                mensaje = f"Habilidad eliminada: {skill_slug}."
+            else:
+                mensaje = "No se pudo eliminar la habilidad. Intentá nuevamente más tarde."
 
-    estado = _formatear_estado_habilidades(SkillsManager)
-    Database.disconnect()
+        estado = _formatear_estado_habilidades(SkillsManager)
     return f"{mensaje}\n\n{estado}"
 
 
 def _limpiar_habilidades_confirmado(user_id: int) -> str:
-    Database = WorkanaBotDatabase()
-    Database.connect()
-
-    if not Database.IsConnected:
-        Database.disconnect()
-        return "No es posible conectarse a la base de datos."
+    with WorkanaBotDatabase().connection() as Database:
+        if not Database.IsConnected:
+            return MENSAJE_SIN_DB
 
-    SkillsManager = UserSkills(user_id, Database)
-    habilidades_actuales = SkillsManager.GetAll()
+        SkillsManager = UserSkills(user_id, Database)
+        habilidades_actuales = SkillsManager.GetAll()
 
-    if not habilidades_actuales:
-        mensaje = "No tenés habilidades para limpiar."
-    else:
-        eliminado = SkillsManager.ClearAll()
-        if eliminado:
-            mensaje = f"Se limpiaron {len(habilidades_actuales)} habilidades."
+        if not habilidades_actuales:
+            mensaje = "No tenés habilidades para limpiar."
         else:
-            mensaje = "No se pudieron limpiar las habilidades. Intentá nuevamente más tarde."
+            eliminado = SkillsManager.ClearAll()
+            if eliminado:
+                mensaje = f"Se limpiaron {len(habilidades_actuales)} habilidades."
+            else:
+                mensaje = "No se pudieron limpiar las habilidades. Intentá nuevamente más tarde."
 
-    estado = _formatear_estado_habilidades(SkillsManager)
-    Database.disconnect()
+        estado = _formatear_estado_habilidades(SkillsManager)
     return f"{mensaje}\n\n{estado}"
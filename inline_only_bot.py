@@ -30,47 +30,44 @@ async def manejar_opciones(update: Update, context: ContextTypes.DEFAULT_TYPE):
     user_id = query.from_user.id
     username = query.from_user.username or "sin_usuario"
 
-    # Conexión a BD si se necesita
-    db = WorkanaBotDatabase()
-    db.connect()
+    # Conexión a BD si se necesita (se libera al salir del bloque)
+    with WorkanaBotDatabase().connection() as db:
 
-    if data == "start_script":
-        activar_script(entorno)
-        await query.edit_message_text("✅ Script Workana activado.")
+        if data == "start_script":
+            activar_script(entorno)
+            await query.edit_message_text("✅ Script Workana activado.")
 
-    elif data == "stop_script":
-        desactivar_script(entorno)
-        await query.edit_message_text("⏹️ Script detenido desde Telegram.")
+        elif data == "stop_script":
+            desactivar_script(entorno)
+            await query.edit_message_text("⏹️ Script detenido desde Telegram.")
 
-    elif data == "registrar_usuario":
-        if not db.IsConnected:
-            await query.edit_message_text("❌ No se pudo conectar a la base de datos.")
-            return
+        elif data == "registrar_usuario":
+            if not db.IsConnected:
+                await query.edit_message_text("❌ No se pudo conectar a la base de datos.")
+                return
 
-        bot_user = User(user_id, db)
+            bot_user = User(user_id, db)
 
-        if bot_user.IsRegistered:
-            await query.edit_message_text("⚠️ Ya estás registrado.")
-        else:
-            if bot_user.Register(username):
-                await query.edit_message_text("✅ Usuario registrado correctamente.")
+            if bot_user.IsRegistered:
+                await query.edit_message_text("⚠️ Ya estás registrado.")
             else:
-                await query.edit_message_text("❌ No fue posible registrar al usuario.")
-
-    elif data == "mostrar_ayuda":
-        await query.edit_message_text(
-            "*Opciones disponibles:*\n"
-            "- Iniciar script Workana\n"
-            "- Registrar usuario\n"
-            "- Detener script\n"
-            "- Ver ayuda\n",
-            parse_mode="Markdown"
-        )
-
-    else:
-        await query.edit_message_text("❓ Opción no reconocida.")
-
-    db.disconnect()
+                if bot_user.Register(username):
+                    await query.edit_message_text("✅ Usuario registrado correctamente.")
+                else:
+                    await query.edit_message_text("❌ No fue posible registrar al usuario.")
+
+        elif data == "mostrar_ayuda":
+            await query.edit_message_text(
+                "*Opciones disponibles:*\n"
+                "- Iniciar script Workana\n"
+                "- Registrar usuario\n"
+                "- Detener script\n"
+                "- Ver ayuda\n",
+                parse_mode="Markdown"
+            )
+
+        else:
+            await query.edit_message_text("❓ Opción no reconocida.")
 
 
 def main():
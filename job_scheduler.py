@@ -0,0 +1,120 @@
+# job_scheduler.py
+"""Scheduler asyncio para las tareas periódicas del monitor de Workana.
+
+Cada job tiene su propia tarea asyncio que duerme exactamente hasta el próximo
+vencimiento (sin sondeo) y ejecuta la función en un hilo con asyncio.to_thread,
+así un scrape lento no demora el envío de alertas. Un job nunca se superpone
+consigo mismo: la siguiente ejecución recién se agenda cuando termina la
+anterior, y si quedaron varios vencimientos atrás se corre una sola vez.
+Por job se guardan la duración y el retraso (lag) de la última ejecución.
+"""
+import asyncio
+from dataclasses import dataclass, field
+from typing import Callable, Dict, List, Optional
+
+
+@dataclass
+class JobStats:
+    runs: int = 0
+    failures: int = 0
+    skipped: int = 0
+    last_duration: Optional[float] = None
+    # Segundos entre el vencimiento y el inicio real de la última ejecución
+    last_lag: Optional[float] = None
+    last_error: Optional[str] = None
+
+
+@dataclass
+class ScheduledJob:
+    name: str
+    func: Callable[[], object]
+    interval_seconds: float
+    run_immediately: bool = True
+    running: bool = False
+    stats: JobStats = field(default_factory=JobStats)
+
+
+class JobScheduler:
+    def __init__(self):
+        self._jobs: Dict[str, ScheduledJob] = {}
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._stop_event: Optional[asyncio.Event] = None
+
+    @property
+    def Jobs(self) -> List[ScheduledJob]:
+        return list(self._jobs.values())
+
+    def add_job(
+        self,
+        name: str,
+        func: Callable[[], object],
+        interval_seconds: float,
+        run_immediately: bool = True,
+    ) -> ScheduledJob:
+        if interval_seconds <= 0:
+            raise ValueError(f"El intervalo del job '{name}' debe ser mayor a 0.")
+        if name in self._jobs:
+            raise ValueError(f"Ya existe un job llamado '{name}'.")
+        job = ScheduledJob(name, func, float(interval_seconds), run_immediately)
+        self._jobs[name] = job
+        return job
+
+    def stats(self) -> Dict[str, JobStats]:
+        return {name: job.stats for name, job in self._jobs.items()}
+
+    def stop(self) -> None:
+        """Pide detener el scheduler; se puede llamar desde cualquier hilo."""
+        if self._loop is None or self._stop_event is None:
+            return
+        self._loop.call_soon_threadsafe(self._stop_event.set)
+
+    async def run(self) -> None:
+        """Ejecuta todos los jobs hasta que se llame a stop()."""
+        self._loop = asyncio.get_running_loop()
+        self._stop_event = asyncio.Event()
+        tasks = [asyncio.create_task(self._run_job(job)) for job in self._jobs.values()]
+        try:
+            await asyncio.gather(*tasks)
+        finally:
+            for task in tasks:
+                task.cancel()
+            self._loop = None
+            self._stop_event = None
+
+    async def _wait_until(self, deadline: float) -> bool:
+        """Duerme hasta el vencimiento. Devuelve False si se pidió detener."""
+        delay = deadline - self._loop.time()
+        if delay <= 0:
+            return not self._stop_event.is_set()
+        try:
+            await asyncio.wait_for(self._stop_event.wait(), delay)
+        except asyncio.TimeoutError:
+            return True
+        return False
+
+    async def _run_job(self, job: ScheduledJob) -> None:
+        loop = self._loop
+        deadline = loop.time() + (0 if job.run_immediately else job.interval_seconds)
+        while await self._wait_until(deadline):
+            started = loop.time()
+            job.stats.last_lag = max(0.0, started - deadline)
+            job.running = True
+            try:
+                await asyncio.to_thread(job.func)
+                job.stats.last_error = None
+            except Exception as ex:
+                job.stats.failures += 1
+                job.stats.last_error = str(ex)
+                print(f"[SCHEDULE] Error en el job '{job.name}': {ex}")
+            finally:
+                job.running = False
+                job.stats.runs += 1
+                job.stats.last_duration = loop.time() - started
+
+            # Vencimientos fijos (sin deriva). Si una ejecución larga dejó varios
+            # vencimientos atrás se corre una sola vez más y el resto se saltea
+            deadline += job.interval_seconds
+            missed = int((loop.time() - deadline) // job.interval_seconds)
+            if missed > 0:
+                job.stats.skipped += missed
+                deadline += missed * job.interval_seconds
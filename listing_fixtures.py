@@ -0,0 +1,165 @@
+# listing_fixtures.py
+"""Grabación y reproducción de páginas del listado de Workana.
+
+Con scrape_record_fixtures activo (config_settings.json) el scraper guarda el
+HTML crudo de cada página descargada. Cada snapshot se guarda comprimido y con
+el SHA-256 del HTML como nombre (<sha256>.html.gz), así una página repetida no
+ocupa espacio extra. index.json mapea cada url a su último snapshot.
+
+Con scrape_fetch_mode = "replay" el scraper no usa red ni navegador:
+ReplayFetcher pasa los snapshots por el mismo parse_listing_html que el modo
+"http". Así el parser y el guardado se pueden medir y probar con entradas
+fijas.
+
+Benchmark del parser (y opcionalmente del guardado en la DB):
+    python listing_fixtures.py [--dir fixtures/listings] [--repeat 20] [--store]
+"""
+import argparse
+import gzip
+import hashlib
+import json
+import os
+import threading
+import time
+from datetime import datetime
+from typing import Dict, List, Optional
+
+from models import Project
+from workana_listing_parser import parse_listing_html
+
+DEFAULT_FIXTURES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures", "listings")
+INDEX_FILE = "index.json"
+SNAPSHOT_SUFFIX = ".html.gz"
+
+
+class ListingFixtureStore:
+    def __init__(self, directory: str = DEFAULT_FIXTURES_DIR):
+        self._directory = directory
+        self._lock = threading.Lock()
+        self._index: Optional[Dict[str, Dict[str, str]]] = None
+
+    @property
+    def Directory(self) -> str:
+        return self._directory
+
+    def _snapshot_path(self, digest: str) -> str:
+        return os.path.join(self._directory, digest + SNAPSHOT_SUFFIX)
+
+    def _load_index(self) -> Dict[str, Dict[str, str]]:
+        if self._index is None:
+            path = os.path.join(self._directory, INDEX_FILE)
+            try:
+                with open(path, "r", encoding="utf-8") as f:
+                    self._index = json.load(f)
+            except (OSError, ValueError):
+                self._index = {}
+        return self._index
+
+    def _write_index(self) -> None:
+        path = os.path.join(self._directory, INDEX_FILE)
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(self._index, f, indent=2, sort_keys=True)
+        os.replace(tmp_path, path)
+
+    def record(self, url: str, html: str) -> str:
+        """Guarda el HTML de la url y devuelve su digest (SHA-256)."""
+        data = html.encode("utf-8")
+        digest = hashlib.sha256(data).hexdigest()
+        with self._lock:
+            os.makedirs(self._directory, exist_ok=True)
+            path = self._snapshot_path(digest)
+            if not os.path.exists(path):
+                tmp_path = f"{path}.tmp"
+                # mtime=0: el mismo HTML produce siempre el mismo archivo
+                with open(tmp_path, "wb") as raw, gzip.GzipFile(fileobj=raw, mode="wb", mtime=0) as f:
+                    f.write(data)
+                os.replace(tmp_path, path)
+            index = self._load_index()
+            index[url] = {"sha256": digest, "recorded_at": datetime.now().isoformat(timespec="seconds")}
+            self._write_index()
+        return digest
+
+    def urls(self) -> List[str]:
+        with self._lock:
+            return sorted(self._load_index())
+
+    def read(self, digest: str) -> str:
+        with gzip.open(self._snapshot_path(digest), "rb") as f:
+            return f.read().decode("utf-8")
+
+    def load(self, url: str) -> Optional[str]:
+        """HTML grabado para la url (None si no hay snapshot)."""
+        with self._lock:
+            entry = self._load_index().get(url)
+        if entry is None:
+            return None
+        try:
+            return self.read(entry["sha256"])
+        except OSError as ex:
+            print(f"[FIXTURES] No se pudo leer el snapshot de {url}: {ex}")
+            return None
+
+
+class ReplayFetcher:
+    """Reemplaza la descarga del listado por los snapshots grabados."""
+
+    def __init__(self, store: ListingFixtureStore):
+        self._store = store
+
+    def __call__(self, url: str) -> List[Project]:
+        html = self._store.load(url)
+        if html is None:
+            print(f"[FIXTURES] Sin snapshot para {url}; se trata como página vacía.")
+            return []
+        return parse_listing_html(html, base_url=url) or []
+
+
+def _benchmark(store: ListingFixtureStore, repeat: int, save: bool) -> int:
+    urls = store.urls()
+    if not urls:
+        print(f"No hay snapshots en {store.Directory}.")
+        return 1
+
+    pages = {url: store.load(url) for url in urls}
+    pages = {url: html for url, html in pages.items() if html is not None}
+    total_bytes = sum(len(html.encode("utf-8")) for html in pages.values())
+
+    projects: List[Project] = []
+    started = time.perf_counter()
+    for _ in range(repeat):
+        projects = []
+        for url, html in pages.items():
+            projects.extend(parse_listing_html(html, base_url=url) or [])
+    elapsed = time.perf_counter() - started
+
+    per_page_ms = elapsed * 1000 / (repeat * len(pages))
+    print(
+        f"Parser: {len(pages)} páginas ({total_bytes / 1024:.0f} KiB), {len(projects)} proyectos, "
+        f"{per_page_ms:.2f} ms/página, {len(projects) * repeat / elapsed:.0f} proyectos/s"
+    )
+
+    if save:
+        from projects_db_manager import ProjectRepository
+
+        repo = ProjectRepository()
+        for attempt in ("primer guardado", "repetición"):
+            started = time.perf_counter()
+            saved = repo.SaveProjects(projects)
+            print(f"Guardado ({attempt}): {saved} escritos en {time.perf_counter() - started:.3f} s")
+    return 0
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Benchmark del parser con snapshots grabados del listado.")
+    parser.add_argument("--dir", default=DEFAULT_FIXTURES_DIR, help="Directorio de snapshots.")
+    parser.add_argument("--repeat", type=int, default=20, help="Veces que se parsea cada página.")
+    parser.add_argument(
+        "--store", action="store_true", help="También mide ProjectRepository.SaveProjects (usa la DB)."
+    )
+    args = parser.parse_args()
+    return _benchmark(ListingFixtureStore(args.dir), max(1, args.repeat), args.store)
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,80 @@
+# message_rendering.py
+"""Arma el texto de las alertas de proyectos para muchos destinatarios.
+
+Un mismo proyecto suele ir a decenas de usuarios y lo único que cambia entre
+ellos es la línea "Skills en común". MessageRenderer arma el cuerpo de cada
+proyecto una sola vez (cache por id de proyecto) y le agrega el sufijo de
+skills, también cacheado por combinación de skills. Con parse_mode="HTML" el
+título, la url y las skills se escapan.
+"""
+import html
+from typing import Dict, Iterable, Optional, Tuple
+
+from telegram_delivery import OutgoingMessage
+
+PARSE_MODE_HTML = "HTML"
+
+
+def render_project_body(title: str, url: str, escape: bool = False) -> str:
+    if escape:
+        title, url = html.escape(title), html.escape(url)
+    return f"Nuevo proyecto publicado - {title}\n{url}"
+
+
+def render_skills_suffix(matched_skills: Optional[Iterable[str]], escape: bool = False) -> str:
+    if not matched_skills:
+        return ""
+    text = ", ".join(sorted(set(matched_skills)))
+    if escape:
+        text = html.escape(text)
+    return "\nSkills en común: " + text
+
+
+class MessageRenderer:
+    def __init__(self, parse_mode: Optional[str] = None):
+        self._parse_mode = parse_mode
+        self._escape = parse_mode == PARSE_MODE_HTML
+        self._bodies: Dict[object, str] = {}
+        self._suffixes: Dict[Tuple[str, ...], str] = {}
+
+    @property
+    def ParseMode(self) -> Optional[str]:
+        return self._parse_mode
+
+    def body(self, project_id: Optional[int], title: str, url: str) -> str:
+        # Sin id (proyectos aún no guardados) se usa la url como clave
+        key = project_id if project_id is not None else ("url", url)
+        text = self._bodies.get(key)
+        if text is None:
+            text = render_project_body(title, url, self._escape)
+            self._bodies[key] = text
+        return text
+
+    def suffix(self, matched_skills: Optional[Iterable[str]]) -> str:
+        key = tuple(matched_skills or ())
+        text = self._suffixes.get(key)
+        if text is None:
+            text = render_skills_suffix(key, self._escape)
+            self._suffixes[key] = text
+        return text
+
+    def render(
+        self,
+        project_id: Optional[int],
+        title: str,
+        url: str,
+        matched_skills: Optional[Iterable[str]] = None,
+    ) -> str:
+        return self.body(project_id, title, url) + self.suffix(matched_skills)
+
+    def message(
+        self,
+        chat_id: int,
+        project_id: Optional[int],
+        title: str,
+        url: str,
+        matched_skills: Optional[Iterable[str]] = None,
+    ) -> OutgoingMessage:
+        return OutgoingMessage(
+            chat_id, self.render(project_id, title, url, matched_skills), self._parse_mode
+        )
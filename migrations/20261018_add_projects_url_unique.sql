@@ -0,0 +1,15 @@
+-- 20261018_add_projects_url_unique.sql
+-- Enforce one row per project url so scraped batches can be upserted with
+-- a multi-row INSERT ... ON DUPLICATE KEY UPDATE (ProjectRepository.SaveProjects).
+
+START TRANSACTION;
+
+-- Remove duplicated urls keeping the most recent row (skills cascade)
+DELETE p_old
+FROM projects p_old
+JOIN projects p_new ON p_old.url = p_new.url AND p_old.id < p_new.id;
+
+ALTER TABLE projects
+    ADD UNIQUE KEY uniq_projects_url (url);
+
+COMMIT;
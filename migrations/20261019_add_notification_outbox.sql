@@ -0,0 +1,27 @@
+-- 20261019_add_notification_outbox.sql
+-- Persistent outbox for Telegram alerts: matching enqueues one row per
+-- (user, project) and delivery workers claim batches with
+-- SELECT ... FOR UPDATE SKIP LOCKED (MariaDB >= 10.6; older servers fall back
+-- to plain FOR UPDATE, see notification_outbox.py).
+
+START TRANSACTION;
+
+CREATE TABLE IF NOT EXISTS notification_outbox (
+    id               BIGINT UNSIGNED NOT NULL AUTO_INCREMENT,
+    telegram_user_id BIGINT NOT NULL,
+    project_id       INT NOT NULL,
+    matched_skills   VARCHAR(1024) NULL,               -- Comma separated skill slugs
+    status           VARCHAR(16) NOT NULL DEFAULT 'pending', -- pending | sending | delivered | failed
+    attempts         INT NOT NULL DEFAULT 0,
+    last_error       VARCHAR(255) NULL,
+    claimed_at       DATETIME NULL,
+    delivered_at     DATETIME NULL,
+    created_at       TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    PRIMARY KEY (id),
+    UNIQUE KEY uniq_outbox_user_project (telegram_user_id, project_id),
+    KEY idx_outbox_status (status, id),
+    CONSTRAINT fk_outbox_project FOREIGN KEY (project_id)
+        REFERENCES projects(id) ON DELETE CASCADE
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci;
+
+COMMIT;
@@ -0,0 +1,17 @@
+-- 20261020_add_scan_watermarks.sql
+-- Durable id-based watermark for the user skill scan. Replaces the
+-- wall-clock timestamp kept in ultima_revision_skills.log: the scan pages
+-- through projects with id > last_id and advances the mark after each page
+-- is enqueued in notification_outbox. The first run bootstraps the mark from
+-- the legacy file when present (see 02_check_workana_jobs.py).
+
+START TRANSACTION;
+
+CREATE TABLE IF NOT EXISTS scan_watermarks (
+    name       VARCHAR(64) NOT NULL,                   -- e.g. 'user_skill_scan'
+    last_id    BIGINT UNSIGNED NOT NULL DEFAULT 0,     -- Last projects.id already processed
+    updated_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP,
+    PRIMARY KEY (name)
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci;
+
+COMMIT;
@@ -0,0 +1,15 @@
+-- 20261021_add_hot_query_indexes.sql
+-- Indexes for the hot queries of projects_db.py / projects_db_manager.py.
+-- Verify the plans afterwards with: python check_query_plans.py
+--
+-- Already covered by earlier migrations / schema:
+--   projects.url                -> uniq_projects_url (20261018_add_projects_url_unique.sql),
+--                                  replaced by uniq_projects_url_hash (20261023_add_projects_url_hash.sql)
+--   project_skills(project_id)  -> leading column of the (project_id, ...) unique key
+--   user_skills(user_id)        -> idx_user_id
+
+-- get_recent / get_max_project_id: newest projects by posted_at, ties by id
+CREATE INDEX IF NOT EXISTS idx_projects_posted_at_id ON projects (posted_at, id);
+
+-- Active users and their skills (ProjectRepository._get_user_skill_map, CountActive)
+CREATE INDEX IF NOT EXISTS idx_bot_users_active ON bot_users (active);
@@ -0,0 +1,9 @@
+-- 20261022_add_projects_fulltext.sql
+-- FULLTEXT index for proyectosDatabase.search_by_skills_ranked
+-- (MATCH(title, description) AGAINST (... IN BOOLEAN MODE)). Without it
+-- search_by_skills falls back to LIKE '%skill%', which scans the whole table.
+-- Words shorter than innodb_ft_min_token_size (default 3) are not indexed;
+-- searches for such skills keep using the LIKE fallback.
+
+ALTER TABLE projects
+    ADD FULLTEXT KEY ft_projects_title_description (title, description);
@@ -0,0 +1,49 @@
+-- 20261023_add_projects_url_hash.sql
+-- Deduplicate projects by canonical url (project_url.canonicalize_project_url):
+-- job links differ only in tracking params such as ?ref=projects_1 / ?ref=projects_2.
+-- projects.url_hash = first 8 bytes of SHA1(canonical url) becomes the UNIQUE key
+-- used by every existence check and upsert; the UNIQUE index on url is dropped.
+-- Requires MariaDB >= 10.1.4 (REGEXP_REPLACE, IF [NOT] EXISTS on columns/indexes).
+--
+-- No transaction: MariaDB commits implicitly on every ALTER TABLE. Instead the
+-- steps are ordered so projects always keeps a UNIQUE key (uniq_projects_url is
+-- dropped only after uniq_projects_url_hash exists) and every statement can be
+-- re-run. Recovery: if a statement fails, fix the cause and run the whole
+-- script again from the top.
+
+ALTER TABLE projects
+    ADD COLUMN IF NOT EXISTS url_hash BINARY(8) NULL AFTER url,
+    ADD COLUMN IF NOT EXISTS url_canonical VARCHAR(255) NULL AFTER url_hash;
+
+-- Canonical form: https://www.workana.com host (default port removed), no
+-- fragment, no trailing slash and, for /job/<slug> pages, no query string at
+-- all (projects only stores job links). Computed aside so url itself is only
+-- rewritten once the duplicates are gone and uniq_projects_url cannot clash.
+UPDATE projects
+SET url_canonical = REGEXP_REPLACE(url, '(?i)^https?://(www\\.)?workana\\.com(:443|:80)?/', 'https://www.workana.com/')
+WHERE url IS NOT NULL;
+
+UPDATE projects
+SET url_canonical = REGEXP_REPLACE(REGEXP_REPLACE(url_canonical, '[?#].*$', ''), '/+$', '')
+WHERE url_canonical LIKE 'https://www.workana.com/job/%';
+
+-- Same value as project_url.url_hash(); rows without url get a per-row key
+UPDATE projects
+SET url_hash = UNHEX(LEFT(SHA1(COALESCE(url_canonical, CONCAT('project-id:', id))), 16));
+
+-- Remove duplicated projects keeping the most recent row (skills and outbox cascade)
+DELETE p_old
+FROM projects p_old
+JOIN projects p_new ON p_old.url_hash = p_new.url_hash AND p_old.id < p_new.id;
+
+ALTER TABLE projects
+    MODIFY url_hash BINARY(8) NOT NULL,
+    ADD UNIQUE KEY IF NOT EXISTS uniq_projects_url_hash (url_hash);
+
+UPDATE projects
+SET url = url_canonical
+WHERE url_canonical IS NOT NULL AND url <> url_canonical;
+
+ALTER TABLE projects
+    DROP COLUMN IF EXISTS url_canonical,
+    DROP INDEX IF EXISTS uniq_projects_url;
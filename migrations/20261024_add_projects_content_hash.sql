@@ -0,0 +1,15 @@
+-- 20261024_add_projects_content_hash.sql
+-- Content fingerprint of each project (project_fingerprint.content_hash: first
+-- 8 bytes of SHA1 over title, description and skill slugs), computed at scrape
+-- time. ProjectRepository.SaveProjects only writes projects that are new or
+-- whose fingerprint changed.
+--
+-- Existing rows stay NULL (unknown): each one is rewritten once, the next time
+-- its card is scraped, and from then on skipped while unchanged.
+
+START TRANSACTION;
+
+ALTER TABLE projects
+    ADD COLUMN content_hash BINARY(8) NULL AFTER url_hash;
+
+COMMIT;
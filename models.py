@@ -2,6 +2,8 @@
 from dataclasses import dataclass, field
 from typing import List, Optional, TypedDict
 
+from project_fingerprint import content_hash
+
 
 class Skill(TypedDict, total=False):
     name: str
@@ -14,3 +16,8 @@ class Project:
     Description: Optional[str]
     Url: str
     Skills: List[Skill] = field(default_factory=list)
+
+    @property
+    def ContentHash(self) -> bytes:
+        """Huella de título, descripción y skills (ver project_fingerprint.py)."""
+        return content_hash(self.Title, self.Description, self.Skills)
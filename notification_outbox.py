@@ -0,0 +1,231 @@
+# notification_outbox.py
+"""
+NotificationOutbox: cola persistente de alertas de Telegram (entrega al menos una vez).
+
+ensure_schema : Crea la tabla notification_outbox si no existe.
+enqueue_many : Encola filas (telegram_user_id, project_id, skills) en bloque;
+               la clave única (telegram_user_id, project_id) evita duplicados.
+claim_batch : Reserva un lote de pendientes con SELECT ... FOR UPDATE SKIP LOCKED
+              y lo marca como 'sending'. Las filas 'sending' que superan el
+              timeout (worker caído) se vuelven a reclamar.
+mark_delivered / mark_failed : Cierran el ciclo de cada fila.
+deliver_pending : Un ciclo del worker: reclamar, enviar y marcar hasta vaciar la cola.
+"""
+import time
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from message_rendering import MessageRenderer
+from telegram_delivery import TelegramDeliveryEngine
+from workana_bot_database_model import WorkanaBotDatabase
+
+DEFAULT_BATCH_SIZE = 100
+DEFAULT_MAX_ATTEMPTS = 5
+DEFAULT_CLAIM_TIMEOUT_MINUTES = 10
+DEFAULT_POLL_SECONDS = 15
+
+
+class NotificationOutbox:
+    def __init__(
+        self,
+        db: Optional[WorkanaBotDatabase] = None,
+        max_attempts: int = DEFAULT_MAX_ATTEMPTS,
+        claim_timeout_minutes: int = DEFAULT_CLAIM_TIMEOUT_MINUTES,
+    ):
+        self._db = db if db is not None else WorkanaBotDatabase()
+        self._max_attempts = max_attempts
+        self._claim_timeout_minutes = claim_timeout_minutes
+        self._skip_locked: Optional[bool] = None
+        self.ensure_schema()
+
+    def ensure_schema(self) -> None:
+        sql = """
+        CREATE TABLE IF NOT EXISTS notification_outbox (
+            id               BIGINT UNSIGNED NOT NULL AUTO_INCREMENT,
+            telegram_user_id BIGINT NOT NULL,
+            project_id       INT NOT NULL,
+            matched_skills   VARCHAR(1024) NULL,
+            status           VARCHAR(16) NOT NULL DEFAULT 'pending',
+            attempts         INT NOT NULL DEFAULT 0,
+            last_error       VARCHAR(255) NULL,
+            claimed_at       DATETIME NULL,
+            delivered_at     DATETIME NULL,
+            created_at       TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
+            PRIMARY KEY (id),
+            UNIQUE KEY uniq_outbox_user_project (telegram_user_id, project_id),
+            KEY idx_outbox_status (status, id),
+            CONSTRAINT fk_outbox_project FOREIGN KEY (project_id)
+                REFERENCES projects(id) ON DELETE CASCADE
+        ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4;
+        """
+        self._db.execute_non_query(sql)
+
+    def _supports_skip_locked(self) -> bool:
+        """SKIP LOCKED existe desde MariaDB 10.6 (y MySQL 8)."""
+        if self._skip_locked is None:
+            version = str(self._db.execute_scalar("SELECT VERSION()") or "")
+            try:
+                major, minor = (int(part) for part in version.split("-")[0].split(".")[:2])
+            except ValueError:
+                major, minor = 0, 0
+            if "mariadb" in version.lower():
+                self._skip_locked = (major, minor) >= (10, 6)
+            else:
+                self._skip_locked = major >= 8
+        return self._skip_locked
+
+    @staticmethod
+    def _placeholders(values: Sequence[Any]) -> str:
+        return ",".join(["%s"] * len(values))
+
+    def enqueue_many(self, rows: Iterable[Tuple[int, int, Iterable[str]]]) -> bool:
+        """Encola (telegram_user_id, project_id, matched_skills); ignora duplicados."""
+        params = [
+            (int(user_id), int(project_id), ",".join(sorted(set(skills or []))))
+            for user_id, project_id, skills in rows
+        ]
+        if not params:
+            return True
+        sql = (
+            "INSERT IGNORE INTO notification_outbox (telegram_user_id, project_id, matched_skills) "
+            "VALUES (%s, %s, %s)"
+        )
+        return self._db.execute_many(sql, params)
+
+    def claim_batch(self, limit: int = DEFAULT_BATCH_SIZE) -> List[Dict[str, Any]]:
+        """Reserva hasta `limit` filas pendientes y las devuelve con título/url del proyecto."""
+        lock_clause = "FOR UPDATE SKIP LOCKED" if self._supports_skip_locked() else "FOR UPDATE"
+        with self._db.transaction() as tx:
+            rows = tx.execute_query(
+                f"""
+                SELECT id, telegram_user_id, project_id, matched_skills
+                FROM notification_outbox
+                WHERE status = 'pending'
+                   OR (status = 'sending' AND claimed_at < NOW() - INTERVAL %s MINUTE)
+                ORDER BY id
+                LIMIT %s
+                {lock_clause}
+                """,
+                (self._claim_timeout_minutes, limit),
+            )
+            if rows:
+                ids = [row[0] for row in rows]
+                tx.execute_non_query(
+                    "UPDATE notification_outbox "
+                    "SET status = 'sending', claimed_at = NOW(), attempts = attempts + 1 "
+                    f"WHERE id IN ({self._placeholders(ids)})",
+                    tuple(ids),
+                )
+        if not rows or not tx.IsCommitted:
+            return []
+
+        project_ids = sorted({row[2] for row in rows})
+        project_rows = self._db.execute_query(
+            f"SELECT id, title, url FROM projects WHERE id IN ({self._placeholders(project_ids)})",
+            tuple(project_ids),
+        )
+        projects = {pid: (title, url) for pid, title, url in project_rows}
+
+        claimed: List[Dict[str, Any]] = []
+        for outbox_id, user_id, project_id, matched_skills in rows:
+            title, url = projects.get(project_id, ("(Sin título)", ""))
+            claimed.append(
+                {
+                    "id": outbox_id,
+                    "telegram_user_id": user_id,
+                    "project_id": project_id,
+                    "title": title,
+                    "url": url,
+                    "matched_skills": [s for s in (matched_skills or "").split(",") if s],
+                }
+            )
+        return claimed
+
+    def mark_delivered(self, ids: Sequence[int]) -> bool:
+        if not ids:
+            return True
+        return self._db.execute_non_query(
+            "UPDATE notification_outbox SET status = 'delivered', delivered_at = NOW(), "
+            f"last_error = NULL WHERE id IN ({self._placeholders(ids)})",
+            tuple(ids),
+        )
+
+    def mark_failed(self, ids: Sequence[int], error: str = "") -> bool:
+        """Devuelve las filas a 'pending' o las descarta ('failed') al agotar intentos."""
+        if not ids:
+            return True
+        return self._db.execute_non_query(
+            "UPDATE notification_outbox "
+            "SET status = IF(attempts >= %s, 'failed', 'pending'), last_error = %s "
+            f"WHERE id IN ({self._placeholders(ids)})",
+            (self._max_attempts, error[:255], *ids),
+        )
+
+    def pending_count(self) -> int:
+        result = self._db.execute_scalar(
+            "SELECT COUNT(*) FROM notification_outbox WHERE status IN ('pending', 'sending')"
+        )
+        return int(result) if result is not None else 0
+
+
+def deliver_pending(
+    outbox: NotificationOutbox,
+    engine: TelegramDeliveryEngine,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    parse_mode: Optional[str] = None,
+) -> Tuple[int, int]:
+    """Reclama y envía lotes hasta vaciar la cola. Devuelve (enviados, fallidos)."""
+    # El cuerpo de cada proyecto se arma una vez para todos sus destinatarios
+    renderer = MessageRenderer(parse_mode)
+    delivered = failed = 0
+    while True:
+        batch = outbox.claim_batch(batch_size)
+        if not batch:
+            return delivered, failed
+
+        messages = [
+            renderer.message(
+                row["telegram_user_id"],
+                row["project_id"],
+                row["title"],
+                row["url"],
+                row["matched_skills"],
+            )
+            for row in batch
+        ]
+        try:
+            results = engine.send_batch(messages)
+        except Exception as ex:
+            print(f"[OUTBOX] Error enviando lote: {ex}")
+            outbox.mark_failed([row["id"] for row in batch], str(ex))
+            return delivered, failed + len(batch)
+
+        ok_ids = [row["id"] for row, ok in zip(batch, results) if ok]
+        ko_ids = [row["id"] for row, ok in zip(batch, results) if not ok]
+        outbox.mark_delivered(ok_ids)
+        outbox.mark_failed(ko_ids, "telegram send failed")
+        delivered += len(ok_ids)
+        failed += len(ko_ids)
+        if ko_ids:
+            # Los fallidos vuelven a 'pending'; se reintentan en el próximo ciclo
+            return delivered, failed
+
+
+def run_worker(poll_seconds: int = DEFAULT_POLL_SECONDS, batch_size: int = DEFAULT_BATCH_SIZE) -> None:
+    """Loop independiente de entrega: puede correr en otro proceso que el scheduler."""
+    outbox = NotificationOutbox()
+    engine = TelegramDeliveryEngine()
+    print(f"[OUTBOX] Worker iniciado (cada {poll_seconds}s, lotes de {batch_size}).")
+    try:
+        while True:
+            delivered, failed = deliver_pending(outbox, engine, batch_size)
+            if delivered or failed:
+                print(f"[OUTBOX] Enviados: {delivered} | Fallidos: {failed}")
+            time.sleep(poll_seconds)
+    except KeyboardInterrupt:
+        print("Worker de notificaciones detenido manualmente.")
+    finally:
+        engine.close()
+
+
+if __name__ == "__main__":
+    run_worker()
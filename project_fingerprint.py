@@ -0,0 +1,35 @@
+# project_fingerprint.py
+"""Huella del contenido de un proyecto para detectar cambios reales.
+
+content_hash resume título, descripción y slugs de skills en 8 bytes (SHA-1
+truncado, igual que url_hash). Se calcula al scrapear y se guarda en
+projects.content_hash: al volver a ver una tarjeta solo se escribe en la DB si
+la huella cambió.
+"""
+import hashlib
+from typing import Any, Iterable, Mapping, Optional
+
+CONTENT_HASH_BYTES = 8
+# Separador que no aparece en títulos ni descripciones
+_FIELD_SEPARATOR = "\x1f"
+
+
+def _skill_keys(skills: Optional[Iterable[Mapping[str, Any]]]) -> str:
+    keys = set()
+    for skill in skills or []:
+        key = (skill.get("slug") or skill.get("name") or "").strip().lower()
+        if key:
+            keys.add(key)
+    return ",".join(sorted(keys))
+
+
+def content_hash(
+    title: Optional[str],
+    description: Optional[str],
+    skills: Optional[Iterable[Mapping[str, Any]]] = None,
+) -> bytes:
+    """Primeros CONTENT_HASH_BYTES del SHA-1 de título, descripción y skills."""
+    payload = _FIELD_SEPARATOR.join(
+        [(title or "").strip(), (description or "").strip(), _skill_keys(skills)]
+    )
+    return hashlib.sha1(payload.encode("utf-8")).digest()[:CONTENT_HASH_BYTES]
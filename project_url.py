@@ -0,0 +1,62 @@
+# project_url.py
+"""Forma canónica de las urls de proyectos y su hash de deduplicación.
+
+Los enlaces del listado traen parámetros de seguimiento (?ref=projects_1,
+?ref=projects_2, utm_*...) que cambian entre páginas, así que el mismo
+proyecto podía guardarse (y notificarse) varias veces. canonicalize_project_url
+fija esquema y host, quita el fragmento, la barra final y los parámetros
+volátiles; en las páginas /job/<slug> el slug ya identifica al proyecto y se
+descarta toda la query.
+
+url_hash devuelve los primeros 8 bytes del SHA-1 de la url canónica: es la
+clave UNIQUE de projects (columna url_hash BINARY(8)) y coincide con
+UNHEX(LEFT(SHA1(url), 16)) en SQL.
+"""
+import hashlib
+from typing import Optional
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+URL_HASH_BYTES = 8
+WORKANA_HOST = "www.workana.com"
+JOB_PATH_PREFIX = "/job/"
+VOLATILE_QUERY_PARAMS = frozenset({"ref", "fbclid", "gclid", "mc_cid", "mc_eid"})
+VOLATILE_QUERY_PREFIXES = ("utm_",)
+
+
+def _is_volatile_param(name: str) -> bool:
+    name = name.lower()
+    return name in VOLATILE_QUERY_PARAMS or name.startswith(VOLATILE_QUERY_PREFIXES)
+
+
+def canonicalize_project_url(url: Optional[str]) -> str:
+    """Url canónica de un proyecto ("" si viene vacía)."""
+    url = (url or "").strip()
+    if not url:
+        return ""
+    parts = urlsplit(url)
+    scheme = parts.scheme.lower()
+    host = parts.netloc.lower()
+    # El puerto por defecto se quita antes de comparar el host: workana.com:443
+    # tiene que terminar en el mismo host canónico que workana.com
+    for default_port in (":443", ":80"):
+        if host.endswith(default_port):
+            host = host[:-len(default_port)]
+            break
+    if host in ("workana.com", WORKANA_HOST):
+        scheme, host = "https", WORKANA_HOST
+    elif scheme == "http":
+        scheme = "https"
+
+    path = parts.path.rstrip("/") or "/"
+    if path.startswith(JOB_PATH_PREFIX):
+        query = ""
+    else:
+        params = [(k, v) for k, v in parse_qsl(parts.query, keep_blank_values=True) if not _is_volatile_param(k)]
+        query = urlencode(sorted(params))
+    return urlunsplit((scheme, host, path, query, ""))
+
+
+def url_hash(url: Optional[str]) -> bytes:
+    """Primeros URL_HASH_BYTES del SHA-1 de la url canónica."""
+    canonical = canonicalize_project_url(url)
+    return hashlib.sha1(canonical.encode("utf-8")).digest()[:URL_HASH_BYTES]
@@ -10,27 +10,149 @@ ensure_default_user : Crea un usuario en bot_users para cumplir el FK de
                       projects.user_id si no existe.
 _to_dict_row : Convierte una fila (tuple) en un diccionario con claves
                id/user_id/posted_at/title/description/url.
-project_exists_by_url : Verifica si existe al menos un registro con la misma url.
+project_exists_by_url : Verifica si existe un registro con la misma url canónica
+                        (búsqueda por url_hash).
 insert_project : Inserta un proyecto (user_id, posted_at, title, description, url)
                  y devuelve su ID o None.
-upsert_by_url : Si existe un registro con esa url, lo actualiza; si no, inserta;
-                devuelve el ID afectado.
+upsert_by_url : Si existe un registro con esa url, lo actualiza (salvo que su
+                content_hash no haya cambiado); si no, inserta; devuelve el ID.
 update_by_id : Actualiza solo los campos provistos del proyecto indicado por ID.
 delete_by_id : Elimina físicamente el registro indicado por ID.
 get_recent : Obtiene los registros más recientes ordenados por posted_at (NULL al
              final) e ID.
 get_by_url : Devuelve el último registro que coincide con la url (o None si no hay).
 bulk_insert : Inserta múltiples proyectos omitiendo los que no tengan title o url.
+has_url_hash_column : Indica si existe projects.url_hash (todas las búsquedas y
+                      upserts la usan; sin ella falta aplicar la migración).
+has_unique_url_index : Indica si projects.url_hash tiene índice UNIQUE (requerido
+                       por upsert_many).
+upsert_many : Upsert por lotes con un INSERT ... ON DUPLICATE KEY UPDATE
+              multi-fila; devuelve {url: id} de todo el lote.
+get_ids_by_urls : Devuelve {url: id} para las urls indicadas en una sola consulta
+                  (por url_hash, así urls con distinto ?ref= resuelven al mismo id).
+has_fulltext_index : Indica si existe el índice FULLTEXT (title, description).
+search_by_skills_ranked : Búsqueda FULLTEXT con score de relevancia y paginación
+                          por clave (score, id).
+search_by_skills : Usa la búsqueda FULLTEXT si hay índice; si no, LIKE.
+get_projects_with_skills_after_id : Paginación por clave (id > after_id) de
+                                   proyectos con sus skills.
+get_url_hashes_after_id : Ternas (id, url_hash, content_hash) con id > after_id
+                          para sincronizar el índice de urls vistas (seen_urls.py).
+get_projects_identity : Servidor/esquema, id máximo y filas con id <= up_to_id,
+                        para validar el snapshot del índice de urls vistas.
+get_max_project_id / get_id_before_latest : Puntos de partida para la marca de
+                                            agua del escaneo de skills.
+replace_skills_for_projects : Sincroniza las skills de varios proyectos
+                              insertando/borrando solo las diferencias.
+Todas las urls se guardan en forma canónica (project_url.py) y se buscan por
+url_hash, la clave UNIQUE de 8 bytes.
 __main__ : Prueba rápida: conexión/lectura, upsert, actualización, listado y
            borrado del registro de prueba.
 """
 
 import os
+import re
 from typing import Any, Dict, List, Optional, Tuple
 from datetime import datetime
+from config.env import load_environment
+from project_url import canonicalize_project_url, url_hash
 from workana_bot_database_model import WorkanaBotDatabase
 from user_skills_model import DEFAULT_USER_ID
 
+# innodb_ft_min_token_size por defecto: palabras más cortas no se indexan
+FULLTEXT_MIN_TOKEN_SIZE = 3
+
+# Consultas frecuentes. check_query_plans.py revisa con EXPLAIN exactamente estas
+# cadenas; las que llevan {placeholders}/{keyset}/{conditions} se completan con
+# str.format antes de ejecutarse.
+EXISTS_BY_URL_HASH_QUERY = "SELECT 1 FROM projects WHERE url_hash = %s LIMIT 1"
+ID_BY_URL_HASH_QUERY = "SELECT id FROM projects WHERE url_hash = %s ORDER BY id DESC LIMIT 1"
+ID_AND_CONTENT_HASH_BY_URL_HASH_QUERY = (
+    "SELECT id, content_hash FROM projects WHERE url_hash = %s ORDER BY id DESC LIMIT 1"
+)
+GET_BY_URL_HASH_QUERY = """
+        SELECT id, user_id, posted_at, title, description, url
+        FROM projects
+        WHERE url_hash = %s
+        ORDER BY id DESC
+        LIMIT 1
+        """
+IDS_BY_URL_HASHES_QUERY = "SELECT url_hash, id FROM projects WHERE url_hash IN ({placeholders})"
+# ORDER BY (posted_at IS NULL) no puede usar idx_projects_posted_at_id y
+# ordena toda la tabla; cada rama lee a lo sumo `limit` filas del índice
+# y el orden final se aplica sobre ese puñado.
+RECENT_PROJECTS_QUERY = """
+        SELECT id, user_id, posted_at, title, description, url
+        FROM (
+            (SELECT id, user_id, posted_at, title, description, url
+             FROM projects
+             WHERE posted_at IS NOT NULL
+             ORDER BY posted_at DESC, id DESC
+             LIMIT %s)
+            UNION ALL
+            (SELECT id, user_id, posted_at, title, description, url
+             FROM projects
+             WHERE posted_at IS NULL
+             ORDER BY id DESC
+             LIMIT %s)
+        ) recent
+        ORDER BY (posted_at IS NULL), posted_at DESC, id DESC
+        LIMIT %s
+        """
+RANKED_SEARCH_QUERY = """
+        SELECT id, user_id, posted_at, title, description, url, score
+        FROM (
+            SELECT id, user_id, posted_at, title, description, url,
+                   MATCH(title, description) AGAINST (%s IN BOOLEAN MODE) AS score
+            FROM projects
+            WHERE MATCH(title, description) AGAINST (%s IN BOOLEAN MODE)
+        ) ranked
+        {keyset}
+        ORDER BY score DESC, id DESC
+        LIMIT %s
+        """
+LIKE_SEARCH_QUERY = """
+        SELECT id, user_id, posted_at, title, description, url
+        FROM projects
+        WHERE {conditions}
+        ORDER BY (posted_at IS NULL), posted_at DESC, id DESC
+        LIMIT %s
+        """
+LIKE_SEARCH_CONDITION = "LOWER(CONCAT_WS(' ', title, description)) LIKE %s"
+PROJECTS_AFTER_ID_QUERY = """
+        SELECT p.id, p.user_id, p.posted_at, p.title, p.description, p.url
+        FROM projects p
+        WHERE p.id > %s
+        ORDER BY p.id ASC
+        LIMIT %s
+        """
+URL_HASHES_AFTER_ID_QUERY = (
+    "SELECT id, url_hash, content_hash FROM projects WHERE id > %s ORDER BY id ASC LIMIT %s"
+)
+MAX_PROJECT_ID_QUERY = "SELECT COALESCE(MAX(id), 0) FROM projects"
+PROJECTS_IDENTITY_QUERY = """
+        SELECT CONCAT(@@hostname, '/', DATABASE()),
+               (SELECT COALESCE(MAX(id), 0) FROM projects),
+               (SELECT COUNT(*) FROM projects WHERE id <= %s)
+        """
+MAX_PROJECT_ID_BEFORE_QUERY = "SELECT COALESCE(MAX(id), 0) FROM projects WHERE posted_at < %s"
+ID_BEFORE_LATEST_QUERY = "SELECT id FROM projects ORDER BY id DESC LIMIT 1 OFFSET %s"
+SKILLS_FOR_PROJECTS_QUERY = """
+        SELECT project_id, skill_name, skill_slug, skill_href
+        FROM project_skills
+        WHERE project_id IN ({placeholders})
+        """
+STORED_SKILLS_FOR_PROJECTS_QUERY = """
+            SELECT id, project_id, skill_name, skill_slug, skill_href
+            FROM project_skills
+            WHERE project_id IN ({placeholders})
+            """
+
+
+def in_placeholders(count: int) -> str:
+    """"%s, %s, ..." para una lista IN de `count` elementos."""
+    return ",".join(["%s"] * count)
+
 
 class proyectosDatabase:
     """
@@ -41,9 +163,13 @@ class proyectosDatabase:
     def __init__(self, db: Optional[WorkanaBotDatabase] = None, default_user_id: Optional[int] = None):
         self._db = db if db is not None else WorkanaBotDatabase()
         # Respect explicit param, env var or fallback constant
+        load_environment()
         self._default_user_id = default_user_id or int(
             os.getenv("PROJECTS_DEFAULT_USER_ID", DEFAULT_USER_ID)
         )
+        self._url_hash_column: Optional[bool] = None
+        self._unique_url_index: Optional[bool] = None
+        self._fulltext_index: Optional[bool] = None
 
         self.ensure_schema()
         self.ensure_project_skills_schema()
@@ -65,6 +191,11 @@ class proyectosDatabase:
             title       VARCHAR(255) NULL,
             description TEXT NULL,
             url         VARCHAR(255) NULL,
+            url_hash    BINARY(8) NOT NULL,
+            content_hash BINARY(8) NULL,
+            UNIQUE KEY uniq_projects_url_hash (url_hash),
+            KEY idx_projects_posted_at_id (posted_at, id),
+            FULLTEXT KEY ft_projects_title_description (title, description),
             CONSTRAINT fk_projects_user FOREIGN KEY (user_id)
                 REFERENCES bot_users(id) ON DELETE CASCADE
         ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4;
@@ -107,6 +238,10 @@ class proyectosDatabase:
             (self._default_user_id, self._default_user_id, "default_user"),
         )
 
+    def transaction(self):
+        """Shortcut to the underlying WorkanaBotDatabase.transaction()."""
+        return self._db.transaction()
+
     # ---------------------------------
     # Helpers
     # ---------------------------------
@@ -125,8 +260,7 @@ class proyectosDatabase:
     # Queries
     # ---------------------------------
     def proyecto_exists_by_url(self, url: str) -> bool:
-        sql = "SELECT 1 FROM projects WHERE url = %s LIMIT 1"
-        return self._db.execute_scalar(sql, (url,)) is not None
+        return self._db.execute_scalar(EXISTS_BY_URL_HASH_QUERY, (url_hash(url),)) is not None
 
     def insertar_proyecto(
         self,
@@ -134,19 +268,122 @@ class proyectosDatabase:
         url: str,
         posted_at: Optional[datetime] = None,
         description: Optional[str] = None,
+        content_hash: Optional[bytes] = None,
     ) -> Optional[int]:
         if posted_at is None:
             posted_at = datetime.now()  # Hora actual
+        url = canonicalize_project_url(url)
+        key = url_hash(url)
         sql = (
-            "INSERT INTO projects (user_id, posted_at, title, description, url) "
-            "VALUES (%s, %s, %s, %s, %s)"
+            "INSERT INTO projects (user_id, posted_at, title, description, url, url_hash, content_hash) "
+            "VALUES (%s, %s, %s, %s, %s, %s, %s)"
         )
         ok = self._db.execute_non_query(
-            sql, (self._default_user_id, posted_at, title, description, url)
+            sql, (self._default_user_id, posted_at, title, description, url, key, content_hash)
         )
         if not ok:
             return None
-        return self._db.execute_scalar("SELECT id FROM projects WHERE url = %s ORDER BY id DESC LIMIT 1", (url,))
+        return self._db.execute_scalar(ID_BY_URL_HASH_QUERY, (key,))
+
+    def has_url_hash_column(self) -> bool:
+        """
+        True when projects.url_hash exists. Every lookup and upsert goes through
+        it, so without it migrations/20261023_add_projects_url_hash.sql has not
+        been applied yet. Cached per instance.
+        """
+        if self._url_hash_column is None:
+            sql = """
+            SELECT 1
+            FROM information_schema.columns
+            WHERE table_schema = DATABASE()
+              AND table_name = 'projects'
+              AND column_name = 'url_hash'
+            LIMIT 1
+            """
+            self._url_hash_column = self._db.execute_scalar(sql) is not None
+        return self._url_hash_column
+
+    def has_unique_url_index(self) -> bool:
+        """
+        True when projects.url_hash is backed by a single-column UNIQUE index
+        (see migrations/20261023_add_projects_url_hash.sql). Cached per instance.
+        """
+        if self._unique_url_index is None:
+            sql = """
+            SELECT 1
+            FROM information_schema.statistics s
+            WHERE s.table_schema = DATABASE()
+              AND s.table_name = 'projects'
+              AND s.non_unique = 0
+              AND s.column_name = 'url_hash'
+              AND s.seq_in_index = 1
+              AND NOT EXISTS (
+                  SELECT 1 FROM information_schema.statistics s2
+                  WHERE s2.table_schema = s.table_schema
+                    AND s2.table_name = s.table_name
+                    AND s2.index_name = s.index_name
+                    AND s2.seq_in_index > 1
+              )
+            LIMIT 1
+            """
+            self._unique_url_index = self._db.execute_scalar(sql) is not None
+        return self._unique_url_index
+
+    def get_ids_by_urls(self, urls: List[str]) -> Dict[str, int]:
+        """{url: id} keyed by the urls as given; matching is by canonical url hash."""
+        keys = {u: url_hash(u) for u in dict.fromkeys(u for u in urls if u)}
+        if not keys:
+            return {}
+        unique_keys = list(dict.fromkeys(keys.values()))
+        rows = self._db.execute_query(
+            IDS_BY_URL_HASHES_QUERY.format(placeholders=in_placeholders(len(unique_keys))),
+            tuple(unique_keys),
+        )
+        id_by_key = {bytes(key): pid for key, pid in rows}
+        return {u: id_by_key[key] for u, key in keys.items() if key in id_by_key}
+
+    def upsert_many(self, items: List[Dict[str, Any]]) -> Dict[str, int]:
+        """
+        Bulk upsert keyed by the canonical url hash. Requires the UNIQUE index on
+        projects.url_hash.
+        - One multi-row INSERT ... ON DUPLICATE KEY UPDATE sent with executemany.
+        - New rows get posted_at (now by default); existing rows keep theirs and
+          only refresh title/description/content_hash. Callers pass only rows that
+          are new or whose content_hash changed.
+        Returns {url: id} for the whole batch (one extra SELECT), or {} on error.
+        """
+        now = datetime.now()
+        rows: Dict[bytes, Tuple] = {}
+        urls: List[str] = []
+        for it in items:
+            title = it.get("title")
+            url = it.get("url")
+            if not title or not url:
+                continue
+            canonical = canonicalize_project_url(url)
+            key = url_hash(canonical)
+            urls.append(url)
+            rows[key] = (
+                self._default_user_id,
+                it.get("posted_at") or now,
+                title,
+                it.get("description"),
+                canonical,
+                key,
+                it.get("content_hash"),
+            )
+        if not rows:
+            return {}
+
+        sql = (
+            "INSERT INTO projects (user_id, posted_at, title, description, url, url_hash, content_hash) "
+            "VALUES (%s, %s, %s, %s, %s, %s, %s) "
+            "ON DUPLICATE KEY UPDATE title = VALUES(title), description = VALUES(description), "
+            "content_hash = VALUES(content_hash)"
+        )
+        if not self._db.execute_many(sql, list(rows.values())):
+            return {}
+        return self.get_ids_by_urls(urls)
 
     def upsert_by_url(
         self,
@@ -154,27 +391,32 @@ class proyectosDatabase:
         url: str,
         description: Optional[str] = None,
         posted_at: Optional[datetime] = None,
+        content_hash: Optional[bytes] = None,
     ) -> Optional[int]:
         """
         Upsert without UNIQUE constraint:
-        - If a row with same url exists -> UPDATE the most recent one.
+        - If a row with the same canonical url exists -> UPDATE the most recent one,
+          unless content_hash is given and matches the stored one (no-op).
         - Else -> INSERT.
         Returns affected row id or None.
         """
-        existing = self._db.execute_query(
-            "SELECT id FROM projects WHERE url = %s ORDER BY id DESC LIMIT 1", (url,)
-        )
+        existing = self._db.execute_query(ID_AND_CONTENT_HASH_BY_URL_HASH_QUERY, (url_hash(url),))
         if existing:
-            pid = existing[0][0]
+            pid, stored_hash = existing[0]
+            if content_hash is not None and stored_hash is not None and bytes(stored_hash) == content_hash:
+                return pid
             ok = self.update_by_id(
                 proyecto_id=pid,
                 title=title,
                 url=url,
                 description=description,
                 posted_at=posted_at,
+                content_hash=content_hash,
             )
             return pid if ok else None
-        return self.insertar_proyecto(title=title, url=url, description=description, posted_at=posted_at)
+        return self.insertar_proyecto(
+            title=title, url=url, description=description, posted_at=posted_at, content_hash=content_hash
+        )
 
     def update_by_id(
         self,
@@ -183,6 +425,7 @@ class proyectosDatabase:
         url: Optional[str] = None,
         description: Optional[str] = None,
         posted_at: Optional[datetime] = None,
+        content_hash: Optional[bytes] = None,
     ) -> bool:
         """
         Updates provided fields only.
@@ -196,7 +439,11 @@ class proyectosDatabase:
         if description is not None:
             sets.append("description = %s"); params.append(description)
         if url is not None:
+            url = canonicalize_project_url(url)
             sets.append("url = %s"); params.append(url)
+            sets.append("url_hash = %s"); params.append(url_hash(url))
+        if content_hash is not None:
+            sets.append("content_hash = %s"); params.append(content_hash)
 
         if not sets:
             return True  # nothing to update, consider success
@@ -212,91 +459,172 @@ class proyectosDatabase:
         return self._db.execute_non_query("DELETE FROM projects WHERE id = %s", (proyecto_id,))
 
     def get_recent(self, limit: int = 50) -> List[Dict[str, Any]]:
-        sql = """
-        SELECT id, user_id, posted_at, title, description, url
-        FROM projects
-        ORDER BY (posted_at IS NULL), posted_at DESC, id DESC
-        LIMIT %s
-        """
-        rows = self._db.execute_query(sql, (limit,))
+        rows = self._db.execute_query(RECENT_PROJECTS_QUERY, (limit, limit, limit))
         return [self._to_dict_row(r) for r in rows]
 
     def get_by_url(self, url: str) -> Optional[Dict[str, Any]]:
-        sql = """
-        SELECT id, user_id, posted_at, title, description, url
-        FROM projects
-        WHERE url = %s
-        ORDER BY id DESC
-        LIMIT 1
-        """
-        rows = self._db.execute_query(sql, (url,))
+        rows = self._db.execute_query(GET_BY_URL_HASH_QUERY, (url_hash(url),))
         return self._to_dict_row(rows[0]) if rows else None
 
+    def has_fulltext_index(self) -> bool:
+        """
+        True when projects has a FULLTEXT index over (title, description)
+        (see migrations/20261022_add_projects_fulltext.sql). Cached per instance.
+        """
+        if self._fulltext_index is None:
+            sql = """
+            SELECT 1
+            FROM information_schema.statistics
+            WHERE table_schema = DATABASE()
+              AND table_name = 'projects'
+              AND index_type = 'FULLTEXT'
+            GROUP BY index_name
+            HAVING SUM(column_name = 'title') = 1
+               AND SUM(column_name = 'description') = 1
+               AND COUNT(*) = 2
+            LIMIT 1
+            """
+            self._fulltext_index = self._db.execute_scalar(sql) is not None
+        return self._fulltext_index
+
+    @staticmethod
+    def _build_fulltext_query(skills: List[str]) -> Optional[str]:
+        """
+        Boolean-mode query matching any skill: single words as terms and
+        multi-word slugs ("microsoft-excel") as phrases. Returns None when a skill
+        has a word shorter than FULLTEXT_MIN_TOKEN_SIZE (the index cannot find it).
+        """
+        terms: List[str] = []
+        for skill in skills:
+            # El parser FULLTEXT corta en todo lo que no es letra/dígito/_
+            words = re.findall(r"\w+", skill.lower())
+            if not words:
+                continue
+            if any(len(word) < FULLTEXT_MIN_TOKEN_SIZE for word in words):
+                return None
+            term = words[0] if len(words) == 1 else '"' + " ".join(words) + '"'
+            if term not in terms:
+                terms.append(term)
+        return " ".join(terms) if terms else None
+
+    def search_by_skills_ranked(
+        self,
+        skills: List[str],
+        limit: int = 100,
+        after: Optional[Tuple[float, int]] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        FULLTEXT search ordered by relevance (score DESC, id DESC). Each row carries
+        its "score"; pass (score, id) of the last row as `after` to get the next
+        page (keyset pagination). Returns [] when no FULLTEXT query can be built.
+        """
+        query = self._build_fulltext_query(
+            [s for s in skills if isinstance(s, str) and s.strip()]
+        )
+        if query is None:
+            return []
+
+        params: List[Any] = [query, query]
+        keyset = ""
+        if after is not None:
+            keyset = "WHERE score < %s OR (score = %s AND id < %s)"
+            params.extend([after[0], after[0], after[1]])
+
+        params.append(limit)
+        rows = self._db.execute_query(RANKED_SEARCH_QUERY.format(keyset=keyset), tuple(params))
+        results: List[Dict[str, Any]] = []
+        for row in rows:
+            item = self._to_dict_row(row)
+            item["score"] = float(row[6])
+            results.append(item)
+        return results
+
     def search_by_skills(self, skills: List[str], limit: int = 100) -> List[Dict[str, Any]]:
         """
         Find projects whose title or description mention any of the provided skills.
-        Uses a simple LIKE-based match against both the slug (with hyphens) and a
-        space-separated variant (hyphens -> spaces) for broader coverage.
+        Uses the FULLTEXT index (ranked by relevance) when available; otherwise a
+        LIKE-based match against both the slug (with hyphens) and a space-separated
+        variant (hyphens -> spaces).
         """
         normalized = [s.strip().lower() for s in skills if isinstance(s, str) and s.strip()]
         if not normalized:
             return []
 
+        if self.has_fulltext_index() and self._build_fulltext_query(normalized) is not None:
+            return self.search_by_skills_ranked(normalized, limit=limit)
+        return self._search_by_skills_like(normalized, limit)
+
+    def _search_by_skills_like(self, normalized: List[str], limit: int) -> List[Dict[str, Any]]:
+        """Fallback sin FULLTEXT: recorre toda la tabla con LIKE '%skill%'."""
         clauses: List[str] = []
         params: List[Any] = []
         for skill in normalized:
             variants = {skill, skill.replace("-", " ")}
             for variant in variants:
-                clauses.append("LOWER(CONCAT_WS(' ', title, description)) LIKE %s")
+                clauses.append(LIKE_SEARCH_CONDITION)
                 params.append(f"%{variant}%")
 
-        sql = f"""
-        SELECT id, user_id, posted_at, title, description, url
-        FROM projects
-        WHERE {' OR '.join(clauses)}
-        ORDER BY (posted_at IS NULL), posted_at DESC, id DESC
-        LIMIT %s
-        """
         params.append(limit)
-        rows = self._db.execute_query(sql, tuple(params))
+        rows = self._db.execute_query(
+            LIKE_SEARCH_QUERY.format(conditions=" OR ".join(clauses)), tuple(params)
+        )
         return [self._to_dict_row(r) for r in rows]
 
-    def get_projects_with_skills_since(
-        self, since: Optional[datetime] = None, limit: int = 200
-    ) -> List[Dict[str, Any]]:
+    def get_projects_with_skills_after_id(self, after_id: int, limit: int = 200) -> List[Dict[str, Any]]:
         """
-        Retrieve projects (ordered by posted_at DESC) with their stored skills.
-        Only projects whose posted_at is on/after "since" are included when provided.
+        Retrieve projects with id > after_id (ascending) with their stored skills.
+        Keyset pagination: pass the last id of a page as after_id of the next one.
         """
-        params: List[Any] = []
-        where_clause = ""
-        if since is not None:
-            where_clause = "WHERE p.posted_at >= %s"
-            params.append(since)
-
-        sql_projects = f"""
-        SELECT p.id, p.user_id, p.posted_at, p.title, p.description, p.url
-        FROM projects p
-        {where_clause}
-        ORDER BY (p.posted_at IS NULL), p.posted_at DESC, p.id DESC
-        LIMIT %s
+        project_rows = self._db.execute_query(PROJECTS_AFTER_ID_QUERY, (int(after_id), limit))
+        return self._attach_skills(project_rows)
+
+    def get_url_hashes_after_id(
+        self, after_id: int, limit: int = 5000
+    ) -> List[Tuple[int, bytes, Optional[bytes]]]:
+        """(id, url_hash, content_hash) of projects with id > after_id, ascending (keyset pagination)."""
+        rows = self._db.execute_query(URL_HASHES_AFTER_ID_QUERY, (int(after_id), limit))
+        return [
+            (int(pid), bytes(key), bytes(fp) if fp is not None else None)
+            for pid, key, fp in rows
+            if key is not None
+        ]
+
+    def get_projects_identity(self, up_to_id: int) -> Optional[Tuple[str, int, int]]:
         """
-        params.append(limit)
-
-        project_rows = self._db.execute_query(sql_projects, tuple(params))
+        ("host/schema", MAX(id), rows with id <= up_to_id), or None if the query
+        failed. Tells whether a seen-url snapshot still describes this table.
+        """
+        rows = self._db.execute_query(PROJECTS_IDENTITY_QUERY, (int(up_to_id),))
+        if not rows:
+            return None
+        source, max_id, row_count = rows[0]
+        return str(source or ""), int(max_id or 0), int(row_count or 0)
+
+    def get_max_project_id(self, posted_before: Optional[datetime] = None) -> int:
+        """Highest project id (optionally among projects posted before a date); 0 if none."""
+        if posted_before is None:
+            result = self._db.execute_scalar(MAX_PROJECT_ID_QUERY)
+        else:
+            result = self._db.execute_scalar(MAX_PROJECT_ID_BEFORE_QUERY, (posted_before,))
+        return int(result or 0)
+
+    def get_id_before_latest(self, count: int) -> int:
+        """Id just below the newest `count` projects (0 if there are fewer)."""
+        result = self._db.execute_scalar(ID_BEFORE_LATEST_QUERY, (int(count),))
+        return int(result or 0)
+
+    def _attach_skills(self, project_rows: list) -> List[Dict[str, Any]]:
+        """Build project dicts for the given rows, loading all their skills in one query."""
         if not project_rows:
             return []
 
         project_ids = [row[0] for row in project_rows]
         skills_map: Dict[int, List[Dict[str, Any]]] = {pid: [] for pid in project_ids}
 
-        placeholders = ",".join(["%s"] * len(project_ids))
-        sql_skills = f"""
-        SELECT project_id, skill_name, skill_slug, skill_href
-        FROM project_skills
-        WHERE project_id IN ({placeholders})
-        """
-        skill_rows = self._db.execute_query(sql_skills, tuple(project_ids))
+        skill_rows = self._db.execute_query(
+            SKILLS_FOR_PROJECTS_QUERY.format(placeholders=in_placeholders(len(project_ids))),
+            tuple(project_ids),
+        )
         for pid, name, slug, href in skill_rows:
             if name:
                 skills_map.setdefault(pid, []).append(
@@ -339,27 +667,100 @@ class proyectosDatabase:
     # ---------------------------------
     # Skills
     # ---------------------------------
-    def replace_project_skills(self, project_id: int, skills: List[Dict[str, Any]]) -> None:
+    @staticmethod
+    def _skill_key(name: str, slug: Optional[str]) -> Tuple[str, Optional[str]]:
         """
-        Replace skills for a project with the provided list.
-        Each skill may contain name, slug and href keys.
+        Same columns as UNIQUE uniq_project_skill (skill_name, skill_slug),
+        compared case-insensitively like the table collation.
         """
-        # Remove existing skills for the project first
-        self._db.execute_non_query("DELETE FROM project_skills WHERE project_id = %s", (project_id,))
+        return name.lower(), slug.lower() if slug else None
 
+    @classmethod
+    def _skill_values_by_key(cls, skills: List[Dict[str, Any]]) -> Dict[Tuple, Tuple]:
+        """Map skill key -> (name, slug, href); an empty slug is stored as NULL."""
+        values: Dict[Tuple, Tuple] = {}
         for skill in skills:
             name = skill.get("name")
             if not name:
                 continue
-            slug = skill.get("slug")
-            href = skill.get("href")
-            self._db.execute_non_query(
+            slug = skill.get("slug") or None
+            values[cls._skill_key(name, slug)] = (name, slug, skill.get("href"))
+        return values
+
+    def replace_project_skills(self, project_id: int, skills: List[Dict[str, Any]]) -> None:
+        """
+        Replace skills for a project with the provided list.
+        Each skill may contain name, slug and href keys.
+        """
+        self.replace_skills_for_projects({project_id: skills})
+
+    def replace_skills_for_projects(
+        self, skills_by_project: Dict[int, List[Dict[str, Any]]]
+    ) -> Dict[str, int]:
+        """
+        Batched, diff-based skill writer for several projects at once:
+        - One SELECT loads the stored skills of every project in the batch.
+        - Only removed skills are deleted and only new ones inserted, each with a
+          single executemany; projects whose skills did not change are skipped.
+        Runs as a single transaction (joins the caller's one if already open).
+        Returns counters: inserted, deleted and unchanged (projects).
+        """
+        stats = {"inserted": 0, "deleted": 0, "unchanged": 0}
+        project_ids = list(skills_by_project)
+        if not project_ids:
+            return stats
+
+        rows = self._db.execute_query(
+            STORED_SKILLS_FOR_PROJECTS_QUERY.format(placeholders=in_placeholders(len(project_ids))),
+            tuple(project_ids),
+        )
+        stored: Dict[int, Dict[Tuple, Tuple[int, Tuple]]] = {}
+        # Rows that share a key (NULL next to '' slug, or a repeated NULL slug the
+        # UNIQUE key does not reject) are deleted
+        duplicated: Dict[int, List[Tuple]] = {}
+        for row_id, pid, name, slug, href in rows:
+            slug = slug or None
+            current = stored.setdefault(pid, {})
+            key = self._skill_key(name, slug)
+            if key in current:
+                duplicated.setdefault(pid, []).append((row_id,))
+                continue
+            current[key] = (row_id, (name, slug, href))
+
+        to_delete: List[Tuple] = []
+        to_insert: List[Tuple] = []
+        for pid, skills in skills_by_project.items():
+            wanted = self._skill_values_by_key(skills)
+            current = stored.get(pid, {})
+            to_delete.extend(duplicated.get(pid, ()))
+            if {key: values for key, (_, values) in current.items()} == wanted:
+                if pid not in duplicated:
+                    stats["unchanged"] += 1
+                continue
+            for key, (row_id, values) in current.items():
+                if wanted.get(key) != values:
+                    to_delete.append((row_id,))
+            for key, values in wanted.items():
+                previous = current.get(key)
+                if previous is None or previous[1] != values:
+                    to_insert.append((pid, *values))
+
+        if not to_delete and not to_insert:
+            return stats
+
+        with self._db.transaction():
+            # Deletes go first so changed skills do not clash with the UNIQUE key
+            self._db.execute_many("DELETE FROM project_skills WHERE id = %s", to_delete)
+            self._db.execute_many(
                 """
                 INSERT INTO project_skills (project_id, skill_name, skill_slug, skill_href)
                 VALUES (%s, %s, %s, %s)
                 """,
-                (project_id, name, slug, href),
+                to_insert,
             )
+        stats["deleted"] = len(to_delete)
+        stats["inserted"] = len(to_insert)
+        return stats
 
 
 # Main de prueba (con inserción, lectura, actualización, listado y borrado físico)
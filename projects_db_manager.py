@@ -1,19 +1,46 @@
 # projects_db_manager.py
+import os
 from typing import List, Optional
 from datetime import datetime
 from projects_db import proyectosDatabase
 from models import Project
-from send_telegram_message import mensaje as send_telegram_message
+from notification_outbox import NotificationOutbox, deliver_pending
+from scan_watermark import ScanWatermarkStore
+from seen_urls import SeenUrlIndex
+from skill_index import normalize_skill_value
+from skill_matrix_matcher import SkillMatrixMatcher
+from skill_text_matcher import SkillTextMatcher
+from telegram_delivery import TelegramDeliveryEngine
 from workana_bot_database_model import WorkanaBotDatabase
 
+SKILL_SCAN_WATERMARK = "user_skill_scan"
+# En la primera ejecución sin estado previo se revisan los últimos N proyectos
+SKILL_SCAN_INITIAL_BACKLOG = 200
+# Snapshot del índice de urls ya guardadas (seen_urls.py) y tamaño de página al
+# sincronizarlo con la DB
+SEEN_URLS_SNAPSHOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "seen_project_urls.bin")
+SEEN_URLS_PAGE_SIZE = 5000
+USER_SKILL_MAP_QUERY = (
+    "SELECT u.telegram_user_id, us.skill_slug "
+    "FROM user_skills us "
+    "JOIN bot_users u ON us.user_id = u.id "
+    "WHERE u.active = TRUE"
+)
+
 class ProjectRepository:
     def __init__(self):
-        self._db = proyectosDatabase()
+        # Ambos accesos comparten la misma instancia y el pool de conexiones
         self._bot_db = WorkanaBotDatabase()
+        self._db = proyectosDatabase(self._bot_db)
+        self._delivery = TelegramDeliveryEngine()
+        self._outbox = NotificationOutbox(self._bot_db)
+        self._watermarks = ScanWatermarkStore(self._bot_db)
+        self._text_matcher: Optional[SkillTextMatcher] = None
+        self._seen_urls: Optional[SeenUrlIndex] = None
 
     @staticmethod
     def _normalize_skill_value(value: str) -> str:
-        return "-".join(value.strip().lower().split()) if value else ""
+        return normalize_skill_value(value)
 
     def _collect_project_skill_slugs(self, skills) -> set[str]:
         normalized: set[str] = set()
@@ -29,13 +56,7 @@ class ProjectRepository:
         return normalized
 
     def _get_user_skill_map(self) -> dict[int, list[str]]:
-        query = (
-            "SELECT u.telegram_user_id, us.skill_slug "
-            "FROM user_skills us "
-            "JOIN bot_users u ON us.user_id = u.id "
-            "WHERE u.active = TRUE"
-        )
-        rows = self._bot_db.execute_query(query)
+        rows = self._bot_db.execute_query(USER_SKILL_MAP_QUERY)
         skills_by_user: dict[int, list[str]] = {}
         for telegram_user_id, skill_slug in rows:
             if telegram_user_id is None or skill_slug is None:
@@ -46,67 +67,262 @@ class ProjectRepository:
             skills_by_user.setdefault(int(telegram_user_id), []).append(normalized)
         return skills_by_user
 
-    def _match_users_by_skills(self, project_skills) -> dict[int, list[str]]:
-        project_skill_set = self._collect_project_skill_slugs(project_skills)
-        if not project_skill_set:
-            return {}
+    def _get_text_matcher(self, skills: set[str]) -> SkillTextMatcher:
+        """Reuse the Aho-Corasick automaton until the set of user skills changes."""
+        self._text_matcher = SkillTextMatcher.for_skills(skills, self._text_matcher)
+        return self._text_matcher
+
+    def _sync_seen_urls(self, seen: SeenUrlIndex) -> int:
+        """Add projects stored after the index was built (id > MaxId). Returns how many."""
+        added = 0
+        while True:
+            rows = self._db.get_url_hashes_after_id(seen.MaxId, SEEN_URLS_PAGE_SIZE)
+            for project_id, key, fingerprint in rows:
+                seen.add(key, fingerprint, project_id)
+            added += len(rows)
+            if len(rows) < SEEN_URLS_PAGE_SIZE:
+                return added
+
+    def _load_seen_urls_snapshot(self) -> SeenUrlIndex:
+        """
+        Snapshot if it still matches projects (same server/schema, MaxId not
+        above MAX(id), same row count up to MaxId); otherwise an empty index
+        that the sync rebuilds from the table.
+        """
+        snapshot = SeenUrlIndex.load(SEEN_URLS_SNAPSHOT)
+        identity = self._db.get_projects_identity(snapshot.MaxId if snapshot else 0)
+        source = identity[0] if identity else ""
+        if snapshot is not None:
+            if identity is not None and snapshot.matches_database(*identity):
+                return snapshot
+            print(
+                f"[SEEN] Snapshot descartado: no coincide con la DB "
+                f"(snapshot {snapshot.Source or '?'} id<={snapshot.MaxId} filas={snapshot.RowCount}, "
+                f"DB {identity or 'sin respuesta'}). Se reconstruye desde projects."
+            )
+        return SeenUrlIndex(source=source)
 
-        user_skills_map = self._get_user_skill_map()
-        matches: dict[int, list[str]] = {}
-        for user_id, skills in user_skills_map.items():
-            overlap = sorted(project_skill_set.intersection(skills))
-            if overlap:
-                matches[user_id] = overlap
-        return matches
+    def warm_seen_urls(self) -> SeenUrlIndex:
+        """Load the seen-url snapshot (if any) and catch up with the DB."""
+        if self._seen_urls is None:
+            self._seen_urls = self._load_seen_urls_snapshot()
+            added = self._sync_seen_urls(self._seen_urls)
+            if added:
+                self._seen_urls.save(SEEN_URLS_SNAPSHOT)
+            print(f"[SEEN] Índice de urls: {len(self._seen_urls)} proyectos ({added} leídos de la DB).")
+        return self._seen_urls
+
+    def known_urls(self, urls: List[str]) -> set[str]:
+        """Return the subset of urls already stored in projects (in-memory, no query)."""
+        seen = self.warm_seen_urls()
+        return {u for u in urls if u in seen}
 
     def SaveProjects(self, projects: List[Project]) -> int:
-        inserted = 0
+        """
+        Persist the scraped batch, writing only projects that are new or whose
+        content fingerprint (title, description, skills) changed.
+        Cards are classified with the in-memory seen-url index (one id-range
+        query catches up with rows stored by other processes), so a page without
+        changes costs a single query. Writes go in one transaction (retried
+        project by project if it rolls back).
+        Returns how many projects were inserted or updated.
+        """
+        if not projects:
+            return 0
+        if not self._db.has_url_hash_column():
+            print(
+                "[SAVE] projects.url_hash no existe: aplicar "
+                "migrations/20261023_add_projects_url_hash.sql antes de guardar."
+            )
+            return 0
+        seen = self.warm_seen_urls()
+        self._sync_seen_urls(seen)
+
+        to_write: List[Project] = []
+        fingerprints: dict[str, bytes] = {}
+        inserted = updated = skipped = 0
+        for p in projects:
+            fingerprint = p.ContentHash
+            if p.Url not in seen:
+                inserted += 1
+            elif seen.is_unchanged(p.Url, fingerprint):
+                skipped += 1
+                continue
+            else:
+                updated += 1
+            fingerprints[p.Url] = fingerprint
+            to_write.append(p)
+
+        saved = 0
+        if to_write:
+            # Sin UNIQUE (migración a medio aplicar) el upsert por fila sigue
+            # funcionando porque busca por url_hash
+            if self._db.has_unique_url_index():
+                saved = self._save_projects_bulk(to_write, fingerprints)
+            else:
+                saved = self._save_projects_per_row(to_write, fingerprints)
+            if saved:
+                seen.save(SEEN_URLS_SNAPSHOT)
+            else:
+                inserted = updated = 0
+        print(f"[SAVE] Nuevos: {inserted} | Actualizados: {updated} | Sin cambios: {skipped}")
+        return saved
+
+    def _save_projects_bulk(self, projects: List[Project], fingerprints: dict[str, bytes]) -> int:
+        """
+        One transaction (one commit per cycle). With the UNIQUE index on
+        projects.url_hash the batch costs a constant number of round trips
+        (bulk upsert + one id lookup).
+        """
+        return self._save_in_transaction(projects, fingerprints, self._write_projects_bulk)
+
+    def _write_projects_bulk(self, projects: List[Project], fingerprints: dict[str, bytes]) -> List[str]:
+        id_map = self._db.upsert_many(
+            [
+                {
+                    "title": p.Title,
+                    "url": p.Url,
+                    "description": p.Description,
+                    "content_hash": fingerprints[p.Url],
+                }
+                for p in projects
+            ]
+        )
+        # Todos los proyectos escritos cambiaron: también sus skills (aunque queden vacías)
+        skills_by_project = {id_map[p.Url]: p.Skills for p in projects if p.Url in id_map}
+        try:
+            self._db.replace_skills_for_projects(skills_by_project)
+        except Exception as ex:
+            print(f"Error guardando skills del lote: {ex}")
+        return [p.Url for p in projects if p.Url in id_map]
+
+    def _save_projects_per_row(self, projects: List[Project], fingerprints: dict[str, bytes]) -> int:
+        """Legacy path for schemas without the UNIQUE index on projects.url_hash."""
+        return self._save_in_transaction(projects, fingerprints, self._write_projects_per_row)
+
+    def _write_projects_per_row(self, projects: List[Project], fingerprints: dict[str, bytes]) -> List[str]:
+        saved_urls: List[str] = []
         for p in projects:
             was_existing = self._db.proyecto_exists_by_url(p.Url)
             ok_id = self._db.upsert_by_url(
                 title=p.Title,
                 url=p.Url,
                 description=p.Description,
-                posted_at=None if was_existing else datetime.now()
+                posted_at=None if was_existing else datetime.now(),
+                content_hash=fingerprints[p.Url],
             )
             if ok_id:
-                inserted += 1
-                if p.Skills:
-                    try:
-                        self._db.replace_project_skills(ok_id, p.Skills)
-                    except Exception as ex:
-                        print(f"Error guardando skills para proyecto {ok_id}: {ex}")
-        return inserted
-
-    def notify_users_for_projects(self, projects: List[dict]) -> None:
-        """Send Telegram alerts for provided projects based on skill overlaps."""
-        user_skill_map = self._get_user_skill_map()
-        if not user_skill_map:
-            print("[NOTIFY] No hay usuarios activos con skills configuradas.")
-            return
-
-        for project in projects:
-            pid = project.get("id")
-            skills = project.get("skills", [])
-            matches = self._match_users_by_skills(skills)
-            if not matches:
-                print(f"[NOTIFY] Proyecto {pid} sin usuarios con skills coincidentes.")
-                continue
-
-            title = project.get("title", "(Sin título)")
-            url = project.get("url", "")
-            for chat_id, matched_skills in matches.items():
+                saved_urls.append(p.Url)
+                if not p.Skills and not was_existing:
+                    continue
                 try:
-                    send_telegram_message(title, url, chat_id=chat_id, matched_skills=matched_skills)
+                    self._db.replace_project_skills(ok_id, p.Skills)
                 except Exception as ex:
-                    print(
-                        f"Error enviando mensaje a Telegram para usuario {chat_id} "
-                        f"en proyecto {pid}: {ex}"
-                    )
-
-    def get_projects_for_skill_scan(self, since: Optional[datetime], limit: int = 200) -> List[dict]:
-        """Retrieve projects and skills to evaluate against user profiles."""
-        return self._db.get_projects_with_skills_since(since=since, limit=limit)
+                    print(f"Error guardando skills para proyecto {ok_id}: {ex}")
+        return saved_urls
+
+    def _save_in_transaction(self, projects: List[Project], fingerprints: dict[str, bytes], write) -> int:
+        """
+        Run write(projects, fingerprints) -> saved urls in one transaction. If it
+        rolls back, retry each project in its own transaction so a single bad row
+        (the same cards come back every cycle) does not block the rest; the
+        failing projects are logged and skipped.
+        """
+        with self._db.transaction() as tx:
+            saved_urls = write(projects, fingerprints)
+        if not tx.IsCommitted:
+            if not tx.HasConnection:
+                print("[SAVE] Sin conexión a la DB; se descartó el lote.")
+                return 0
+            print("[SAVE] No se pudo confirmar el lote; se reintenta proyecto por proyecto.")
+            saved_urls = []
+            for p in projects:
+                with self._db.transaction() as row_tx:
+                    row_urls = write([p], fingerprints)
+                if row_tx.IsCommitted:
+                    saved_urls.extend(row_urls)
+                elif not row_tx.HasConnection:
+                    print("[SAVE] Sin conexión a la DB; se interrumpe el reintento.")
+                    break
+                else:
+                    print(f"[SAVE] Proyecto omitido por error al guardar: {p.Title!r} ({p.Url})")
+        # Sin id: MaxId solo avanza al sincronizar, así no se saltean filas que
+        # otro proceso haya insertado con ids intermedios
+        for url in saved_urls:
+            self._seen_urls.add_url(url, fingerprints[url])
+        return len(saved_urls)
+
+    def _collect_matches(self, projects: List[dict]) -> List[tuple]:
+        """
+        Return (chat_id, project, matched_skills) for every user/project overlap.
+        The whole batch is crossed against all users at once (row-by-row sparse
+        product in pure Python, see skill_matrix_matcher.py).
+        """
+        matrix = SkillMatrixMatcher(self._get_user_skill_map())
+        if not matrix:
+            print("[NOTIFY] No hay usuarios activos con skills configuradas.")
+            return []
+
+        # Skills nombradas en el texto cuentan igual que los tags de la tarjeta
+        text_matcher = self._get_text_matcher(matrix.skills())
+        project_skill_sets = [
+            self._collect_project_skill_slugs(project.get("skills", []))
+            | text_matcher.find_in_project(project.get("title"), project.get("description"))
+            for project in projects
+        ]
+
+        collected: List[tuple] = []
+        matched_projects: set[int] = set()
+        for project_index, chat_id, _, matched_skills in matrix.match_batch(project_skill_sets):
+            matched_projects.add(project_index)
+            collected.append((chat_id, projects[project_index], matched_skills))
+
+        for project_index, project in enumerate(projects):
+            if project_index not in matched_projects:
+                print(f"[NOTIFY] Proyecto {project.get('id')} sin usuarios con skills coincidentes.")
+        return collected
+
+    def enqueue_notifications_for_projects(self, projects: List[dict]) -> bool:
+        """
+        Match projects against user skills and enqueue the alerts in the outbox
+        (one bulk insert). Returns False when the rows could not be stored.
+        """
+        matches = self._collect_matches(projects)
+        if not matches:
+            return True
+        ok = self._outbox.enqueue_many(
+            (chat_id, project.get("id"), matched_skills) for chat_id, project, matched_skills in matches
+        )
+        if ok:
+            print(f"[NOTIFY] Encoladas {len(matches)} notificaciones.")
+        return ok
+
+    def deliver_pending_notifications(self, batch_size: int = 100) -> tuple:
+        """Run one outbox delivery pass. Returns (delivered, failed)."""
+        return deliver_pending(self._outbox, self._delivery, batch_size)
+
+    def get_projects_for_skill_scan(self, after_id: int, limit: int = 200) -> List[dict]:
+        """Retrieve the next page of projects (id > after_id) with skills to evaluate."""
+        return self._db.get_projects_with_skills_after_id(after_id=after_id, limit=limit)
+
+    def get_skill_scan_watermark(self, legacy_since: Optional[datetime] = None) -> int:
+        """
+        Last project id already scanned. On the first run the mark is bootstrapped
+        from the legacy timestamp (projects posted before it) or, without one,
+        from the newest SKILL_SCAN_INITIAL_BACKLOG projects, and stored.
+        """
+        last_id = self._watermarks.get(SKILL_SCAN_WATERMARK)
+        if last_id is not None:
+            return last_id
+        if legacy_since is not None:
+            last_id = self._db.get_max_project_id(posted_before=legacy_since)
+        else:
+            last_id = self._db.get_id_before_latest(SKILL_SCAN_INITIAL_BACKLOG)
+        self._watermarks.advance(SKILL_SCAN_WATERMARK, last_id)
+        return last_id
+
+    def advance_skill_scan_watermark(self, last_id: int) -> bool:
+        return self._watermarks.advance(SKILL_SCAN_WATERMARK, last_id)
     
 if __name__ == "__main__":
     repo = ProjectRepository()
@@ -2,11 +2,12 @@
 import os
 import requests
 
-import config.env
+from config.env import load_environment
 from telegram_admin_utils import get_admin_chat_id
 
 
 def leer_todos_los_mensajes():
+    load_environment()
     TELEGRAM_BOT_TOKEN = os.getenv("TELEGRAM_BOT_TOKEN") or os.getenv("TELEGRAM_TOKEN")
     if not TELEGRAM_BOT_TOKEN:
         print("Error: TELEGRAM_BOT_TOKEN/TELEGRAM_TOKEN no está configurado.")
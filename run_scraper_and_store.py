@@ -1,10 +1,14 @@
 # run_scrape_and_store.py
-from scrape_workana import ScrapeWorkanaProjects
+from typing import Optional
+
+from scrape_workana import ScrapeWorkanaPages, close_driver_pool
 from projects_db_manager import ProjectRepository
 
-def Run(url: str) -> int:
-    projects = ScrapeWorkanaProjects(url)          # solo extrae
-    repo = ProjectRepository()                     # solo guarda
+def Run(url: str, max_pages: int = 1, repo: Optional[ProjectRepository] = None) -> int:
+    repo = repo or ProjectRepository()             # solo guarda
+    projects = ScrapeWorkanaPages(                 # solo extrae (páginas 1..max_pages)
+        url, max_pages=max_pages, known_urls=repo.known_urls
+    )
     count = repo.SaveProjects(projects)            # persistencia
     return count
 
@@ -16,4 +20,6 @@ if __name__ == "__main__":
         print(f"✅ Inserted/Updated: {inserted_count}")
     except Exception as e:
         print(f"❌ Error ejecutando Run: {e}")
+    finally:
+        close_driver_pool()
 
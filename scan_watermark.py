@@ -0,0 +1,48 @@
+# scan_watermark.py
+"""
+ScanWatermarkStore: marcas de agua persistentes por proceso de escaneo.
+
+Cada marca guarda el último projects.id ya procesado. A diferencia de un
+timestamp en archivo, el id es monótono, no depende del reloj del host y se
+puede recorrer con paginación por clave (WHERE id > marca ORDER BY id).
+
+ensure_schema : Crea la tabla scan_watermarks si no existe.
+get : Devuelve la marca guardada o None si el escaneo nunca corrió.
+advance : Mueve la marca hacia adelante (nunca retrocede).
+"""
+from typing import Optional
+
+from workana_bot_database_model import WorkanaBotDatabase
+
+
+class ScanWatermarkStore:
+    def __init__(self, db: Optional[WorkanaBotDatabase] = None):
+        self._db = db if db is not None else WorkanaBotDatabase()
+        self.ensure_schema()
+
+    def ensure_schema(self) -> None:
+        sql = """
+        CREATE TABLE IF NOT EXISTS scan_watermarks (
+            name       VARCHAR(64) NOT NULL,
+            last_id    BIGINT UNSIGNED NOT NULL DEFAULT 0,
+            updated_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP,
+            PRIMARY KEY (name)
+        ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4;
+        """
+        self._db.execute_non_query(sql)
+
+    def get(self, name: str) -> Optional[int]:
+        rows = self._db.execute_query(
+            "SELECT last_id FROM scan_watermarks WHERE name = %s", (name,)
+        )
+        if not rows:
+            return None
+        return int(rows[0][0])
+
+    def advance(self, name: str, last_id: int) -> bool:
+        # GREATEST evita que un proceso atrasado haga retroceder la marca
+        sql = """
+        INSERT INTO scan_watermarks (name, last_id) VALUES (%s, %s)
+        ON DUPLICATE KEY UPDATE last_id = GREATEST(last_id, VALUES(last_id))
+        """
+        return self._db.execute_non_query(sql, (name, int(last_id)))
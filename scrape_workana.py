@@ -1,14 +1,66 @@
 # scrape_workana.py
-from typing import List
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from typing import Callable, Dict, Iterator, List, Optional, Set
+import requests
+from requests.adapters import HTTPAdapter
 from selenium import webdriver
+from selenium.common.exceptions import TimeoutException, WebDriverException
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.firefox.service import Service
 from selenium.webdriver.firefox.options import Options
+from config_settings import load_settings
+from listing_fixtures import ListingFixtureStore, ReplayFetcher
 from local_o_vps import entorno
-from urllib.parse import parse_qs, urlparse
+from urllib.parse import parse_qsl, urlencode, urlparse, urlunparse
 from models import Project, Skill
+from project_url import canonicalize_project_url
+from workana_listing_parser import (
+    CARD_SELECTOR,
+    build_skill,
+    parse_listing_html,
+    projects_from_card_payload,
+)
+
+DEFAULT_MAX_PAGES = 3
+DEFAULT_BROWSER_POOL_SIZE = 2
+DEFAULT_BROWSER_MAX_PAGE_LOADS = 20
+# Espera máxima por un navegador libre cuando todos están ocupados
+DEFAULT_BROWSER_ACQUIRE_TIMEOUT_SECONDS = 120.0
+# "selenium" (navegador, el comportamiento de siempre) | "http" (requests +
+# BeautifulSoup con fallback a Selenium; hay que activarlo en config_settings.json)
+# | "replay" (snapshots grabados)
+DEFAULT_FETCH_MODE = "selenium"
+HTTP_TIMEOUT_SECONDS = 20
+# Extrae todas las tarjetas en una sola llamada a execute_script (un único RPC)
+EXTRACT_CARDS_SCRIPT = """
+return Array.from(document.querySelectorAll(arguments[0])).map(function (card) {
+    function text(selector) {
+        var node = card.querySelector(selector);
+        return node ? node.innerText : "";
+    }
+    var link = card.querySelector("a[href^='/job/']");
+    return {
+        title: text(".project-title"),
+        desc: text(".html-desc.project-details"),
+        href: link ? link.href : "",
+        skills: Array.from(card.querySelectorAll("div.skills a.skill")).map(function (node) {
+            var name = node.querySelector("h3");
+            return {name: name ? name.innerText : "", href: node.href || ""};
+        })
+    };
+});
+"""
+HTTP_HEADERS = {
+    "User-Agent": (
+        "Mozilla/5.0 (X11; Linux x86_64; rv:128.0) Gecko/20100101 Firefox/128.0"
+    ),
+    "Accept-Language": "es-ES,es;q=0.9,en;q=0.8",
+}
 
 def CreateFirefoxDriver() -> webdriver.Firefox:
     options = Options()
@@ -19,45 +71,322 @@ def CreateFirefoxDriver() -> webdriver.Firefox:
     service = Service(executable_path=geckodriver_path)
     return webdriver.Firefox(service=service, options=options)
 
-def ScrapeWorkanaProjects(url: str) -> List[Project]:
-    driver = CreateFirefoxDriver()
+class WebDriverPool:
+    """Pool de navegadores Firefox headless que se mantienen abiertos entre ciclos.
+
+    Cada navegador se recicla (quit + uno nuevo) tras `max_page_loads` páginas
+    para acotar el crecimiento de memoria. Si están todos ocupados, acquire
+    espera hasta `acquire_timeout` segundos a que se libere o descarte uno.
+    """
+
+    def __init__(
+        self,
+        size: int = DEFAULT_BROWSER_POOL_SIZE,
+        max_page_loads: int = DEFAULT_BROWSER_MAX_PAGE_LOADS,
+        acquire_timeout: float = DEFAULT_BROWSER_ACQUIRE_TIMEOUT_SECONDS,
+    ):
+        self._size = max(1, size)
+        self._max_page_loads = max(1, max_page_loads)
+        self._acquire_timeout = acquire_timeout
+        self._idle: List[webdriver.Firefox] = []  # LIFO: el más reciente sigue caliente
+        self._page_loads: Dict[int, int] = {}
+        self._created = 0
+        self._condition = threading.Condition()
+
+    @property
+    def Size(self) -> int:
+        return self._size
+
+    def acquire(self) -> webdriver.Firefox:
+        deadline = time.monotonic() + self._acquire_timeout
+        with self._condition:
+            while True:
+                if self._idle:
+                    return self._idle.pop()
+                if self._created < self._size:
+                    self._created += 1
+                    break
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    raise TimeoutError("No hay navegadores libres en el pool.")
+                self._condition.wait(remaining)
+        try:
+            driver = CreateFirefoxDriver()
+        except Exception:
+            with self._condition:
+                self._created -= 1
+                self._condition.notify()
+            raise
+        with self._condition:
+            self._page_loads[id(driver)] = 0
+        return driver
+
+    def release(self, driver: webdriver.Firefox, *, discard: bool = False) -> None:
+        with self._condition:
+            loads = self._page_loads.get(id(driver), 0) + 1
+            if not discard and loads < self._max_page_loads:
+                self._page_loads[id(driver)] = loads
+                self._idle.append(driver)
+                self._condition.notify()
+                return
+        self._quit(driver)
+
+    def _quit(self, driver: webdriver.Firefox) -> None:
+        with self._condition:
+            self._page_loads.pop(id(driver), None)
+            self._created -= 1
+            # Un hilo en espera puede crear el reemplazo
+            self._condition.notify()
+        try:
+            driver.quit()
+        except Exception:
+            pass
+
+    @contextmanager
+    def driver(self) -> Iterator[webdriver.Firefox]:
+        """Presta un navegador para cargar una página."""
+        driver = self.acquire()
+        broken = False
+        try:
+            yield driver
+        except TimeoutException:
+            # Página sin tarjetas o lenta: el navegador sigue sano y vuelve al pool
+            raise
+        except WebDriverException:
+            broken = True
+            raise
+        finally:
+            self.release(driver, discard=broken)
+
+    def close(self) -> None:
+        with self._condition:
+            idle, self._idle = self._idle, []
+        for driver in idle:
+            self._quit(driver)
+
+
+_driver_pool: Optional[WebDriverPool] = None
+_driver_pool_lock = threading.Lock()
+
+
+def get_driver_pool() -> WebDriverPool:
+    """Pool compartido por proceso; tamaño y reciclaje salen de config_settings.json."""
+    global _driver_pool
+    with _driver_pool_lock:
+        if _driver_pool is None:
+            settings = load_settings()
+            _driver_pool = WebDriverPool(
+                size=settings.get("scrape_browser_pool_size", DEFAULT_BROWSER_POOL_SIZE),
+                max_page_loads=settings.get(
+                    "scrape_browser_max_page_loads", DEFAULT_BROWSER_MAX_PAGE_LOADS
+                ),
+            )
+        return _driver_pool
+
+
+def close_driver_pool() -> None:
+    global _driver_pool
+    with _driver_pool_lock:
+        pool, _driver_pool = _driver_pool, None
+    if pool is not None:
+        pool.close()
+
+
+_http_session: Optional[requests.Session] = None
+_http_session_lock = threading.Lock()
+
+
+def get_http_session() -> requests.Session:
+    """Sesión HTTP compartida (keep-alive) para descargar el listado sin navegador."""
+    global _http_session
+    with _http_session_lock:
+        if _http_session is None:
+            size = load_settings().get("scrape_browser_pool_size", DEFAULT_BROWSER_POOL_SIZE)
+            session = requests.Session()
+            adapter = HTTPAdapter(pool_connections=1, pool_maxsize=max(1, size), max_retries=2)
+            session.mount("https://", adapter)
+            session.mount("http://", adapter)
+            session.headers.update(HTTP_HEADERS)
+            _http_session = session
+        return _http_session
+
+
+_fixture_stores: Dict[str, ListingFixtureStore] = {}
+_fixture_stores_lock = threading.Lock()
+
+
+def get_fixture_store(directory: Optional[str] = None) -> ListingFixtureStore:
+    """Store de snapshots del listado (uno por directorio, compartido entre hilos)."""
+    directory = directory or load_settings()["scrape_fixtures_dir"]
+    with _fixture_stores_lock:
+        store = _fixture_stores.get(directory)
+        if store is None:
+            store = _fixture_stores[directory] = ListingFixtureStore(directory)
+        return store
+
+
+def _recording_fixtures() -> bool:
+    return bool(load_settings().get("scrape_record_fixtures"))
+
+
+def _record_fixture(url: str, html: str) -> None:
+    try:
+        get_fixture_store().record(url, html)
+    except OSError as ex:
+        print(f"[SCRAPER] No se pudo grabar el snapshot de {url}: {ex}")
+
+
+def ScrapeWorkanaProjectsHttp(url: str) -> Optional[List[Project]]:
+    """
+    Descarga el listado por HTTP y lo parsea con BeautifulSoup.
+    Devuelve None si la respuesta no trae tarjetas de proyecto.
+    """
+    response = get_http_session().get(url, timeout=HTTP_TIMEOUT_SECONDS)
+    response.raise_for_status()
+    if _recording_fixtures():
+        _record_fixture(url, response.text)
+    return parse_listing_html(response.text, base_url=url)
+
+
+def build_page_url(url: str, page: int) -> str:
+    """Devuelve la url del listado con el parámetro page indicado."""
+    parsed = urlparse(url)
+    params = [(k, v) for k, v in parse_qsl(parsed.query, keep_blank_values=True) if k != "page"]
+    if page > 1:
+        params.append(("page", str(page)))
+    return urlunparse(parsed._replace(query=urlencode(params)))
+
+
+def _scrape_with_driver(driver: webdriver.Firefox, url: str) -> List[Project]:
     wait = WebDriverWait(driver, 40)
-    results: List[Project] = []
+
+    driver.get(url)
+    items = wait.until(EC.presence_of_all_elements_located((By.CSS_SELECTOR, CARD_SELECTOR)))
+    if _recording_fixtures():
+        # page_source es un RPC extra: solo al grabar
+        _record_fixture(url, driver.page_source)
 
     try:
-        driver.get(url)
-        items = wait.until(EC.presence_of_all_elements_located((By.CSS_SELECTOR, ".project-item.js-project")))
-
-        for it in items:
-            try:
-                title = it.find_element(By.CSS_SELECTOR, ".project-title").text
-                print(f"Scraping project: {title}")
-                if not title:   # Skip if title is empty
-                    continue
-                desc = it.find_element(By.CSS_SELECTOR, ".html-desc.project-details").text
-                link = it.find_element(By.CSS_SELECTOR, "a[href^='/job/']").get_attribute("href")
-                if not link:
-                    # Some cards may not include a valid URL; skip them to avoid None values
-                    continue
+        cards = driver.execute_script(EXTRACT_CARDS_SCRIPT, CARD_SELECTOR)
+    except WebDriverException as ex:
+        print(f"[SCRAPER] Falló la extracción en página ({ex}); se usa la lectura por elemento.")
+        return _extract_cards_per_element(items)
 
-                skill_nodes = it.find_elements(By.CSS_SELECTOR, "div.skills a.skill")
-                skills: List[Skill] = []
-                for node in skill_nodes:
-                    try:
-                        href = node.get_attribute("href") or ""
-                        name = node.find_element(By.TAG_NAME, "h3").text.strip()
-                        parsed = urlparse(href)
-                        slug = parse_qs(parsed.query).get("skills", [""])[0]
-                        skills.append(Skill(name=name, slug=slug, href=href))
-                    except Exception:
-                        continue
-
-                results.append(Project(Title=title, Description=desc, Url=link, Skills=skills))
-            except Exception:
-                # omite item defectuoso y sigue
+    results = projects_from_card_payload(cards, base_url=url)
+    print(f"Scraping {len(results)} proyectos de {url}")
+    return results
+
+
+def _extract_cards_per_element(items) -> List[Project]:
+    """Lectura campo por campo (varios RPC por tarjeta); solo como respaldo."""
+    results: List[Project] = []
+    for it in items:
+        try:
+            title = it.find_element(By.CSS_SELECTOR, ".project-title").text
+            print(f"Scraping project: {title}")
+            if not title:   # Skip if title is empty
                 continue
-    finally:
-        driver.quit()
+            desc = it.find_element(By.CSS_SELECTOR, ".html-desc.project-details").text
+            link = it.find_element(By.CSS_SELECTOR, "a[href^='/job/']").get_attribute("href")
+            if not link:
+                # Some cards may not include a valid URL; skip them to avoid None values
+                continue
+
+            skill_nodes = it.find_elements(By.CSS_SELECTOR, "div.skills a.skill")
+            skills: List[Skill] = []
+            for node in skill_nodes:
+                try:
+                    href = node.get_attribute("href") or ""
+                    name = node.find_element(By.TAG_NAME, "h3").text.strip()
+                    skills.append(build_skill(name, href))
+                except Exception:
+                    continue
+
+            results.append(Project(
+                    Title=title,
+                    Description=desc,
+                    Url=canonicalize_project_url(link),
+                    Skills=skills,
+                ))
+        except Exception:
+            # omite item defectuoso y sigue
+            continue
+
+    return results
+
+
+def ScrapeWorkanaProjects(url: str, fetch_mode: Optional[str] = None) -> List[Project]:
+    """
+    Scrapea una página del listado. En modo "http" intenta primero sin navegador
+    y usa Selenium solo si el HTML no trae las tarjetas. En modo "replay" lee los
+    snapshots grabados (sin red ni navegador).
+    """
+    mode = fetch_mode or load_settings().get("scrape_fetch_mode", DEFAULT_FETCH_MODE)
+    if mode == "replay":
+        return ReplayFetcher(get_fixture_store())(url)
+    if mode == "http":
+        try:
+            projects = ScrapeWorkanaProjectsHttp(url)
+        except requests.RequestException as ex:
+            print(f"[SCRAPER] Error HTTP en {url}: {ex}; se usa Selenium.")
+            projects = None
+        if projects is not None:
+            return projects
+        print(f"[SCRAPER] El HTML de {url} no trae tarjetas; se usa Selenium.")
+
+    with get_driver_pool().driver() as driver:
+        return _scrape_with_driver(driver, url)
+
+
+def _scrape_page(page_url: str) -> List[Project]:
+    """Scrapea una página del listado; una página sin tarjetas devuelve []."""
+    try:
+        return ScrapeWorkanaProjects(page_url)
+    except TimeoutException:
+        print(f"[SCRAPER] Sin proyectos en {page_url}")
+        return []
+    except Exception as ex:
+        print(f"[SCRAPER] Error scrapeando {page_url}: {ex}")
+        return []
+
+
+def ScrapeWorkanaPages(
+    url: str,
+    max_pages: int = DEFAULT_MAX_PAGES,
+    known_urls: Optional[Callable[[List[str]], Set[str]]] = None,
+) -> List[Project]:
+    """
+    Scrapea las páginas 1..max_pages en paralelo (tantas a la vez como navegadores
+    tenga el pool). Deja de paginar cuando una página está vacía o cuando
+    `known_urls` indica que todas sus urls ya estaban guardadas.
+    """
+    pool = get_driver_pool()
+    results: List[Project] = []
+    seen: Set[str] = set()
+    page = 1
+
+    with ThreadPoolExecutor(max_workers=pool.Size) as executor:
+        while page <= max_pages:
+            wave = list(range(page, min(page + pool.Size, max_pages + 1)))
+            pages = list(executor.map(_scrape_page, [build_page_url(url, n) for n in wave]))
+            page += len(wave)
+
+            stop = False
+            for number, projects in zip(wave, pages):
+                new_projects = [p for p in projects if p.Url not in seen]
+                results.extend(new_projects)
+                seen.update(p.Url for p in new_projects)
+                if not projects:
+                    stop = True
+                elif known_urls is not None:
+                    urls = [p.Url for p in projects]
+                    if set(urls) <= known_urls(urls):
+                        print(f"[SCRAPER] Página {number} sin proyectos nuevos; se detiene la paginación.")
+                        stop = True
+                if stop:
+                    break
+            if stop:
+                break
 
     return results
 
@@ -69,4 +398,6 @@ if __name__ == "__main__":
         for p in projects[:5]:
             print(f"- {p.Title} | {p.Url}")
     except Exception as e:
-        print(f"❌ Error durante la prueba: {e}")
\ No newline at end of file
+        print(f"❌ Error durante la prueba: {e}")
+    finally:
+        close_driver_pool()
\ No newline at end of file
@@ -0,0 +1,153 @@
+# seen_urls.py
+"""Índice en memoria de los proyectos ya guardados (hash de url canónica).
+
+Cada ciclo vuelve a scrapear páginas donde casi todas las tarjetas ya están en
+la DB. SeenUrlIndex mapea el url_hash (8 bytes, ver project_url.py) de cada
+proyecto guardado a su content_hash (ver project_fingerprint.py): es un índice
+exacto, sin falsos positivos como un filtro de Bloom, y con 100k proyectos ocupa
+unos pocos MB. Solo llegan a la DB las tarjetas nuevas o cuyo contenido cambió.
+
+Para arrancar rápido el índice se guarda en un snapshot comprimido con zlib
+(cabecera + identidad de la DB + pares url_hash/content_hash ordenados); al
+iniciar se carga el snapshot y se piden a la DB solo los proyectos con id mayor
+al del snapshot. La identidad (servidor/esquema, id máximo y cantidad de filas
+hasta ese id) permite descartar un snapshot que ya no corresponde a la DB:
+otro entorno, una DB restaurada o filas borradas.
+"""
+import os
+import struct
+import zlib
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from project_fingerprint import CONTENT_HASH_BYTES
+from project_url import URL_HASH_BYTES, url_hash
+
+SNAPSHOT_MAGIC = b"SEENURL3"
+# magic, id máximo, filas con id <= id máximo, largo del origen
+_HEADER = struct.Struct(">8sQQH")
+_ENTRY_BYTES = URL_HASH_BYTES + CONTENT_HASH_BYTES
+# En el snapshot, huella desconocida (filas anteriores a content_hash)
+_NO_FINGERPRINT = bytes(CONTENT_HASH_BYTES)
+
+
+class SeenUrlIndex:
+    def __init__(
+        self,
+        entries: Iterable[Tuple[bytes, Optional[bytes]]] = (),
+        max_id: int = 0,
+        row_count: int = 0,
+        source: str = "",
+    ):
+        self._fingerprints: Dict[bytes, Optional[bytes]] = {
+            bytes(key): bytes(fp) if fp else None for key, fp in entries
+        }
+        self._max_id = int(max_id)
+        self._row_count = int(row_count)
+        self._source = source
+
+    @property
+    def MaxId(self) -> int:
+        """Mayor id de proyecto incorporado; la DB solo se consulta por encima."""
+        return self._max_id
+
+    @property
+    def RowCount(self) -> int:
+        """Filas de la DB incorporadas por id (todas con id <= MaxId)."""
+        return self._row_count
+
+    @property
+    def Source(self) -> str:
+        """Identidad de la DB de origen (servidor/esquema)."""
+        return self._source
+
+    def matches_database(self, source: str, db_max_id: int, db_row_count: int) -> bool:
+        """
+        True si el índice sigue correspondiendo a la DB: mismo origen, ningún id
+        por encima del máximo de la tabla y la misma cantidad de filas con
+        id <= MaxId (db_row_count). Si no, hay que reconstruirlo.
+        """
+        return source == self._source and self._max_id <= db_max_id and db_row_count == self._row_count
+
+    def __len__(self) -> int:
+        return len(self._fingerprints)
+
+    def __contains__(self, url: str) -> bool:
+        return url_hash(url) in self._fingerprints
+
+    def contains_hash(self, key: bytes) -> bool:
+        return bytes(key) in self._fingerprints
+
+    def fingerprint(self, url: str) -> Optional[bytes]:
+        """content_hash guardado para la url (None si no se conoce)."""
+        return self._fingerprints.get(url_hash(url))
+
+    def is_unchanged(self, url: str, fingerprint: bytes) -> bool:
+        """True si el proyecto ya está guardado con esa misma huella."""
+        stored = self._fingerprints.get(url_hash(url))
+        return stored is not None and stored == fingerprint
+
+    def add(self, key: bytes, fingerprint: Optional[bytes] = None, project_id: Optional[int] = None) -> None:
+        self._fingerprints[bytes(key)] = bytes(fingerprint) if fingerprint else None
+        if project_id is not None:
+            # Solo las filas leídas de la DB traen id; cada una se cuenta una vez
+            self._row_count += 1
+            if project_id > self._max_id:
+                self._max_id = int(project_id)
+
+    def add_url(self, url: str, fingerprint: Optional[bytes] = None, project_id: Optional[int] = None) -> None:
+        self.add(url_hash(url), fingerprint, project_id)
+
+    def unknown(self, urls: Iterable[str]) -> List[str]:
+        """Urls que no están en el índice (probablemente nuevas), en el mismo orden."""
+        return [u for u in urls if url_hash(u) not in self._fingerprints]
+
+    # ---------------------------------
+    # Snapshot
+    # ---------------------------------
+    def to_bytes(self) -> bytes:
+        entries = b"".join(
+            key + (fp or _NO_FINGERPRINT) for key, fp in sorted(self._fingerprints.items())
+        )
+        source = self._source.encode("utf-8")
+        header = _HEADER.pack(SNAPSHOT_MAGIC, self._max_id, self._row_count, len(source))
+        return zlib.compress(header + source + entries)
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> "SeenUrlIndex":
+        payload = zlib.decompress(data)
+        magic, max_id, row_count, source_len = _HEADER.unpack_from(payload)
+        source = payload[_HEADER.size:_HEADER.size + source_len].decode("utf-8")
+        body = payload[_HEADER.size + source_len:]
+        if magic != SNAPSHOT_MAGIC or len(body) % _ENTRY_BYTES:
+            raise ValueError("Snapshot de urls vistas con formato inválido.")
+        entries = (
+            (body[i:i + URL_HASH_BYTES], body[i + URL_HASH_BYTES:i + _ENTRY_BYTES])
+            for i in range(0, len(body), _ENTRY_BYTES)
+        )
+        return cls(
+            ((key, None if fp == _NO_FINGERPRINT else fp) for key, fp in entries), max_id, row_count, source
+        )
+
+    def save(self, path: str) -> bool:
+        """Escribe el snapshot de forma atómica (archivo temporal + rename)."""
+        tmp_path = f"{path}.tmp"
+        try:
+            with open(tmp_path, "wb") as f:
+                f.write(self.to_bytes())
+            os.replace(tmp_path, path)
+            return True
+        except OSError as ex:
+            print(f"[SEEN] No se pudo guardar el snapshot {path}: {ex}")
+            return False
+
+    @classmethod
+    def load(cls, path: str) -> Optional["SeenUrlIndex"]:
+        """Carga el snapshot; None si no existe o está dañado."""
+        if not os.path.exists(path):
+            return None
+        try:
+            with open(path, "rb") as f:
+                return cls.from_bytes(f.read())
+        except (OSError, ValueError, zlib.error, struct.error) as ex:
+            print(f"[SEEN] Snapshot {path} ignorado: {ex}")
+            return None
@@ -2,12 +2,20 @@
 import os
 import requests
 
-import config.env
-from telegram_admin_utils import get_admin_chat_id
+from config.env import load_environment
+from message_rendering import render_project_body, render_skills_suffix
+from telegram_admin_utils import get_cached_admin_chat_id
+
+
+def construir_texto(titulo_mg, enlace_mg, matched_skills=None) -> str:
+    # Para muchos destinatarios usar message_rendering.MessageRenderer
+    return render_project_body(titulo_mg, enlace_mg) + render_skills_suffix(matched_skills)
+
 
 def mensaje(titulo_mg, enlace_mg, chat_id=None, matched_skills=None) -> bool:
+    load_environment()
     TELEGRAM_BOT_TOKEN = os.getenv("TELEGRAM_BOT_TOKEN") or os.getenv("TELEGRAM_TOKEN")
-    TELEGRAM_CHAT_ID = chat_id or get_admin_chat_id()
+    TELEGRAM_CHAT_ID = chat_id or get_cached_admin_chat_id()
 
     if not TELEGRAM_BOT_TOKEN or not TELEGRAM_CHAT_ID:
         print(
@@ -16,11 +24,7 @@ def mensaje(titulo_mg, enlace_mg, chat_id=None, matched_skills=None) -> bool:
         )
         return False
 
-    skills_text = ""
-    if matched_skills:
-        skills_text = "\nSkills en común: " + ", ".join(sorted(set(matched_skills)))
-
-    mensaje_texto = f"Nuevo proyecto publicado - {titulo_mg}\n{enlace_mg}{skills_text}"
+    mensaje_texto = construir_texto(titulo_mg, enlace_mg, matched_skills)
 
     url = f"https://api.telegram.org/bot{TELEGRAM_BOT_TOKEN}/sendMessage"
     params = {
@@ -1,10 +1,11 @@
 # send_twilio_message.py
 import os
 
-import config.env
+from config.env import load_environment
 from twilio.rest import Client
 
 def mensaje(titulo_mg, enlace_mg):
+    load_environment()
     account_sid = os.getenv('TWILIO_ACCOUNT_SID')
     auth_token = os.getenv('TWILIO_AUTH_TOKEN')
     from_number = os.getenv('TWILIO_FROM')
@@ -0,0 +1,10 @@
+# skill_index.py
+"""Normalización de skills compartida por los matchers y el perfil de usuario.
+
+Las skills de usuarios y proyectos se comparan siempre como slug de Workana.
+"""
+
+
+def normalize_skill_value(value: str) -> str:
+    """Normaliza a slug de Workana: minúsculas, trim, espacios -> guiones."""
+    return "-".join(value.strip().lower().split()) if value else ""
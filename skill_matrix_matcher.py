@@ -0,0 +1,123 @@
+# skill_matrix_matcher.py
+"""Cruce en lote proyectos × usuarios inspirado en un producto de matrices ralas.
+
+Las skills se internan como enteros. U es la matriz de incidencia
+usuario × skill y P la de proyecto × skill; el producto P · Uᵀ da, para cada
+par (proyecto, usuario), la cantidad de skills en común. Se guarda Uᵀ por
+filas (skill -> usuarios, formato CSR) y el producto se calcula fila a fila
+(algoritmo de Gustavson): cada proyecto recorre las listas de usuarios de sus
+skills, así el costo es proporcional a los pares que de verdad coinciden y no a
+proyectos × usuarios.
+
+Es una adaptación en Python puro, no un producto de scipy.sparse: el proyecto
+no depende de numpy/scipy. Con skills ralas (miles de proyectos contra miles de
+usuarios, pocas coincidencias por proyecto) el lote tarda bastante menos de un
+segundo (ver tests/test_skill_matrix_matcher.py). El costo por par coincidente
+es de alrededor de 1 µs, así que un caso denso con millones de pares tarda
+segundos; esos pares igual se encolan uno por uno en el outbox.
+"""
+from typing import Dict, FrozenSet, Iterable, List, Sequence, Set, Tuple
+
+from skill_index import normalize_skill_value
+
+
+class SkillVocabulary:
+    """Asigna un id entero estable a cada slug."""
+
+    def __init__(self):
+        self._ids: Dict[str, int] = {}
+        self._slugs: List[str] = []
+
+    def __len__(self) -> int:
+        return len(self._slugs)
+
+    def intern(self, slug: str) -> int:
+        skill_id = self._ids.get(slug)
+        if skill_id is None:
+            skill_id = len(self._slugs)
+            self._ids[slug] = skill_id
+            self._slugs.append(slug)
+        return skill_id
+
+    def lookup(self, slug: str) -> int:
+        """Id del slug o -1 si ningún usuario lo tiene."""
+        return self._ids.get(slug, -1)
+
+    def slug(self, skill_id: int) -> str:
+        return self._slugs[skill_id]
+
+
+class SkillMatrixMatcher:
+    def __init__(self, skills_by_user: Dict[int, Iterable[str]]):
+        self._vocabulary = SkillVocabulary()
+        # Filas de U: skills (ids) de cada usuario
+        self._user_rows: Dict[int, FrozenSet[int]] = {}
+        for user_id, skills in skills_by_user.items():
+            row = frozenset(
+                self._vocabulary.intern(slug)
+                for slug in (normalize_skill_value(s) for s in skills)
+                if slug
+            )
+            if row:
+                self._user_rows[int(user_id)] = row
+
+        # Uᵀ en CSR: usuarios de cada skill (ordenados)
+        columns: List[List[int]] = [[] for _ in range(len(self._vocabulary))]
+        for user_id in sorted(self._user_rows):
+            for skill_id in self._user_rows[user_id]:
+                columns[skill_id].append(user_id)
+        self._users_by_skill: List[Tuple[int, ...]] = [tuple(col) for col in columns]
+
+    @property
+    def UserCount(self) -> int:
+        return len(self._user_rows)
+
+    @property
+    def SkillCount(self) -> int:
+        return len(self._vocabulary)
+
+    def __bool__(self) -> bool:
+        return bool(self._user_rows)
+
+    def skills(self) -> Set[str]:
+        return {self._vocabulary.slug(i) for i in range(len(self._vocabulary))}
+
+    def project_rows(self, project_skill_sets: Sequence[Iterable[str]]) -> List[FrozenSet[int]]:
+        """Filas de P: skills de cada proyecto conocidas por algún usuario."""
+        rows: List[FrozenSet[int]] = []
+        for skills in project_skill_sets:
+            ids = (self._vocabulary.lookup(normalize_skill_value(s)) for s in skills)
+            rows.append(frozenset(i for i in ids if i >= 0))
+        return rows
+
+    def match_batch(
+        self, project_skill_sets: Sequence[Iterable[str]]
+    ) -> List[Tuple[int, int, int, List[str]]]:
+        """
+        (índice de proyecto, telegram_user_id, cantidad de skills en común, skills
+        en común) para todo el lote: las entradas no nulas de P · Uᵀ.
+        """
+        users_by_skill = self._users_by_skill
+        slug = self._vocabulary.slug
+        results: List[Tuple[int, int, int, List[str]]] = []
+        for project_index, row in enumerate(self.project_rows(project_skill_sets)):
+            if not row:
+                continue
+            # Fila de P · Uᵀ: en lugar de contar, cada usuario acumula una máscara
+            # de bits con las columnas (skills del proyecto) en las que aparece; la
+            # máscara identifica las skills en común sin intersecar conjuntos por par.
+            skill_ids = sorted(row, key=slug)
+            masks: Dict[int, int] = {}
+            get = masks.get
+            for bit, skill_id in enumerate(skill_ids):
+                flag = 1 << bit
+                for user_id in users_by_skill[skill_id]:
+                    masks[user_id] = get(user_id, 0) | flag
+            groups: Dict[int, Tuple[int, List[str]]] = {}
+            for user_id, mask in masks.items():
+                group = groups.get(mask)
+                if group is None:
+                    slugs = [slug(skill_ids[b]) for b in range(len(skill_ids)) if mask >> b & 1]
+                    group = groups[mask] = (len(slugs), slugs)
+                results.append((project_index, user_id, *group))
+        return results
@@ -0,0 +1,121 @@
+# skill_text_matcher.py
+"""Busca skills mencionadas en el texto de un proyecto (título y descripción).
+
+Muchas tarjetas de Workana no traen tags pero nombran "python" o "excel" en el
+texto. SkillTextMatcher arma un autómata Aho-Corasick con todas las skills de
+los usuarios (el slug y su variante con espacios) y recorre cada texto una sola
+vez, en tiempo lineal, sin importar cuántas skills haya. Solo cuenta coincidencias
+de palabra completa: "java" no aparece dentro de "javascript".
+"""
+from collections import deque
+from typing import Dict, FrozenSet, Iterable, List, Optional, Set, Tuple
+
+from skill_index import normalize_skill_value
+
+# Skills de una letra ("c", "r") generan demasiados falsos positivos en texto libre
+MIN_PATTERN_LENGTH = 2
+
+
+def _is_word_char(ch: str) -> bool:
+    return ch.isalnum() or ch == "_"
+
+
+class SkillTextMatcher:
+    def __init__(self, skills: Iterable[str], min_length: int = MIN_PATTERN_LENGTH):
+        skills = frozenset(skills)
+        # Conjunto recibido tal cual (incluye las skills cortas que se descartan)
+        self._source: FrozenSet[str] = skills
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        # Por estado: (slug, largo del patrón, exige borde a izquierda, exige borde a derecha)
+        self._output: List[List[Tuple[str, int, bool, bool]]] = [[]]
+
+        slugs: Set[str] = set()
+        for skill in skills:
+            slug = normalize_skill_value(skill)
+            if len(slug) < min_length:
+                continue
+            slugs.add(slug)
+            for pattern in {slug, slug.replace("-", " ")}:
+                self._add_pattern(pattern, slug)
+        self._skills: FrozenSet[str] = frozenset(slugs)
+        self._build_failure_links()
+
+    @property
+    def Skills(self) -> FrozenSet[str]:
+        return self._skills
+
+    @property
+    def Source(self) -> FrozenSet[str]:
+        """Skills con las que se construyó el autómata, sin filtrar."""
+        return self._source
+
+    def __bool__(self) -> bool:
+        return bool(self._skills)
+
+    @classmethod
+    def for_skills(
+        cls, skills: Iterable[str], previous: Optional["SkillTextMatcher"] = None
+    ) -> "SkillTextMatcher":
+        """Reutiliza `previous` si se construyó con las mismas skills; si no, arma uno nuevo."""
+        skills = frozenset(skills)
+        if previous is not None and previous.Source == skills:
+            return previous
+        return cls(skills)
+
+    def _add_pattern(self, pattern: str, slug: str) -> None:
+        state = 0
+        for ch in pattern:
+            next_state = self._goto[state].get(ch)
+            if next_state is None:
+                next_state = len(self._goto)
+                self._goto.append({})
+                self._fail.append(0)
+                self._output.append([])
+                self._goto[state][ch] = next_state
+            state = next_state
+        self._output[state].append(
+            (slug, len(pattern), _is_word_char(pattern[0]), _is_word_char(pattern[-1]))
+        )
+
+    def _build_failure_links(self) -> None:
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for ch, child in self._goto[state].items():
+                queue.append(child)
+                fallback = self._fail[state]
+                while fallback and ch not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                target = self._goto[fallback].get(ch, 0)
+                self._fail[child] = target if target != child else 0
+                self._output[child] = self._output[child] + self._output[self._fail[child]]
+
+    def find(self, text: Optional[str]) -> Set[str]:
+        """Slugs mencionados como palabra completa en el texto."""
+        if not text or not self._skills:
+            return set()
+        # Minúsculas y espacios colapsados: "Microsoft   Excel" == "microsoft excel"
+        text = " ".join(text.lower().split())
+        goto, fail, output = self._goto, self._fail, self._output
+        found: Set[str] = set()
+        state = 0
+        last = len(text) - 1
+        for i, ch in enumerate(text):
+            while state and ch not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(ch, 0)
+            for slug, length, left_boundary, right_boundary in output[state]:
+                if slug in found:
+                    continue
+                start = i - length + 1
+                if left_boundary and start > 0 and _is_word_char(text[start - 1]):
+                    continue
+                if right_boundary and i < last and _is_word_char(text[i + 1]):
+                    continue
+                found.add(slug)
+        return found
+
+    def find_in_project(self, title: Optional[str], description: Optional[str]) -> Set[str]:
+        # Un separador evita coincidencias que crucen del título a la descripción
+        return self.find(f"{title or ''} | {description or ''}")
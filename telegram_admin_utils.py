@@ -1,8 +1,12 @@
+import time
 from typing import Optional
 
-import config.env
 from workana_bot_database_model import WorkanaBotDatabase
 
+ADMIN_CHAT_ID_TTL_SECONDS = 300.0
+
+_admin_chat_id_cache: tuple[Optional[int], float] | None = None
+
 
 def get_admin_chat_id() -> Optional[int]:
     """Return the telegram_user_id for the admin user in bot_users."""
@@ -15,3 +19,14 @@ def get_admin_chat_id() -> Optional[int]:
     if result is None:
         return None
     return int(result)
+
+
+def get_cached_admin_chat_id(ttl_seconds: float = ADMIN_CHAT_ID_TTL_SECONDS) -> Optional[int]:
+    """Like get_admin_chat_id, but reuses the value for ttl_seconds."""
+    global _admin_chat_id_cache
+    now = time.monotonic()
+    if _admin_chat_id_cache is not None and now - _admin_chat_id_cache[1] < ttl_seconds:
+        return _admin_chat_id_cache[0]
+    admin_chat_id = get_admin_chat_id()
+    _admin_chat_id_cache = (admin_chat_id, now)
+    return admin_chat_id
@@ -0,0 +1,205 @@
+# telegram_delivery.py
+"""Motor asíncrono de envío de mensajes a Telegram.
+
+- Un cliente HTTP (pool de conexiones, keep-alive) que vive tanto como el motor.
+- Límite global tipo token bucket (~30 msg/s) y límite por chat (~1 msg/s).
+  Los buckets también viven en el motor: lotes consecutivos (y las pausas por
+  429) comparten los mismos límites.
+- Reintentos con backoff exponencial que respetan el retry_after de los 429.
+
+send_batch corre siempre en el mismo event loop del motor; send_batch_async
+debe usarse desde un único loop por instancia.
+"""
+import asyncio
+import os
+import random
+import threading
+import time
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Sequence
+
+import httpx
+
+from config.env import load_environment
+
+
+DEFAULT_GLOBAL_RATE = 30.0
+DEFAULT_PER_CHAT_RATE = 1.0
+DEFAULT_MAX_ATTEMPTS = 5
+DEFAULT_MAX_CONNECTIONS = 20
+DEFAULT_TIMEOUT_SECONDS = 15.0
+BACKOFF_BASE_SECONDS = 0.5
+BACKOFF_MAX_SECONDS = 30.0
+
+
+@dataclass
+class OutgoingMessage:
+    chat_id: int
+    text: str
+    parse_mode: Optional[str] = None
+
+
+class TokenBucket:
+    """Limitador asíncrono: `rate` tokens por segundo con ráfagas de hasta `capacity`."""
+
+    def __init__(self, rate: float, capacity: Optional[float] = None):
+        self._rate = rate
+        self._capacity = capacity if capacity is not None else max(1.0, rate)
+        self._tokens = self._capacity
+        self._updated = time.monotonic()
+        self._blocked_until = 0.0
+        self._lock = asyncio.Lock()
+
+    def pause_for(self, seconds: float) -> None:
+        """Bloquea el bucket (p. ej. tras un 429 con retry_after)."""
+        self._blocked_until = max(self._blocked_until, time.monotonic() + seconds)
+        self._tokens = 0.0
+
+    async def acquire(self) -> None:
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                if now < self._blocked_until:
+                    await asyncio.sleep(self._blocked_until - now)
+                    continue
+                elapsed = now - self._updated
+                self._updated = now
+                self._tokens = min(self._capacity, self._tokens + elapsed * self._rate)
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                await asyncio.sleep((1 - self._tokens) / self._rate)
+
+
+def _backoff_delay(attempt: int) -> float:
+    delay = min(BACKOFF_MAX_SECONDS, BACKOFF_BASE_SECONDS * (2 ** (attempt - 1)))
+    return delay + random.uniform(0, delay / 2)
+
+
+class TelegramDeliveryEngine:
+    def __init__(
+        self,
+        token: Optional[str] = None,
+        global_rate: float = DEFAULT_GLOBAL_RATE,
+        per_chat_rate: float = DEFAULT_PER_CHAT_RATE,
+        max_attempts: int = DEFAULT_MAX_ATTEMPTS,
+        max_connections: int = DEFAULT_MAX_CONNECTIONS,
+        transport: Optional[httpx.AsyncBaseTransport] = None,
+    ):
+        self._token = token
+        self._per_chat_rate = per_chat_rate
+        self._max_attempts = max(1, max_attempts)
+        self._max_connections = max_connections
+        self._transport = transport
+        self._global_bucket = TokenBucket(global_rate)
+        self._chat_buckets: Dict[int, TokenBucket] = {}
+        self._client: Optional[httpx.AsyncClient] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._loop_lock = threading.Lock()
+
+    def _get_token(self) -> Optional[str]:
+        load_environment()
+        return self._token or os.getenv("TELEGRAM_BOT_TOKEN") or os.getenv("TELEGRAM_TOKEN")
+
+    def _get_client(self) -> httpx.AsyncClient:
+        if self._client is None or self._client.is_closed:
+            limits = httpx.Limits(
+                max_connections=self._max_connections,
+                max_keepalive_connections=self._max_connections,
+            )
+            self._client = httpx.AsyncClient(
+                limits=limits, timeout=DEFAULT_TIMEOUT_SECONDS, transport=self._transport
+            )
+        return self._client
+
+    def _chat_bucket(self, chat_id: int) -> TokenBucket:
+        bucket = self._chat_buckets.get(chat_id)
+        if bucket is None:
+            bucket = self._chat_buckets[chat_id] = TokenBucket(self._per_chat_rate, capacity=1)
+        return bucket
+
+    async def _send_one(self, client: httpx.AsyncClient, url: str, message: OutgoingMessage) -> bool:
+        global_bucket = self._global_bucket
+        chat_bucket = self._chat_bucket(message.chat_id)
+        payload = {"chat_id": message.chat_id, "text": message.text}
+        if message.parse_mode:
+            payload["parse_mode"] = message.parse_mode
+
+        for attempt in range(1, self._max_attempts + 1):
+            await chat_bucket.acquire()
+            await global_bucket.acquire()
+            try:
+                response = await client.post(url, json=payload)
+            except httpx.HTTPError as error:
+                delay = _backoff_delay(attempt)
+                print(f"⚠️ Error de red enviando a Telegram (chat {message.chat_id}): {error}")
+            else:
+                if response.status_code == 200:
+                    return True
+                if response.status_code == 429:
+                    try:
+                        retry_after = float(response.json().get("parameters", {}).get("retry_after", 1))
+                    except ValueError:
+                        retry_after = 1.0
+                    # El flood control de Telegram aplica a todo el bot
+                    global_bucket.pause_for(retry_after)
+                    delay = retry_after
+                    print(f"⚠️ Telegram pidió esperar {retry_after}s (chat {message.chat_id}).")
+                elif response.status_code >= 500:
+                    delay = _backoff_delay(attempt)
+                else:
+                    print(
+                        f"Error al enviar mensaje a Telegram (chat {message.chat_id}): {response.text}"
+                    )
+                    return False
+            if attempt < self._max_attempts:
+                await asyncio.sleep(delay)
+
+        print(f"❌ Se agotaron los reintentos enviando a Telegram (chat {message.chat_id}).")
+        return False
+
+    async def send_batch_async(self, messages: Sequence[OutgoingMessage]) -> List[bool]:
+        """Envía el lote en paralelo; devuelve el resultado de cada mensaje en orden."""
+        if not messages:
+            return []
+        token = self._get_token()
+        if not token:
+            print("Error: TELEGRAM_BOT_TOKEN/TELEGRAM_TOKEN no está configurado.")
+            return [False] * len(messages)
+
+        url = f"https://api.telegram.org/bot{token}/sendMessage"
+        client = self._get_client()
+        return list(await asyncio.gather(*(self._send_one(client, url, message) for message in messages)))
+
+    def send_batch(self, messages: Sequence[OutgoingMessage]) -> List[bool]:
+        """Versión sincrónica de send_batch_async; todos los lotes usan el mismo loop."""
+        with self._loop_lock:
+            if self._loop is None or self._loop.is_closed():
+                self._loop = asyncio.new_event_loop()
+            return self._loop.run_until_complete(self.send_batch_async(messages))
+
+    def close(self) -> None:
+        """Cierra el cliente HTTP y el event loop del motor."""
+        with self._loop_lock:
+            if self._loop is None:
+                return
+            if self._client is not None:
+                self._loop.run_until_complete(self._client.aclose())
+                self._client = None
+            self._loop.close()
+            self._loop = None
+
+
+if __name__ == "__main__":
+    from telegram_admin_utils import get_admin_chat_id
+
+    admin_chat_id = get_admin_chat_id()
+    if admin_chat_id is None:
+        print("No existe usuario admin en bot_users.")
+    else:
+        engine = TelegramDeliveryEngine()
+        resultados = engine.send_batch(
+            [OutgoingMessage(admin_chat_id, f"Prueba de envío en lote #{i}") for i in range(3)]
+        )
+        print(f"Resultados: {resultados}")
+        engine.close()
@@ -1,7 +1,7 @@
 import os
 import unittest
 
-import config.env
+from config.env import load_environment
 
 from send_telegram_message import mensaje
 from telegram_admin_utils import get_admin_chat_id
@@ -15,6 +15,7 @@ from telegram_admin_utils import get_admin_chat_id
 
 class TestAdminMessage(unittest.TestCase):
     def test_admin_can_receive_message(self):
+        load_environment()
         token = os.getenv("TELEGRAM_BOT_TOKEN") or os.getenv("TELEGRAM_TOKEN")
         if not token:
             self.skipTest(
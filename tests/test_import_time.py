@@ -0,0 +1,45 @@
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+ROOT_DIR = Path(__file__).resolve().parents[1]
+
+pytest.importorskip("mariadb")
+
+# Presupuesto generoso: alcanza para importar telegram y el bot, pero no para
+# esperar un timeout de conexión a la base de datos.
+IMPORT_BUDGET_SECONDS = 3.0
+
+CHECK_SCRIPT = """
+import importlib, sys, time
+start = time.perf_counter()
+importlib.import_module("01_bot")
+elapsed = time.perf_counter() - start
+import config.env, workana_flag_manager
+assert not config.env._loaded, ".env se cargó al importar"
+assert workana_flag_manager._config is None, "VariablesApiController se creó al importar"
+print(elapsed)
+"""
+
+
+# Este test valida que importar el bot no lea el .env, no abra conexiones a la
+# base de variables y termine dentro del presupuesto de tiempo.
+def test_bot_import_is_lazy_and_fast():
+    env = dict(os.environ)
+    # Host inalcanzable: si algo conecta al importar, el test lo nota
+    env["DB_HOST"] = "10.255.255.1"
+    result = subprocess.run(
+        [sys.executable, "-c", CHECK_SCRIPT],
+        cwd=ROOT_DIR,
+        env=env,
+        capture_output=True,
+        text=True,
+        timeout=60,
+    )
+    assert result.returncode == 0, result.stderr
+    lines = result.stdout.strip().splitlines()
+    assert lines and "BOT_ENV" not in result.stdout
+    assert float(lines[-1]) < IMPORT_BUDGET_SECONDS
@@ -0,0 +1,90 @@
+import asyncio
+import sys
+import threading
+import time
+from pathlib import Path
+
+ROOT_DIR = Path(__file__).resolve().parents[1]
+if str(ROOT_DIR) not in sys.path:
+    sys.path.append(str(ROOT_DIR))
+
+import pytest
+
+from job_scheduler import JobScheduler
+
+
+def _run_for(scheduler: JobScheduler, seconds: float) -> None:
+    async def main():
+        runner = asyncio.create_task(scheduler.run())
+        await asyncio.sleep(seconds)
+        scheduler.stop()
+        await runner
+
+    asyncio.run(main())
+
+
+# Este test valida que un job lento no bloquee a otro job independiente y que
+# nunca se superponga consigo mismo aunque tarde más que su intervalo.
+def test_slow_job_does_not_block_others_nor_overlap():
+    active = 0
+    max_active = 0
+    lock = threading.Lock()
+    fast_runs = []
+
+    def slow():
+        nonlocal active, max_active
+        with lock:
+            active += 1
+            max_active = max(max_active, active)
+        time.sleep(0.25)
+        with lock:
+            active -= 1
+
+    scheduler = JobScheduler()
+    scheduler.add_job("slow", slow, 0.05)
+    scheduler.add_job("fast", lambda: fast_runs.append(time.monotonic()), 0.05)
+    _run_for(scheduler, 0.6)
+
+    stats = scheduler.stats()
+    assert max_active == 1
+    assert stats["slow"].runs in (2, 3)
+    assert stats["slow"].skipped >= 1
+    assert stats["slow"].last_duration >= 0.25
+    assert len(fast_runs) >= 8
+
+
+# Este test valida que se registren duración, retraso y errores por job, y que
+# un error no detenga las ejecuciones siguientes.
+def test_stats_record_lag_duration_and_failures():
+    calls = []
+
+    def flaky():
+        calls.append(1)
+        if len(calls) == 1:
+            raise RuntimeError("falló")
+
+    scheduler = JobScheduler()
+    scheduler.add_job("flaky", flaky, 0.05)
+    _run_for(scheduler, 0.28)
+
+    stats = scheduler.stats()["flaky"]
+    assert stats.runs >= 3
+    assert stats.failures == 1
+    assert stats.last_error is None
+    assert stats.last_duration is not None and stats.last_duration < 0.05
+    assert 0 <= stats.last_lag < 0.05
+
+
+# Este test valida que run_immediately=False espere el primer intervalo y que
+# los parámetros inválidos se rechacen.
+def test_first_run_waits_interval_and_validates_jobs():
+    calls = []
+    scheduler = JobScheduler()
+    scheduler.add_job("later", lambda: calls.append(1), 0.5, run_immediately=False)
+    _run_for(scheduler, 0.2)
+    assert calls == []
+
+    with pytest.raises(ValueError):
+        scheduler.add_job("later", lambda: None, 1)
+    with pytest.raises(ValueError):
+        scheduler.add_job("zero", lambda: None, 0)
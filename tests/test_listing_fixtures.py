@@ -0,0 +1,46 @@
+import gzip
+import sys
+from pathlib import Path
+
+ROOT_DIR = Path(__file__).resolve().parents[1]
+if str(ROOT_DIR) not in sys.path:
+    sys.path.append(str(ROOT_DIR))
+
+from listing_fixtures import ListingFixtureStore, ReplayFetcher
+
+PAGE_URL = "https://www.workana.com/jobs?language=es"
+LISTING_HTML = """
+<div class="project-item js-project">
+  <h2 class="project-title"><a href="/job/bot-telegram?ref=projects_1">Bot de Telegram</a></h2>
+  <div class="html-desc project-details"><p>Bot en Python.</p></div>
+  <div class="skills"><a class="skill" href="/jobs?skills=python"><h3>Python</h3></a></div>
+</div>
+"""
+
+
+# Este test valida que los snapshots se guarden comprimidos y direccionados por
+# contenido: el mismo HTML en dos urls ocupa un solo archivo.
+def test_record_is_content_addressed(tmp_path):
+    store = ListingFixtureStore(str(tmp_path))
+
+    digest = store.record(PAGE_URL, LISTING_HTML)
+    assert store.record(PAGE_URL + "&page=2", LISTING_HTML) == digest
+
+    snapshots = list(tmp_path.glob("*.html.gz"))
+    assert [p.name for p in snapshots] == [digest + ".html.gz"]
+    assert gzip.decompress(snapshots[0].read_bytes()).decode("utf-8") == LISTING_HTML
+    assert ListingFixtureStore(str(tmp_path)).urls() == [PAGE_URL, PAGE_URL + "&page=2"]
+
+
+# Este test valida que el modo replay pase el snapshot por el mismo parser que
+# el modo http y que una url sin snapshot se trate como página vacía.
+def test_replay_fetcher_parses_recorded_html(tmp_path):
+    ListingFixtureStore(str(tmp_path)).record(PAGE_URL, LISTING_HTML)
+    fetch = ReplayFetcher(ListingFixtureStore(str(tmp_path)))
+
+    projects = fetch(PAGE_URL)
+
+    assert [p.Title for p in projects] == ["Bot de Telegram"]
+    assert projects[0].Url == "https://www.workana.com/job/bot-telegram"
+    assert [s["slug"] for s in projects[0].Skills] == ["python"]
+    assert fetch(PAGE_URL + "&page=9") == []
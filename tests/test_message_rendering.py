@@ -0,0 +1,64 @@
+import sys
+from pathlib import Path
+
+ROOT_DIR = Path(__file__).resolve().parents[1]
+if str(ROOT_DIR) not in sys.path:
+    sys.path.append(str(ROOT_DIR))
+
+import message_rendering
+from message_rendering import MessageRenderer
+
+
+# Este test valida que el texto armado conserve el formato histórico de las
+# alertas (cuerpo + "Skills en común" ordenadas y sin duplicados).
+def test_render_keeps_alert_format():
+    renderer = MessageRenderer()
+
+    text = renderer.render(7, "Landing en WordPress", "https://www.workana.com/job/x", ["php", "wordpress", "php"])
+
+    assert text == (
+        "Nuevo proyecto publicado - Landing en WordPress\n"
+        "https://www.workana.com/job/x\n"
+        "Skills en común: php, wordpress"
+    )
+    assert renderer.render(8, "Sin skills", "https://www.workana.com/job/y") == (
+        "Nuevo proyecto publicado - Sin skills\nhttps://www.workana.com/job/y"
+    )
+
+
+# Este test valida que el cuerpo de un proyecto se arme una sola vez aunque
+# vaya a muchos usuarios, y que cada mensaje lleve su chat_id y parse_mode.
+def test_body_rendered_once_per_project(monkeypatch):
+    calls = []
+    original = message_rendering.render_project_body
+
+    def counting(title, url, escape=False):
+        calls.append(url)
+        return original(title, url, escape)
+
+    monkeypatch.setattr(message_rendering, "render_project_body", counting)
+    renderer = MessageRenderer()
+
+    messages = [
+        renderer.message(chat_id, 1, "Bot", "https://www.workana.com/job/bot", ["python"])
+        for chat_id in range(50)
+    ]
+    renderer.message(99, None, "Otro", "https://www.workana.com/job/otro")
+    renderer.message(100, None, "Otro", "https://www.workana.com/job/otro")
+
+    assert len(calls) == 2
+    assert [m.chat_id for m in messages] == list(range(50))
+    assert all(m.text.endswith("Skills en común: python") for m in messages)
+    assert messages[0].parse_mode is None
+
+
+# Este test valida que con parse_mode HTML se escapen título, url y skills.
+def test_html_parse_mode_escapes_text():
+    renderer = MessageRenderer(parse_mode="HTML")
+
+    message = renderer.message(1, 3, "<b>Web</b> & app", "https://x.test/?a=1&b=2", ["c++ & <c#>"])
+
+    assert message.parse_mode == "HTML"
+    assert "&lt;b&gt;Web&lt;/b&gt; &amp; app" in message.text
+    assert "https://x.test/?a=1&amp;b=2" in message.text
+    assert message.text.endswith("Skills en común: c++ &amp; &lt;c#&gt;")
@@ -0,0 +1,166 @@
+import sys
+from contextlib import contextmanager
+from pathlib import Path
+
+ROOT_DIR = Path(__file__).resolve().parents[1]
+if str(ROOT_DIR) not in sys.path:
+    sys.path.append(str(ROOT_DIR))
+
+from notification_outbox import NotificationOutbox, deliver_pending
+
+
+class FakeTransaction:
+    def __init__(self, db):
+        self._db = db
+        self.IsCommitted = False
+
+    def execute_query(self, sql, params=()):
+        return self._db.execute_query(sql, params)
+
+    def execute_non_query(self, sql, params=()):
+        return self._db.execute_non_query(sql, params)
+
+
+class FakeDatabase:
+    """Registra las sentencias y responde los SELECT con filas predefinidas."""
+
+    def __init__(self, version="10.11.6-MariaDB", pending=(), projects=(), commit=True):
+        self.version = version
+        self.pending = list(pending)
+        self.projects = list(projects)
+        self.commit = commit
+        self.statements = []
+
+    def execute_scalar(self, sql, params=()):
+        return self.version if "VERSION()" in sql else None
+
+    def execute_query(self, sql, params=()):
+        self.statements.append((" ".join(sql.split()), params))
+        if "FROM notification_outbox" in sql:
+            rows, self.pending = self.pending, []
+            return rows
+        if "FROM projects" in sql:
+            return [row for row in self.projects if row[0] in params]
+        return []
+
+    def execute_non_query(self, sql, params=()):
+        self.statements.append((" ".join(sql.split()), params))
+        return True
+
+    def execute_many(self, sql, seq_params):
+        self.statements.append((" ".join(sql.split()), list(seq_params)))
+        return True
+
+    @contextmanager
+    def transaction(self):
+        tx = FakeTransaction(self)
+        yield tx
+        tx.IsCommitted = self.commit
+
+
+class FakeEngine:
+    def __init__(self, results):
+        self.results = results
+        self.sent = []
+
+    def send_batch(self, messages):
+        self.sent.extend(messages)
+        if isinstance(self.results, Exception):
+            raise self.results
+        return self.results[: len(messages)]
+
+
+def _statements(db, prefix):
+    return [(sql, params) for sql, params in db.statements if sql.startswith(prefix)]
+
+
+# Este test valida que el encolado sea un solo INSERT IGNORE en bloque (la clave
+# única descarta duplicados) con las skills ordenadas y sin repetir.
+def test_enqueue_many_uses_insert_ignore():
+    db = FakeDatabase()
+    outbox = NotificationOutbox(db)
+
+    assert outbox.enqueue_many([(10, 1, ["python", "excel", "python"]), (11, 1, [])])
+    assert outbox.enqueue_many([])
+
+    (sql, params), = _statements(db, "INSERT")
+    assert sql.startswith("INSERT IGNORE INTO notification_outbox")
+    assert params == [(10, 1, "excel,python"), (11, 1, "")]
+
+
+# Este test valida que el claim use SKIP LOCKED solo si el servidor lo soporta,
+# marque las filas como 'sending' y complete título/url del proyecto.
+def test_claim_batch_locks_marks_and_joins_projects():
+    db = FakeDatabase(
+        pending=[(5, 10, 1, "python"), (6, 11, 2, None)],
+        projects=[(1, "Bot", "https://www.workana.com/job/bot")],
+    )
+    outbox = NotificationOutbox(db)
+
+    claimed = outbox.claim_batch(50)
+
+    select_sql, select_params = _statements(db, "SELECT id, telegram_user_id")[0]
+    assert select_sql.endswith("FOR UPDATE SKIP LOCKED")
+    assert select_params == (10, 50)
+    (update_sql, update_params), = _statements(db, "UPDATE")
+    assert "status = 'sending'" in update_sql and "attempts = attempts + 1" in update_sql
+    assert update_params == (5, 6)
+    assert claimed == [
+        {
+            "id": 5,
+            "telegram_user_id": 10,
+            "project_id": 1,
+            "title": "Bot",
+            "url": "https://www.workana.com/job/bot",
+            "matched_skills": ["python"],
+        },
+        {
+            "id": 6,
+            "telegram_user_id": 11,
+            "project_id": 2,
+            "title": "(Sin título)",
+            "url": "",
+            "matched_skills": [],
+        },
+    ]
+
+
+def test_claim_batch_without_skip_locked_or_commit():
+    db = FakeDatabase(version="10.5.9-MariaDB", pending=[(5, 10, 1, "python")], commit=False)
+    outbox = NotificationOutbox(db)
+
+    assert outbox.claim_batch(10) == []
+    select_sql, _ = _statements(db, "SELECT id, telegram_user_id")[0]
+    assert select_sql.endswith("FOR UPDATE") and "SKIP LOCKED" not in select_sql
+
+
+# Este test valida el camino de error: los mensajes no enviados vuelven a
+# 'pending' (o pasan a 'failed' al llegar al tope de intentos) y el ciclo se
+# corta para reintentarlos en el próximo.
+def test_deliver_pending_marks_failed_rows():
+    db = FakeDatabase(
+        pending=[(5, 10, 1, "python"), (6, 11, 1, "python")],
+        projects=[(1, "Bot", "https://www.workana.com/job/bot")],
+    )
+    outbox = NotificationOutbox(db, max_attempts=3)
+    engine = FakeEngine([True, False])
+
+    assert deliver_pending(outbox, engine, batch_size=10) == (1, 1)
+
+    updates = _statements(db, "UPDATE")
+    delivered_sql, delivered_params = updates[1]
+    failed_sql, failed_params = updates[2]
+    assert "status = 'delivered'" in delivered_sql and delivered_params == (5,)
+    assert "IF(attempts >= %s, 'failed', 'pending')" in failed_sql
+    assert failed_params == (3, "telegram send failed", 6)
+
+
+def test_deliver_pending_marks_whole_batch_failed_on_engine_error():
+    db = FakeDatabase(pending=[(5, 10, 1, None), (6, 11, 1, None)], projects=[(1, "Bot", "u")])
+    outbox = NotificationOutbox(db)
+
+    assert deliver_pending(outbox, FakeEngine(RuntimeError("sin red")), batch_size=10) == (0, 2)
+
+    failed_sql, failed_params = _statements(db, "UPDATE")[-1]
+    assert "'failed', 'pending'" in failed_sql
+    assert failed_params[1:] == ("sin red", 5, 6)
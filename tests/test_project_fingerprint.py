@@ -0,0 +1,25 @@
+import sys
+from pathlib import Path
+
+ROOT_DIR = Path(__file__).resolve().parents[1]
+if str(ROOT_DIR) not in sys.path:
+    sys.path.append(str(ROOT_DIR))
+
+from models import Project
+
+
+# Este test valida que la huella de contenido detecte cambios de título,
+# descripción o skills e ignore el orden de las skills.
+def test_content_hash_detects_changes():
+    base = Project(
+        Title="Bot",
+        Description="Bot en Python",
+        Url="https://www.workana.com/job/bot",
+        Skills=[{"name": "Python", "slug": "python"}, {"name": "Telegram", "slug": "telegram"}],
+    )
+    reordered = Project(base.Title, base.Description, base.Url, list(reversed(base.Skills)))
+    edited = Project(base.Title, "Bot en Python y MySQL", base.Url, base.Skills)
+    fewer_skills = Project(base.Title, base.Description, base.Url, base.Skills[:1])
+
+    assert base.ContentHash == reordered.ContentHash
+    assert len({base.ContentHash, edited.ContentHash, fewer_skills.ContentHash}) == 3
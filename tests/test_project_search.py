@@ -0,0 +1,113 @@
+import sys
+from pathlib import Path
+
+ROOT_DIR = Path(__file__).resolve().parents[1]
+if str(ROOT_DIR) not in sys.path:
+    sys.path.append(str(ROOT_DIR))
+
+from projects_db import (
+    LIKE_SEARCH_CONDITION,
+    LIKE_SEARCH_QUERY,
+    RANKED_SEARCH_QUERY,
+    proyectosDatabase,
+)
+
+
+class FakeDatabase:
+    """Simula la consulta rankeada sobre filas en memoria: (id, score)."""
+
+    def __init__(self, fulltext=True, scored=()):
+        self.fulltext = fulltext
+        self.scored = list(scored)
+        self.queries = []
+
+    def execute_scalar(self, sql, params=()):
+        return 1 if self.fulltext else None
+
+    def execute_query(self, sql, params=()):
+        self.queries.append((sql, params))
+        if "AGAINST" not in sql:
+            return []
+        rows = self.scored
+        if "score < %s" in sql:
+            score, _, last_id = params[2:5]
+            rows = [(pid, s) for pid, s in rows if s < score or (s == score and pid < last_id)]
+        rows = sorted(rows, key=lambda row: (row[1], row[0]), reverse=True)[: params[-1]]
+        return [
+            (pid, 1, None, f"Proyecto {pid}", "", f"https://www.workana.com/job/{pid}", score)
+            for pid, score in rows
+        ]
+
+
+def make_db(fake):
+    db = proyectosDatabase.__new__(proyectosDatabase)
+    db._db = fake
+    db._fulltext_index = None
+    return db
+
+
+# Este test valida que los operadores de BOOLEAN MODE (+ - * " ~ @ paréntesis)
+# de una skill no lleguen a la consulta: cada skill queda como término o frase.
+def test_fulltext_query_strips_boolean_operators():
+    build = proyectosDatabase._build_fulltext_query
+
+    assert build(["+python", "-excel*", "(sql)", '"react"', "~vue", "docker@"]) == (
+        "python excel sql react vue docker"
+    )
+    assert build(["asp.net", "microsoft-excel", "Microsoft Excel", "fast~api"]) == (
+        '"asp net" "microsoft excel" "fast api"'
+    )
+
+
+# Este test valida que una skill con palabras más cortas que el mínimo indexado
+# anule la consulta FULLTEXT y que las skills sin palabras se ignoren.
+def test_fulltext_query_rejects_short_and_empty_terms():
+    build = proyectosDatabase._build_fulltext_query
+
+    assert build(["python", "c++"]) is None
+    assert build(["node.js"]) is None
+    assert build(["go"]) is None
+    assert build(["+-", "***"]) is None
+    assert build(["+-", "python"]) == "python"
+
+
+# Este test valida la paginación por clave (score, id): recorrer las páginas
+# devuelve cada proyecto una sola vez aunque varios empaten en score.
+def test_ranked_search_keyset_pagination():
+    scored = [(1, 2.0), (2, 1.5), (3, 1.5), (4, 1.5), (5, 0.5)]
+    db = make_db(FakeDatabase(scored=scored))
+
+    seen = []
+    after = None
+    while True:
+        page = db.search_by_skills_ranked(["python"], limit=2, after=after)
+        if not page:
+            break
+        seen.extend(row["id"] for row in page)
+        after = (page[-1]["score"], page[-1]["id"])
+
+    assert seen == [1, 4, 3, 2, 5]
+    sql, params = db._db.queries[1]
+    assert sql == RANKED_SEARCH_QUERY.format(keyset="WHERE score < %s OR (score = %s AND id < %s)")
+    assert params == ("python", "python", 1.5, 1.5, 4, 2)
+    assert db.search_by_skills_ranked(["c++"]) == []
+
+
+# Este test valida que sin índice FULLTEXT, o con una skill que el índice no
+# puede buscar, se use LIKE con el slug y su variante con espacios.
+def test_search_falls_back_to_like():
+    without_index = make_db(FakeDatabase(fulltext=False))
+    without_index.search_by_skills(["Microsoft-Excel", " "], limit=10)
+
+    sql, params = without_index._db.queries[-1]
+    assert sql == LIKE_SEARCH_QUERY.format(conditions=" OR ".join([LIKE_SEARCH_CONDITION] * 2))
+    assert sorted(params[:-1]) == ["%microsoft excel%", "%microsoft-excel%"]
+    assert params[-1] == 10
+
+    short_skill = make_db(FakeDatabase(fulltext=True))
+    short_skill.search_by_skills(["python", "c++"], limit=5)
+    sql, params = short_skill._db.queries[-1]
+    assert "AGAINST" not in sql
+    assert params == ("%python%", "%c++%", 5)
+
+    assert make_db(FakeDatabase()).search_by_skills(["", "  "]) == []
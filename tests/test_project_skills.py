@@ -0,0 +1,117 @@
+import sys
+from contextlib import contextmanager
+from pathlib import Path
+
+ROOT_DIR = Path(__file__).resolve().parents[1]
+if str(ROOT_DIR) not in sys.path:
+    sys.path.append(str(ROOT_DIR))
+
+from projects_db import proyectosDatabase
+
+
+class FakeDatabase:
+    """Devuelve las skills guardadas y registra las escrituras en orden."""
+
+    def __init__(self, rows):
+        self.rows = rows
+        self.queries = []
+        self.writes = []
+        self.InTransaction = False
+
+    def execute_query(self, sql, params=()):
+        self.queries.append(params)
+        return [row for row in self.rows if row[1] in params]
+
+    def execute_many(self, sql, seq_params):
+        if seq_params:
+            self.writes.append((sql.split()[0], self.InTransaction, list(seq_params)))
+        return True
+
+    @contextmanager
+    def transaction(self):
+        self.InTransaction = True
+        try:
+            yield self
+        finally:
+            self.InTransaction = False
+
+
+def make_db(rows):
+    db = proyectosDatabase.__new__(proyectosDatabase)
+    db._db = FakeDatabase(rows)
+    return db
+
+
+# Este test valida que los proyectos con las mismas skills no escriban nada
+# (un slug vacío equivale al NULL guardado) y que todo se lea en un solo SELECT.
+def test_unchanged_skills_are_skipped():
+    db = make_db(
+        [
+            (1, 10, "Python", "python", "/jobs?skills=python"),
+            (2, 10, "Excel", None, None),
+            (3, 11, "SQL", "sql", None),
+        ]
+    )
+
+    stats = db.replace_skills_for_projects(
+        {
+            10: [
+                {"name": "Python", "slug": "python", "href": "/jobs?skills=python"},
+                {"name": "Excel", "slug": ""},
+            ],
+            11: [{"name": "SQL", "slug": "sql"}],
+        }
+    )
+
+    assert stats == {"inserted": 0, "deleted": 0, "unchanged": 2}
+    assert db._db.queries == [(10, 11)] and db._db.writes == []
+
+
+# Este test valida que se borren las filas repetidas con slug NULL (el índice
+# UNIQUE no las rechaza) aunque el resto de las skills no cambie.
+def test_duplicate_null_slugs_are_cleaned_up():
+    db = make_db([(1, 10, "Excel", None, None), (2, 10, "Excel", None, None), (3, 10, "Excel", "", None)])
+
+    stats = db.replace_skills_for_projects({10: [{"name": "Excel", "slug": None}]})
+
+    assert stats == {"inserted": 0, "deleted": 2, "unchanged": 0}
+    assert db._db.writes == [("DELETE", True, [(2,), (3,)])]
+
+
+# Este test valida que la clave sea (nombre, slug) sin distinguir mayúsculas:
+# un cambio solo de mayúsculas reemplaza la fila en vez de duplicarla.
+def test_case_only_rename_replaces_row():
+    db = make_db([(1, 10, "python", "python", None), (2, 10, "PYTHON", "Python", None)])
+
+    stats = db.replace_skills_for_projects({10: [{"name": "Python", "slug": "python"}]})
+
+    assert stats == {"inserted": 1, "deleted": 2, "unchanged": 0}
+    assert db._db.writes == [
+        ("DELETE", True, [(2,), (1,)]),
+        ("INSERT", True, [(10, "Python", "python", None)]),
+    ]
+
+
+# Este test valida que en una misma transacción se borre primero y después se
+# inserte, para que una skill modificada no choque con la clave UNIQUE.
+def test_deletes_run_before_inserts():
+    db = make_db([(1, 10, "Python", "python", None), (2, 10, "Excel", "excel", None)])
+
+    stats = db.replace_skills_for_projects(
+        {
+            10: [
+                {"name": "Python", "slug": "python", "href": "/jobs?skills=python"},
+                {"name": "SQL", "slug": "sql"},
+            ],
+            12: [{"name": "Go", "slug": "go"}],
+        }
+    )
+
+    assert stats == {"inserted": 3, "deleted": 2, "unchanged": 0}
+    assert [(op, in_tx) for op, in_tx, _ in db._db.writes] == [("DELETE", True), ("INSERT", True)]
+    assert db._db.writes[0][2] == [(1,), (2,)]
+    assert db._db.writes[1][2] == [
+        (10, "Python", "python", "/jobs?skills=python"),
+        (10, "SQL", "sql", None),
+        (12, "Go", "go", None),
+    ]
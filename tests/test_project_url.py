@@ -0,0 +1,46 @@
+import hashlib
+import sys
+from pathlib import Path
+
+ROOT_DIR = Path(__file__).resolve().parents[1]
+if str(ROOT_DIR) not in sys.path:
+    sys.path.append(str(ROOT_DIR))
+
+from project_url import canonicalize_project_url, url_hash
+
+
+# Este test valida que el mismo proyecto con distinto ?ref=, esquema, host,
+# puerto por defecto o barra final tenga una sola forma canónica y por lo tanto el mismo hash.
+def test_job_url_variants_share_canonical_form_and_hash():
+    variants = [
+        "https://www.workana.com/job/bot-telegram?ref=projects_1",
+        "https://www.workana.com/job/bot-telegram?ref=projects_2#descripcion",
+        "http://workana.com/job/bot-telegram/",
+        " HTTPS://WWW.Workana.com:443/job/bot-telegram ",
+        "http://workana.com:443/job/bot-telegram",
+        "http://workana.com:80/job/bot-telegram?ref=projects_3",
+    ]
+
+    canonical = {canonicalize_project_url(u) for u in variants}
+    hashes = {url_hash(u) for u in variants}
+
+    assert canonical == {"https://www.workana.com/job/bot-telegram"}
+    assert len(hashes) == 1
+    assert url_hash(variants[0]) != url_hash("https://www.workana.com/job/otro-proyecto")
+
+
+# Este test valida que fuera de /job/ solo se quiten los parámetros volátiles y
+# que el resto quede ordenado.
+def test_non_job_urls_keep_meaningful_params():
+    url = "https://www.workana.com/jobs?utm_source=x&skills=python&language=es&ref=home"
+    assert canonicalize_project_url(url) == "https://www.workana.com/jobs?language=es&skills=python"
+    assert canonicalize_project_url(None) == ""
+
+
+# Este test valida que el hash sea el mismo que calcula la migración en SQL:
+# UNHEX(LEFT(SHA1(url), 16)).
+def test_url_hash_matches_sql_expression():
+    url = "https://www.workana.com/job/diseño-web"
+    expected = bytes.fromhex(hashlib.sha1(url.encode("utf-8")).hexdigest()[:16])
+    assert url_hash(url) == expected
+    assert len(url_hash(url)) == 8
@@ -0,0 +1,83 @@
+import sys
+from pathlib import Path
+
+ROOT_DIR = Path(__file__).resolve().parents[1]
+if str(ROOT_DIR) not in sys.path:
+    sys.path.append(str(ROOT_DIR))
+
+from project_url import url_hash
+from seen_urls import SeenUrlIndex
+
+
+# Este test valida que el índice reconozca un proyecto guardado aunque la url
+# llegue con otro ?ref=, y que unknown conserve el orden de las nuevas.
+def test_index_matches_canonical_urls():
+    index = SeenUrlIndex()
+    index.add(url_hash("https://www.workana.com/job/bot-telegram"), b"12345678", project_id=10)
+    index.add_url("https://www.workana.com/job/tienda")
+
+    assert "https://www.workana.com/job/bot-telegram?ref=projects_2" in index
+    assert index.MaxId == 10
+    assert index.unknown(
+        [
+            "https://www.workana.com/job/nuevo-b",
+            "https://www.workana.com/job/tienda?ref=projects_1",
+            "https://www.workana.com/job/nuevo-a",
+        ]
+    ) == ["https://www.workana.com/job/nuevo-b", "https://www.workana.com/job/nuevo-a"]
+
+
+# Este test valida que el snapshot comprimido conserve hashes, huellas e id
+# máximo, y que un archivo dañado o inexistente se ignore.
+def test_snapshot_round_trip_and_corrupt_file(tmp_path):
+    index = SeenUrlIndex(source="vps/workana")
+    for i in range(1000):
+        fingerprint = None if i % 2 else i.to_bytes(8, "big")
+        index.add_url(f"https://www.workana.com/job/proyecto-{i}", fingerprint, project_id=i + 1)
+    path = tmp_path / "seen.bin"
+
+    assert index.save(str(path))
+    loaded = SeenUrlIndex.load(str(path))
+
+    assert loaded is not None
+    assert len(loaded) == 1000
+    assert loaded.MaxId == 1000
+    assert loaded.RowCount == 1000
+    assert loaded.Source == "vps/workana"
+    assert "https://www.workana.com/job/proyecto-999" in loaded
+    assert loaded.fingerprint("https://www.workana.com/job/proyecto-998") == (998).to_bytes(8, "big")
+    assert loaded.fingerprint("https://www.workana.com/job/proyecto-999") is None
+    assert path.stat().st_size < 1000 * 16 + 100
+
+    path.write_bytes(b"no es zlib")
+    assert SeenUrlIndex.load(str(path)) is None
+    assert SeenUrlIndex.load(str(tmp_path / "no-existe.bin")) is None
+
+
+# Este test valida que el snapshot solo se acepte para la misma DB: otro
+# origen, un id máximo menor en la tabla (DB restaurada o recreada) o filas
+# borradas/insertadas por debajo de MaxId obligan a reconstruirlo.
+def test_snapshot_identity_detects_other_database():
+    index = SeenUrlIndex(source="vps/workana")
+    for project_id in (3, 5, 9):
+        index.add_url(f"https://www.workana.com/job/p-{project_id}", project_id=project_id)
+    index.add_url("https://www.workana.com/job/recien-guardado")
+
+    assert (index.MaxId, index.RowCount) == (9, 3)
+    assert index.matches_database("vps/workana", 12, 3)
+    assert not index.matches_database("localhost/workana", 12, 3)
+    assert not index.matches_database("vps/workana", 4, 3)
+    assert not index.matches_database("vps/workana", 12, 2)
+    assert not index.matches_database("vps/workana", 12, 4)
+
+
+# Este test valida que el índice solo considere sin cambios a un proyecto con
+# la misma huella guardada, aunque la url llegue con otro ?ref=.
+def test_is_unchanged_compares_fingerprints():
+    url = "https://www.workana.com/job/bot"
+    index = SeenUrlIndex()
+    index.add_url(url)
+    assert not index.is_unchanged(url, b"huella-1")
+    index.add_url(url, b"huella-1")
+    assert index.is_unchanged(url + "?ref=projects_1", b"huella-1")
+    assert not index.is_unchanged(url, b"huella-2")
@@ -0,0 +1,17 @@
+import sys
+from pathlib import Path
+
+ROOT_DIR = Path(__file__).resolve().parents[1]
+if str(ROOT_DIR) not in sys.path:
+    sys.path.append(str(ROOT_DIR))
+
+from skill_index import normalize_skill_value
+
+
+# Este test valida que nombres y slugs de skills se normalicen al mismo slug
+# de Workana (minúsculas, sin espacios extremos, espacios -> guiones).
+def test_normalize_skill_value():
+    assert normalize_skill_value("  Microsoft   Excel ") == "microsoft-excel"
+    assert normalize_skill_value("microsoft-excel") == "microsoft-excel"
+    assert normalize_skill_value("Python") == "python"
+    assert normalize_skill_value("") == ""
@@ -0,0 +1,125 @@
+import importlib
+import sys
+from datetime import datetime
+from pathlib import Path
+
+import pytest
+
+ROOT_DIR = Path(__file__).resolve().parents[1]
+if str(ROOT_DIR) not in sys.path:
+    sys.path.append(str(ROOT_DIR))
+
+from projects_db_manager import SKILL_SCAN_INITIAL_BACKLOG, SKILL_SCAN_WATERMARK, ProjectRepository
+from scan_watermark import ScanWatermarkStore
+
+check_jobs = importlib.import_module("02_check_workana_jobs")
+
+
+class FakeWatermarkDatabase:
+    """Emula la tabla scan_watermarks interpretando el upsert de ScanWatermarkStore."""
+
+    def __init__(self):
+        self.marks = {}
+
+    def execute_non_query(self, sql, params=()):
+        if "INSERT INTO scan_watermarks" in sql:
+            name, last_id = params
+            if "GREATEST" in sql and name in self.marks:
+                last_id = max(self.marks[name], last_id)
+            self.marks[name] = last_id
+        return True
+
+    def execute_query(self, sql, params=()):
+        name = params[0]
+        return [(self.marks[name],)] if name in self.marks else []
+
+
+class FakeProjectsDatabase:
+    def __init__(self, ids, posted_before_ids=()):
+        self.ids = list(ids)
+        self.posted_before_ids = list(posted_before_ids)
+        self.pages = []
+
+    def get_max_project_id(self, posted_before=None):
+        return max(self.posted_before_ids, default=0)
+
+    def get_id_before_latest(self, count):
+        older = self.ids[:-count] if count else self.ids
+        return older[-1] if older else 0
+
+    def get_projects_with_skills_after_id(self, after_id, limit=200):
+        self.pages.append(after_id)
+        return [{"id": pid, "skills": []} for pid in self.ids if pid > after_id][:limit]
+
+
+def make_repo(projects_db, enqueue_ok=True):
+    repo = ProjectRepository.__new__(ProjectRepository)
+    repo._db = projects_db
+    repo._watermarks = ScanWatermarkStore(FakeWatermarkDatabase())
+    repo.enqueued = []
+
+    def enqueue(projects):
+        repo.enqueued.append([p["id"] for p in projects])
+        return enqueue_ok
+
+    repo.enqueue_notifications_for_projects = enqueue
+    return repo
+
+
+@pytest.fixture(autouse=True)
+def no_legacy_state(monkeypatch, tmp_path):
+    monkeypatch.setattr(check_jobs, "STATE_FILE", str(tmp_path / "ultima_revision_skills.log"))
+
+
+# Este test valida que la primera lectura de la marca la inicialice desde el
+# timestamp heredado (o los últimos N proyectos) y la guarde para las siguientes.
+def test_watermark_bootstrap():
+    legacy = make_repo(FakeProjectsDatabase(range(1, 11), posted_before_ids=[1, 2, 3]))
+    assert legacy.get_skill_scan_watermark(legacy_since=datetime(2024, 1, 1)) == 3
+    legacy._db.posted_before_ids = [1, 2, 3, 4, 5]
+    assert legacy.get_skill_scan_watermark(legacy_since=datetime(2024, 1, 1)) == 3
+
+    ids = range(1, SKILL_SCAN_INITIAL_BACKLOG + 6)
+    fresh = make_repo(FakeProjectsDatabase(ids))
+    assert fresh.get_skill_scan_watermark() == 5
+    assert fresh._watermarks.get(SKILL_SCAN_WATERMARK) == 5
+
+
+# Este test valida que la marca nunca retroceda si un proceso atrasado la escribe.
+def test_watermark_never_moves_back():
+    store = ScanWatermarkStore(FakeWatermarkDatabase())
+
+    assert store.get("scan") is None
+    store.advance("scan", 40)
+    store.advance("scan", 25)
+    assert store.get("scan") == 40
+    store.advance("scan", 41)
+    assert store.get("scan") == 41
+
+
+# Este test valida el recorrido por páginas: cada página usa el último id de la
+# anterior y la marca avanza página a página hasta el último proyecto.
+def test_skill_scan_pages_and_advances_watermark():
+    repo = make_repo(FakeProjectsDatabase(range(1, 8)))
+    repo.advance_skill_scan_watermark(2)
+
+    check_jobs.run_user_skill_scan(repo, page_size=2)
+
+    assert repo._db.pages == [2, 4, 6]
+    assert repo.enqueued == [[3, 4], [5, 6], [7]]
+    assert repo._watermarks.get(SKILL_SCAN_WATERMARK) == 7
+
+    check_jobs.run_user_skill_scan(repo, page_size=2)
+    assert repo._db.pages[-1] == 7 and len(repo.enqueued) == 3
+
+
+# Este test valida que si no se pudieron encolar las alertas la marca no avance
+# y la página se vuelva a revisar en la próxima ejecución.
+def test_skill_scan_keeps_watermark_when_enqueue_fails():
+    repo = make_repo(FakeProjectsDatabase(range(1, 8)), enqueue_ok=False)
+    repo.advance_skill_scan_watermark(2)
+
+    check_jobs.run_user_skill_scan(repo, page_size=2)
+
+    assert repo.enqueued == [[3, 4]]
+    assert repo._watermarks.get(SKILL_SCAN_WATERMARK) == 2
@@ -0,0 +1,43 @@
+import sys
+from pathlib import Path
+
+ROOT_DIR = Path(__file__).resolve().parents[1]
+if str(ROOT_DIR) not in sys.path:
+    sys.path.append(str(ROOT_DIR))
+
+from skill_text_matcher import SkillTextMatcher
+
+
+# Este test valida que se detecten slugs y variantes con espacios solo como
+# palabra completa, y que las skills de una letra se ignoren.
+def test_find_matches_whole_words_and_space_variants():
+    matcher = SkillTextMatcher(["python", "Microsoft Excel", "java", "c#", "r", "wordpress"])
+
+    found = matcher.find_in_project(
+        "Automatizar reportes en MICROSOFT   EXCEL con Python",
+        "Sitio en WordPress; no requiere JavaScript ni C#.",
+    )
+
+    assert found == {"python", "microsoft-excel", "wordpress", "c#"}
+    assert matcher.find("microsoft-excel y javascript") == {"microsoft-excel"}
+    assert "r" not in matcher.Skills
+
+
+# Este test valida que el autómata siga los enlaces de falla cuando un patrón
+# contiene a otro (casos típicos de Aho-Corasick).
+def test_find_handles_overlapping_patterns():
+    matcher = SkillTextMatcher(["he", "she", "hers", "his"])
+
+    assert matcher.find("ushers") == set()
+    assert matcher.find("she said hers") == {"she", "hers"}
+    assert matcher.find("") == set()
+
+
+# Este test valida que el autómata se reutilice mientras las skills de los
+# usuarios no cambien, aunque alguna sea de una letra y no entre al autómata.
+def test_for_skills_reuses_matcher_with_short_skills():
+    matcher = SkillTextMatcher.for_skills({"c", "python"})
+
+    assert matcher.Skills == {"python"}
+    assert SkillTextMatcher.for_skills({"python", "c"}, matcher) is matcher
+    assert SkillTextMatcher.for_skills({"python", "r"}, matcher) is not matcher
@@ -0,0 +1,75 @@
+import asyncio
+import json
+import sys
+import time
+from pathlib import Path
+
+import httpx
+
+ROOT_DIR = Path(__file__).resolve().parents[1]
+if str(ROOT_DIR) not in sys.path:
+    sys.path.append(str(ROOT_DIR))
+
+from telegram_delivery import OutgoingMessage, TelegramDeliveryEngine
+
+
+# Este test valida que el motor reintente tras un 429 respetando retry_after,
+# que no reintente errores permanentes (403) y que devuelva un resultado por
+# mensaje en el mismo orden del lote. No usa red: responde un MockTransport.
+def test_send_batch_retries_429_and_keeps_order():
+    calls: dict[int, int] = {}
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        chat_id = json.loads(request.content)["chat_id"]
+        calls[chat_id] = calls.get(chat_id, 0) + 1
+        if chat_id == 1 and calls[chat_id] == 1:
+            return httpx.Response(429, json={"ok": False, "parameters": {"retry_after": 0.05}})
+        if chat_id == 2:
+            return httpx.Response(403, json={"ok": False, "description": "bot was blocked"})
+        return httpx.Response(200, json={"ok": True})
+
+    engine = TelegramDeliveryEngine(
+        token="test-token",
+        global_rate=1000,
+        per_chat_rate=1000,
+        transport=httpx.MockTransport(handler),
+    )
+    messages = [OutgoingMessage(1, "a"), OutgoingMessage(2, "b"), OutgoingMessage(3, "c")]
+
+    results = asyncio.run(engine.send_batch_async(messages))
+
+    assert results == [True, False, True]
+    assert calls == {1: 2, 2: 1, 3: 1}
+
+
+def test_send_batch_without_token_fails_fast(monkeypatch):
+    monkeypatch.delenv("TELEGRAM_BOT_TOKEN", raising=False)
+    monkeypatch.delenv("TELEGRAM_TOKEN", raising=False)
+    engine = TelegramDeliveryEngine()
+
+    assert engine.send_batch([OutgoingMessage(1, "a")]) == [False]
+
+
+# Este test valida que los límites vivan en el motor: dos lotes seguidos al
+# mismo chat respetan el intervalo por chat aunque sean llamadas distintas.
+def test_consecutive_batches_share_per_chat_rate():
+    sent_at: list[float] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        sent_at.append(time.monotonic())
+        return httpx.Response(200, json={"ok": True})
+
+    engine = TelegramDeliveryEngine(
+        token="test-token",
+        global_rate=1000,
+        per_chat_rate=5,
+        transport=httpx.MockTransport(handler),
+    )
+    try:
+        assert engine.send_batch([OutgoingMessage(7, "a")]) == [True]
+        assert engine.send_batch([OutgoingMessage(7, "b")]) == [True]
+    finally:
+        engine.close()
+
+    assert len(sent_at) == 2
+    assert sent_at[1] - sent_at[0] >= 0.18
@@ -0,0 +1,73 @@
+import sys
+from pathlib import Path
+
+ROOT_DIR = Path(__file__).resolve().parents[1]
+if str(ROOT_DIR) not in sys.path:
+    sys.path.append(str(ROOT_DIR))
+
+import user_profile_cache
+from user_profile_cache import UserProfileCache
+from user_skills_model import UserSkills
+
+
+class FakeDatabase:
+    InTransaction = False
+
+    def __init__(self, rows, rowcount=1):
+        self.rows = rows
+        self.rowcount = rowcount
+        self.queries = []
+        self.writes = []
+
+    def execute_query(self, sql, params=()):
+        self.queries.append(sql)
+        return self.rows
+
+    def execute_non_query(self, sql, params=()):
+        self.writes.append(sql)
+        return True
+
+    def execute_rowcount(self, sql, params=()):
+        self.writes.append(sql)
+        return self.rowcount
+
+
+# Este test valida que /agregar seguido de /habilidades haga una sola lectura
+# (el perfil con sus skills) y una sola escritura (el INSERT).
+def test_skills_are_read_once_and_written_through(monkeypatch):
+    monkeypatch.setattr(user_profile_cache, "_profile_cache", UserProfileCache(60))
+    db = FakeDatabase([(7, "ana", 1, "user", "python"), (7, "ana", 1, "user", "Microsoft Excel")])
+
+    skills = UserSkills(42, db)
+    assert skills.GetAll() == ["python", "microsoft-excel"]
+    assert not skills.HasSkill("php")
+    assert skills.Add("php")
+
+    assert UserSkills(42, db).GetAll() == ["python", "microsoft-excel", "php"]
+    assert len(db.queries) == 1
+    assert len(db.writes) == 1
+
+    assert skills.ClearAll()
+    assert UserSkills(42, db).GetAll() == ["python", "microsoft-excel"]  # recargado de la DB
+    assert len(db.queries) == 2
+
+
+# Este test valida que /eliminar solo toque la cache compartida si el DELETE
+# borró la fila; si no encontró nada, la cache queda como estaba.
+def test_remove_updates_cache_only_when_a_row_was_deleted(monkeypatch):
+    monkeypatch.setattr(user_profile_cache, "_profile_cache", UserProfileCache(60))
+    db = FakeDatabase([(7, "ana", 1, "user", "python"), (7, "ana", 1, "user", "php")], rowcount=0)
+    cache = user_profile_cache.get_profile_cache()
+    touched = []
+    monkeypatch.setattr(cache, "remove_skill", lambda *args: touched.append(args))
+    monkeypatch.setattr(cache, "invalidate", lambda *args: touched.append(args))
+
+    skills = UserSkills(42, db)
+    assert skills.Remove("python")
+    assert not skills.HasSkill("python")
+    assert touched == []
+
+    db.rowcount = 1
+    assert skills.Remove("php")
+    assert touched == [(42, "php")]
+    assert len(db.queries) == 1
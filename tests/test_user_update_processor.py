@@ -0,0 +1,45 @@
+import asyncio
+import sys
+from pathlib import Path
+
+ROOT_DIR = Path(__file__).resolve().parents[1]
+if str(ROOT_DIR) not in sys.path:
+    sys.path.append(str(ROOT_DIR))
+
+from telegram import Chat, Message, Update, User
+
+from user_update_processor import PerUserUpdateProcessor
+
+
+def _update(update_id: int, user_id: int) -> Update:
+    user = User(id=user_id, first_name="test", is_bot=False)
+    chat = Chat(id=user_id, type=Chat.PRIVATE)
+    message = Message(message_id=update_id, date=None, chat=chat, from_user=user, text="/habilidades")
+    return Update(update_id=update_id, message=message)
+
+
+# Este test valida que los updates de un mismo usuario se procesen en orden
+# mientras los de otro usuario avanzan en paralelo.
+def test_updates_of_same_user_run_in_order_and_users_run_concurrently():
+    events = []
+
+    async def handler(name: str, delay: float):
+        events.append(f"start {name}")
+        await asyncio.sleep(delay)
+        events.append(f"end {name}")
+
+    async def run():
+        processor = PerUserUpdateProcessor()
+        await asyncio.gather(
+            processor.process_update(_update(1, 10), handler("a1", 0.05)),
+            processor.process_update(_update(2, 10), handler("a2", 0)),
+            processor.process_update(_update(3, 20), handler("b1", 0)),
+        )
+        return processor
+
+    processor = asyncio.run(run())
+
+    # a2 espera a que termine a1; b1 no espera a nadie
+    assert events.index("end a1") < events.index("start a2")
+    assert events.index("end b1") < events.index("end a1")
+    assert processor._locks == {}
@@ -0,0 +1,147 @@
+import sys
+from pathlib import Path
+
+import pytest
+
+ROOT_DIR = Path(__file__).resolve().parents[1]
+if str(ROOT_DIR) not in sys.path:
+    sys.path.append(str(ROOT_DIR))
+
+mariadb = pytest.importorskip("mariadb")
+
+import variables_api_db
+from variables_api_db import VariablesApiController
+
+
+class FakeCursor:
+    def __init__(self, server):
+        self._server = server
+        self._rows = []
+
+    def execute(self, sql, params=()):
+        if self._server.fail:
+            raise mariadb.OperationalError("Lost connection to server during query")
+        self._server.statements.append(sql)
+        if sql.startswith("UPDATE"):
+            value, name = params
+            self._server.variables[name] = value
+        else:
+            self._server.reads += 1
+            self._rows = list(self._server.variables.items())
+
+    def fetchall(self):
+        return self._rows
+
+
+class FakeConnection:
+    def __init__(self, server):
+        self._server = server
+        self.autocommit = False
+        self.closed = False
+
+    def cursor(self):
+        return FakeCursor(self._server)
+
+    def commit(self):
+        pass
+
+    def close(self):
+        self.closed = True
+
+
+class FakeServer:
+    def __init__(self):
+        self.variables = {"general_scraper_enabled": "false"}
+        self.connections = []
+        self.statements = []
+        self.reads = 0
+        self.fail = False
+
+    def connect(self, **config):
+        connection = FakeConnection(self)
+        self.connections.append(connection)
+        return connection
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 500.0
+
+    def monotonic(self):
+        return self.now
+
+
+@pytest.fixture
+def server(monkeypatch):
+    fake = FakeServer()
+    monkeypatch.setattr(variables_api_db.mariadb, "connect", fake.connect)
+    monkeypatch.setattr(VariablesApiController, "_get_configuration", lambda self: {})
+    return fake
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    fake = FakeClock()
+    monkeypatch.setattr(variables_api_db, "time", fake)
+    return fake
+
+
+# Este test valida que las variables se lean con una sola consulta, se sirvan
+# desde la cache durante el TTL y se recarguen al vencer.
+def test_cache_expires_after_ttl(server, clock):
+    controller = VariablesApiController("local", cache_ttl_seconds=30)
+    assert server.connections == []
+
+    assert controller.ScriptMustRun is False
+    server.variables["general_scraper_enabled"] = "true"
+    clock.now += 29
+    assert controller.ScriptMustRun is False and controller.GeneralScraperEnabled is False
+    assert server.reads == 1
+
+    clock.now += 2
+    assert controller.ScriptMustRun is True
+    assert server.reads == 2 and len(server.connections) == 1
+    assert server.connections[0].autocommit
+
+
+# Este test valida que una escritura actualice la cache (sin releer) y que
+# InvalidateCache o una variable no cacheada fuercen la recarga.
+def test_cache_is_updated_or_invalidated_on_write(server, clock):
+    controller = VariablesApiController("local", cache_ttl_seconds=30)
+    assert controller.ScriptMustRun is False
+
+    assert controller.StartScraping()
+    assert controller.ScriptMustRun is True and server.reads == 1
+
+    assert controller._update_execution_variable("maintenance", "true")
+    assert controller.ScriptMustRun is True and server.reads == 2
+
+    server.variables["general_scraper_enabled"] = "false"
+    controller.InvalidateCache()
+    assert controller.ScriptMustRun is False and server.reads == 3
+
+    server.fail = True
+    assert controller.StopScraping() is False
+    server.fail = False
+    assert controller.ScriptMustRun is False and server.reads == 4
+
+
+# Este test valida que IsConnected dependa del resultado de la consulta de
+# variables (sin SELECT 1 aparte) y que tras un fallo se reconecte.
+def test_liveness_follows_the_variables_query(server, clock):
+    controller = VariablesApiController("local", cache_ttl_seconds=30)
+
+    assert controller.IsConnected
+    assert server.statements == ["SELECT name, value FROM variables"]
+    assert controller.ConnectionErrorCode is None
+
+    clock.now += 31
+    server.fail = True
+    assert not controller.IsConnected
+    assert controller.ScriptMustRun is False
+    assert controller.ConnectionErrorCode == "VAR-DB-CONN-001"
+    assert server.connections[0].closed
+
+    server.fail = False
+    assert controller.IsConnected
+    assert not server.connections[-1].closed and controller.ConnectionErrorCode is None
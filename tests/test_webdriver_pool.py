@@ -0,0 +1,82 @@
+import sys
+import threading
+import time
+from pathlib import Path
+
+import pytest
+from selenium.common.exceptions import TimeoutException, WebDriverException
+
+ROOT_DIR = Path(__file__).resolve().parents[1]
+if str(ROOT_DIR) not in sys.path:
+    sys.path.append(str(ROOT_DIR))
+
+import scrape_workana
+from scrape_workana import WebDriverPool
+
+
+class FakeDriver:
+    def __init__(self):
+        self.closed = False
+
+    def quit(self):
+        self.closed = True
+
+
+@pytest.fixture
+def created(monkeypatch):
+    drivers = []
+
+    def create():
+        driver = FakeDriver()
+        drivers.append(driver)
+        return driver
+
+    monkeypatch.setattr(scrape_workana, "CreateFirefoxDriver", create)
+    return drivers
+
+
+# Este test valida que un navegador vuelva al pool tras cada página, que se
+# recicle al llegar a max_page_loads y que un timeout de página no lo descarte.
+def test_reuses_and_recycles_drivers(created):
+    pool = WebDriverPool(size=1, max_page_loads=3)
+
+    with pool.driver() as first:
+        pass
+    with pytest.raises(TimeoutException):
+        with pool.driver() as second:
+            raise TimeoutException("sin tarjetas")
+    assert second is first and not first.closed
+
+    with pool.driver():
+        pass
+    assert first.closed
+    with pool.driver() as third:
+        pass
+    assert third is not first and len(created) == 2
+
+
+# Este test valida que al descartar un navegador roto se despierte al hilo que
+# esperaba uno libre y que ese hilo cree el reemplazo.
+def test_discard_wakes_waiting_thread(created):
+    pool = WebDriverPool(size=1, acquire_timeout=5)
+    busy = pool.acquire()
+    got = []
+    waiter = threading.Thread(target=lambda: got.append(pool.acquire()))
+    waiter.start()
+    time.sleep(0.1)  # el hilo queda esperando: el pool está lleno
+
+    pool.release(busy, discard=True)
+    waiter.join(timeout=2)
+
+    assert not waiter.is_alive()
+    assert busy.closed
+    assert got and got[0] is not busy
+
+
+# Este test valida que acquire no se bloquee para siempre si el pool está lleno.
+def test_acquire_times_out_when_pool_is_busy(created):
+    pool = WebDriverPool(size=1, acquire_timeout=0.05)
+    pool.acquire()
+
+    with pytest.raises(TimeoutError):
+        pool.acquire()
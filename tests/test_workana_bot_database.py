@@ -0,0 +1,372 @@
+import sys
+import threading
+from pathlib import Path
+
+import pytest
+
+ROOT_DIR = Path(__file__).resolve().parents[1]
+if str(ROOT_DIR) not in sys.path:
+    sys.path.append(str(ROOT_DIR))
+
+mariadb = pytest.importorskip("mariadb")
+
+import workana_bot_database_model
+from models import Project
+from projects_db_manager import ProjectRepository
+from seen_urls import SeenUrlIndex
+from workana_bot_database_model import ConnectionPool, WorkanaBotDatabase
+
+
+class FakeCursor:
+    def __init__(self, connection):
+        self._connection = connection
+        self._rows = []
+        self.rowcount = -1
+
+    def execute(self, sql, params=()):
+        if self._connection.closed:
+            raise mariadb.InterfaceError("connection closed")
+        if self._connection.errors:
+            raise self._connection.errors.pop(0)
+        if self._connection.reject is not None and self._connection.reject in params:
+            raise mariadb.Error("Data too long for column")
+        self._connection.statements.append((sql, params))
+        self._rows = [(self._connection.number,)]
+        self.rowcount = 1
+
+    def executemany(self, sql, seq_params):
+        self.execute(sql, seq_params)
+
+    def fetchone(self):
+        return self._rows[0] if self._rows else None
+
+    def fetchall(self):
+        return self._rows
+
+
+class FakeConnection:
+    def __init__(self, number, autocommit=False):
+        self.number = number
+        self.autocommit = autocommit
+        self.closed = False
+        self.alive = True
+        self.pings = 0
+        self.errors = []
+        self.reject = None
+        self.statements = []
+        self.log = []
+
+    def cursor(self):
+        return FakeCursor(self)
+
+    def ping(self):
+        self.pings += 1
+        if not self.alive:
+            raise mariadb.InterfaceError("server has gone away")
+
+    def begin(self):
+        self.log.append("begin")
+
+    def commit(self):
+        self.log.append("commit")
+
+    def rollback(self):
+        self.log.append("rollback")
+
+    def close(self):
+        self.closed = True
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def monotonic(self):
+        return self.now
+
+
+@pytest.fixture
+def connections(monkeypatch):
+    created = []
+
+    def connect(**config):
+        connection = FakeConnection(len(created) + 1, autocommit=config.get("autocommit", False))
+        created.append(connection)
+        return connection
+
+    monkeypatch.setattr(workana_bot_database_model.mariadb, "connect", connect)
+    return created
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    fake = FakeClock()
+    monkeypatch.setattr(workana_bot_database_model, "time", fake)
+    return fake
+
+
+def make_pool(**kwargs):
+    return ConnectionPool({"host": "db"}, **kwargs)
+
+
+def make_db(pool):
+    db = WorkanaBotDatabase()
+    db._pool = pool
+    db._pool_resolved = True
+    return db
+
+
+# Este test valida que el pool reutilice la conexión devuelta (en autocommit) y
+# que solo la valide con ping() si estuvo ociosa más que validation_seconds.
+def test_pool_reuses_and_validates_idle_connections(connections, clock):
+    pool = make_pool(size=2, validation_seconds=1.0)
+
+    first = pool.acquire()
+    assert first.autocommit
+    pool.release(first)
+    assert pool.acquire() is first and first.pings == 0
+    pool.release(first)
+
+    clock.now += 5
+    assert pool.acquire() is first and first.pings == 1
+    pool.release(first)
+
+    clock.now += 5
+    first.alive = False
+    replacement = pool.acquire()
+    assert replacement is not first and first.closed
+    assert pool.OpenConnections == 1
+
+
+# Este test valida que las conexiones ociosas vencidas se cierren y no cuenten
+# contra el tamaño del pool.
+def test_pool_evicts_expired_idle_connections(connections, clock):
+    pool = make_pool(size=1, max_idle_seconds=60)
+    first = pool.acquire()
+    pool.release(first)
+
+    clock.now += 61
+    second = pool.acquire()
+
+    assert first.closed and second is not first
+    assert pool.OpenConnections == 1
+
+
+# Este test valida que acquire devuelva None al agotarse el tiempo si el pool
+# está lleno, y que una conexión devuelta despierte al hilo que espera.
+def test_pool_exhaustion_times_out_and_release_wakes_waiter(connections):
+    pool = make_pool(size=1, timeout_seconds=0.05)
+    busy = pool.acquire()
+    assert pool.acquire() is None
+
+    pool._timeout = 5
+    got = []
+    waiter = threading.Thread(target=lambda: got.append(pool.acquire()))
+    waiter.start()
+    pool.release(busy)
+    waiter.join(timeout=2)
+
+    assert got == [busy]
+
+
+# Este test valida que un fallo al conectar libere el cupo reservado en el pool.
+def test_pool_frees_slot_when_connect_fails(monkeypatch):
+    def connect(**config):
+        raise mariadb.Error("access denied")
+
+    monkeypatch.setattr(workana_bot_database_model.mariadb, "connect", connect)
+    pool = make_pool(size=1, timeout_seconds=0.05)
+
+    assert pool.acquire() is None
+    assert pool.OpenConnections == 0
+
+
+# Este test valida que _run reintente una vez con otra conexión si la prestada
+# estaba caída, descartando la rota del pool.
+def test_run_retries_once_on_lost_connection(connections):
+    pool = make_pool(size=2)
+    db = make_db(pool)
+    stale = pool.acquire()
+    stale.errors.append(mariadb.InterfaceError("server has gone away"))
+    pool.release(stale)
+
+    assert db.execute_scalar("SELECT 1") == 2
+    assert stale.closed
+    assert pool.OpenConnections == 1 and pool._idle[0][0] is connections[1]
+
+
+# Este test valida que _run no reintente errores de SQL y devuelva la conexión
+# sana al pool.
+def test_run_does_not_retry_sql_errors(connections):
+    pool = make_pool(size=2)
+    db = make_db(pool)
+    connection = pool.acquire()
+    connection.errors.append(mariadb.Error("syntax error"))
+    pool.release(connection)
+
+    with pytest.raises(mariadb.Error):
+        db.execute_query("SELEC 1")
+    assert not connection.closed and len(connections) == 1
+
+
+# Este test valida que el reintento sea uno solo: si la conexión nueva también
+# está caída, el error se propaga y ambas se descartan.
+def test_run_retries_only_once(connections, monkeypatch):
+    pool = make_pool(size=2)
+    db = make_db(pool)
+    fake_connect = workana_bot_database_model.mariadb.connect
+
+    def connect_broken(**config):
+        connection = fake_connect(**config)
+        connection.errors.append(mariadb.InterfaceError("server has gone away"))
+        return connection
+
+    monkeypatch.setattr(workana_bot_database_model.mariadb, "connect", connect_broken)
+
+    assert db.execute_non_query("UPDATE t SET x = 1") is False
+    assert len(connections) == 2 and all(c.closed for c in connections)
+    assert pool.OpenConnections == 0
+
+
+# Este test valida que una conexión reservada con connect() se reemplace si se
+# cae, y que la instancia siga con la nueva reservada.
+def test_run_replaces_held_connection(connections):
+    db = make_db(make_pool(size=2))
+    db.connect()
+    held = db._connection
+    held.errors.append(mariadb.InterfaceError("server has gone away"))
+
+    assert db.execute_scalar("SELECT 1") == 2
+    assert held.closed and db._connection is connections[1]
+    db.disconnect()
+
+
+# Este test valida que la transacción haga un único commit sobre una sola
+# conexión y la devuelva al pool al salir.
+def test_transaction_commits_once(connections):
+    pool = make_pool(size=2)
+    db = make_db(pool)
+
+    with db.transaction() as tx:
+        assert db.InTransaction
+        assert db.execute_non_query("INSERT INTO t VALUES (%s)", (1,))
+        assert tx.execute_many("INSERT INTO t VALUES (%s)", [(2,), (3,)])
+
+    connection, = connections
+    assert tx.IsCommitted and not db.InTransaction
+    assert connection.log == ["begin", "commit"]
+    assert len(connection.statements) == 2
+    assert pool._idle[0][0] is connection
+
+
+# Este test valida que una escritura fallida marque la transacción: las
+# siguientes se omiten y al salir se hace rollback en lugar de commit.
+def test_transaction_rolls_back_after_failed_write(connections):
+    db = make_db(make_pool(size=2))
+
+    with db.transaction() as tx:
+        db.execute_non_query("INSERT INTO t VALUES (%s)", (1,))
+        connections[0].errors.append(mariadb.Error("Duplicate entry"))
+        assert db.execute_non_query("INSERT INTO t VALUES (%s)", (2,)) is False
+        assert db.execute_non_query("INSERT INTO t VALUES (%s)", (3,)) is False
+
+    assert tx.IsFailed and not tx.IsCommitted
+    assert connections[0].log == ["begin", "rollback"]
+    assert len(connections[0].statements) == 1
+
+
+# Este test valida que una excepción dentro del bloque haga rollback y se propague.
+def test_transaction_rolls_back_on_exception(connections):
+    db = make_db(make_pool(size=2))
+
+    with pytest.raises(RuntimeError):
+        with db.transaction() as tx:
+            db.execute_non_query("INSERT INTO t VALUES (%s)", (1,))
+            raise RuntimeError("fallo de la aplicación")
+
+    assert tx.IsFailed and connections[0].log == ["begin", "rollback"]
+
+
+# Este test valida que una transacción anidada se una a la exterior: un solo
+# begin/commit, y un fallo adentro deshace también lo escrito afuera.
+def test_nested_transaction_joins_outer(connections):
+    db = make_db(make_pool(size=2))
+
+    with db.transaction() as outer:
+        with db.transaction() as inner:
+            assert inner is outer
+            db.execute_non_query("INSERT INTO t VALUES (%s)", (1,))
+        assert db.InTransaction
+    assert outer.IsCommitted and connections[0].log == ["begin", "commit"]
+
+    with db.transaction() as outer:
+        db.execute_non_query("INSERT INTO t VALUES (%s)", (1,))
+        with db.transaction():
+            connections[0].errors.append(mariadb.Error("Deadlock found"))
+            db.execute_non_query("INSERT INTO t VALUES (%s)", (2,))
+    assert not outer.IsCommitted
+    assert connections[0].log[-2:] == ["begin", "rollback"]
+
+
+# Este test valida que sin conexión la transacción nazca fallida y lo indique.
+def test_transaction_without_connection(monkeypatch):
+    def connect(**config):
+        raise mariadb.Error("Can't connect")
+
+    monkeypatch.setattr(workana_bot_database_model.mariadb, "connect", connect)
+    db = make_db(make_pool(size=1, timeout_seconds=0.05))
+
+    with db.transaction() as tx:
+        assert db.execute_non_query("INSERT INTO t VALUES (%s)", (1,)) is False
+
+    assert not tx.HasConnection and not tx.IsCommitted
+
+
+class FakeProjectsDatabase:
+    """Escribe cada proyecto con la transacción real de WorkanaBotDatabase."""
+
+    def __init__(self, db):
+        self._db = db
+
+    def transaction(self):
+        return self._db.transaction()
+
+    def upsert_many(self, items):
+        for item in items:
+            self._db.execute_non_query(
+                "INSERT INTO projects (title, url) VALUES (%s, %s)", (item["title"], item["url"])
+            )
+        return {item["url"]: n for n, item in enumerate(items, start=1)}
+
+    def replace_skills_for_projects(self, skills_by_project):
+        return {}
+
+
+# Este test valida que si el lote hace rollback por un proyecto inválido, el
+# reintento por proyecto guarde el resto y solo omita el que falla.
+def test_save_retries_project_by_project_after_rollback(connections):
+    pool = make_pool(size=1)
+    pool.release(pool.acquire())
+    connections[0].reject = "malo"
+    repo = ProjectRepository.__new__(ProjectRepository)
+    repo._db = FakeProjectsDatabase(make_db(pool))
+    repo._seen_urls = SeenUrlIndex()
+    projects = [
+        Project("Bot", "d", "https://www.workana.com/job/bot", []),
+        Project("malo", "d", "https://www.workana.com/job/malo", []),
+        Project("Web", "d", "https://www.workana.com/job/web", []),
+    ]
+    fingerprints = {p.Url: p.ContentHash for p in projects}
+
+    assert repo._save_projects_bulk(projects, fingerprints) == 2
+
+    # Lote completo (rollback) y luego un proyecto por transacción
+    assert connections[0].log == [
+        "begin", "rollback",
+        "begin", "commit",
+        "begin", "rollback",
+        "begin", "commit",
+    ]
+    assert "https://www.workana.com/job/bot" in repo._seen_urls
+    assert "https://www.workana.com/job/web" in repo._seen_urls
+    assert "https://www.workana.com/job/malo" not in repo._seen_urls
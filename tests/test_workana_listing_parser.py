@@ -0,0 +1,77 @@
+import sys
+from pathlib import Path
+
+ROOT_DIR = Path(__file__).resolve().parents[1]
+if str(ROOT_DIR) not in sys.path:
+    sys.path.append(str(ROOT_DIR))
+
+from workana_listing_parser import parse_listing_html, projects_from_card_payload
+
+
+LISTING_HTML = """
+<div id="projects">
+  <div class="project-item js-project">
+    <h2 class="project-title"><a href="/job/tienda-woocommerce?ref=projects_1">Tienda WooCommerce</a></h2>
+    <div class="html-desc project-details"><p>Necesito una tienda.</p><p>Con pagos.</p></div>
+    <div class="skills">
+      <a class="skill" href="/jobs?skills=woocommerce"><h3>WooCommerce</h3></a>
+      <a class="skill" href="/jobs?skills=php"><h3> PHP </h3></a>
+    </div>
+  </div>
+  <div class="project-item js-project">
+    <h2 class="project-title"></h2>
+    <a href="/job/sin-titulo">sin título</a>
+  </div>
+  <div class="project-item js-project">
+    <h2 class="project-title">Sin enlace</h2>
+  </div>
+</div>
+"""
+
+
+# Este test valida que el parser sin navegador convierta las tarjetas del
+# listado en Project/Skill, descartando tarjetas sin título o sin enlace.
+def test_parse_listing_html_builds_projects():
+    projects = parse_listing_html(LISTING_HTML, base_url="https://www.workana.com/jobs?language=es")
+
+    assert projects is not None
+    assert len(projects) == 1
+    project = projects[0]
+    assert project.Title == "Tienda WooCommerce"
+    assert project.Url == "https://www.workana.com/job/tienda-woocommerce"
+    assert project.Description == "Necesito una tienda.\nCon pagos."
+    assert [s["slug"] for s in project.Skills] == ["woocommerce", "php"]
+    assert project.Skills[1]["name"] == "PHP"
+    assert project.Skills[0]["href"] == "https://www.workana.com/jobs?skills=woocommerce"
+
+
+def test_parse_listing_html_without_cards_returns_none():
+    assert parse_listing_html("<html><body><div id='app'></div></body></html>") is None
+
+
+# Este test valida la conversión del JSON que devuelve la extracción en página
+# de Selenium (un solo execute_script) a Project/Skill.
+def test_projects_from_card_payload():
+    cards = [
+        {
+            "title": " Bot de Telegram ",
+            "desc": "Bot en Python.\n",
+            "href": "https://www.workana.com/job/bot-telegram?ref=projects_2",
+            "skills": [
+                {"name": "Python", "href": "https://www.workana.com/jobs?skills=python"},
+                {"name": "", "href": "https://www.workana.com/jobs?skills=vacia"},
+            ],
+        },
+        {"title": "", "desc": "", "href": "/job/x", "skills": []},
+        {"title": "Sin enlace", "desc": "", "href": "", "skills": []},
+    ]
+
+    projects = projects_from_card_payload(cards)
+
+    assert len(projects) == 1
+    assert projects[0].Title == "Bot de Telegram"
+    assert projects[0].Url == "https://www.workana.com/job/bot-telegram"
+    assert projects[0].Description == "Bot en Python."
+    assert projects[0].Skills == [
+        {"name": "Python", "slug": "python", "href": "https://www.workana.com/jobs?skills=python"}
+    ]
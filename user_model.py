@@ -1,3 +1,4 @@
+from user_profile_cache import get_profile_cache, load_user_profile
 from workana_bot_database_model import WorkanaBotDatabase
 
 class User:
@@ -11,13 +12,15 @@ class User:
         self._LoadUserData()
 
     def _LoadUserData(self):
-        Query = "SELECT username, active, role FROM bot_users WHERE telegram_user_id = ?"
-        Result = self._db.execute_query(Query, (self.UserID,))
-        if Result:
-            self.Username = Result[0][0]
+        Profile = load_user_profile(self.UserID, self._db)
+        if Profile.IsRegistered:
+            self.Username = Profile.Username
             self._IsRegistered = True
-            self._IsActivated = bool(Result[0][1])
-            self.Role = Result[0][2] or "user"
+            self._IsActivated = Profile.Active
+            self.Role = Profile.Role
+
+    def _InvalidateProfile(self) -> None:
+        get_profile_cache().invalidate(self.UserID)
 
     @property
     def IsRegistered(self) -> bool:
@@ -42,6 +45,7 @@ class User:
             )
             Success = self._db.execute_non_query(Query, (Username, self.UserID))
             if Success:
+                self._InvalidateProfile()
                 self.Username = Username
                 self._IsActivated = True
             return Success
@@ -49,6 +53,7 @@ class User:
         Query = "INSERT INTO bot_users (telegram_user_id, username) VALUES (?, ?)"
         Success = self._db.execute_non_query(Query, (self.UserID, Username))
         if Success:
+            self._InvalidateProfile()
             self.Username = Username
             self._IsRegistered = True
             self._IsActivated = False
@@ -60,6 +65,7 @@ class User:
         Query = "UPDATE bot_users SET active = TRUE WHERE telegram_user_id = ?"
         Success = self._db.execute_non_query(Query, (self.UserID,))
         if Success:
+            self._InvalidateProfile()
             self._IsActivated = True
         return Success
 
@@ -69,6 +75,7 @@ class User:
         Query = "UPDATE bot_users SET active = FALSE WHERE telegram_user_id = ?"
         Success = self._db.execute_non_query(Query, (self.UserID,))
         if Success:
+            self._InvalidateProfile()
             self._IsActivated = False
         return Success
 
@@ -80,6 +87,7 @@ class User:
         Query = "UPDATE bot_users SET active = FALSE WHERE telegram_user_id = ?"
         Success = self._db.execute_non_query(Query, (self.UserID,))
         if Success:
+            self._InvalidateProfile()
             self._IsActivated = False
         return Success
 
@@ -89,6 +97,7 @@ class User:
         Query = "DELETE FROM bot_users WHERE telegram_user_id = ?"
         Success = self._db.execute_non_query(Query, (self.UserID,))
         if Success:
+            self._InvalidateProfile()
             self._IsRegistered = False
             self._IsActivated = False
             self.Username = None
@@ -0,0 +1,142 @@
+# user_profile_cache.py
+"""Cache en memoria del perfil de cada usuario del bot.
+
+Un comando típico (/agregar, /habilidades, /eliminar_habilidad) necesitaba el
+id interno del usuario, saber si ya tenía una skill y volver a listar todas sus
+skills: tres o cuatro SELECT por mensaje. El perfil (id, username, rol, activo
+y skills) se carga con una sola consulta y queda en cache por
+telegram_user_id; los modelos User y UserSkills leen de acá y actualizan o
+invalidan la entrada cuando escriben.
+"""
+import os
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Tuple
+
+from config.env import load_environment
+from skill_index import normalize_skill_value
+from workana_bot_database_model import WorkanaBotDatabase
+
+DEFAULT_PROFILE_TTL_SECONDS = 60.0
+
+PROFILE_QUERY = (
+    "SELECT u.id, u.username, u.active, u.role, us.skill_slug "
+    "FROM bot_users u "
+    "LEFT JOIN user_skills us ON us.user_id = u.id "
+    "WHERE u.telegram_user_id = ? "
+    "ORDER BY us.id"
+)
+
+
+@dataclass
+class UserProfile:
+    TelegramUserID: int
+    DbID: Optional[int] = None
+    Username: Optional[str] = None
+    Role: str = "user"
+    Active: bool = False
+    Skills: List[str] = field(default_factory=list)
+
+    @property
+    def IsRegistered(self) -> bool:
+        return self.DbID is not None
+
+    @classmethod
+    def from_rows(cls, telegram_user_id: int, rows: list) -> "UserProfile":
+        """Arma el perfil desde las filas de PROFILE_QUERY (una por skill)."""
+        if not rows:
+            return cls(telegram_user_id)
+        db_id, username, active, role, _ = rows[0]
+        skills: List[str] = []
+        for row in rows:
+            slug = normalize_skill_value(row[4]) if row[4] else ""
+            if slug and slug not in skills:
+                skills.append(slug)
+        return cls(
+            telegram_user_id,
+            DbID=int(db_id),
+            Username=username,
+            Role=role or "user",
+            Active=bool(active),
+            Skills=skills,
+        )
+
+
+class UserProfileCache:
+    def __init__(self, ttl_seconds: float = DEFAULT_PROFILE_TTL_SECONDS):
+        self._ttl = ttl_seconds
+        self._entries: Dict[int, Tuple[float, UserProfile]] = {}
+        self._lock = threading.Lock()
+
+    def get(self, telegram_user_id: int) -> Optional[UserProfile]:
+        with self._lock:
+            entry = self._entries.get(telegram_user_id)
+            if entry is None:
+                return None
+            expires_at, profile = entry
+            if time.monotonic() >= expires_at:
+                del self._entries[telegram_user_id]
+                return None
+            return profile
+
+    def put(self, profile: UserProfile) -> None:
+        # Solo se guardan usuarios registrados: un resultado vacío también puede
+        # ser un error de conexión y no conviene recordarlo.
+        if not profile.IsRegistered or self._ttl <= 0:
+            return
+        with self._lock:
+            self._entries[profile.TelegramUserID] = (time.monotonic() + self._ttl, profile)
+
+    def add_skill(self, telegram_user_id: int, skill_slug: str) -> None:
+        with self._lock:
+            entry = self._entries.get(telegram_user_id)
+            if entry is not None and skill_slug not in entry[1].Skills:
+                entry[1].Skills.append(skill_slug)
+
+    def remove_skill(self, telegram_user_id: int, skill_slug: str) -> None:
+        with self._lock:
+            entry = self._entries.get(telegram_user_id)
+            if entry is not None and skill_slug in entry[1].Skills:
+                entry[1].Skills.remove(skill_slug)
+
+    def invalidate(self, telegram_user_id: int) -> None:
+        with self._lock:
+            self._entries.pop(telegram_user_id, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+_profile_cache: Optional[UserProfileCache] = None
+_profile_cache_lock = threading.Lock()
+
+
+def get_profile_cache() -> UserProfileCache:
+    """Cache compartido por el proceso; TTL configurable con USER_PROFILE_CACHE_TTL_SECONDS."""
+    global _profile_cache
+    with _profile_cache_lock:
+        if _profile_cache is None:
+            load_environment()
+            try:
+                ttl = float(os.getenv("USER_PROFILE_CACHE_TTL_SECONDS", DEFAULT_PROFILE_TTL_SECONDS))
+            except ValueError:
+                ttl = DEFAULT_PROFILE_TTL_SECONDS
+            _profile_cache = UserProfileCache(ttl)
+        return _profile_cache
+
+
+def load_user_profile(telegram_user_id: int, database: WorkanaBotDatabase) -> UserProfile:
+    """Devuelve el perfil desde la cache o con una única consulta a la DB."""
+    cache = get_profile_cache()
+    profile = cache.get(telegram_user_id)
+    if profile is not None:
+        return profile
+
+    rows = database.execute_query(PROFILE_QUERY, (telegram_user_id,))
+    profile = UserProfile.from_rows(telegram_user_id, rows or [])
+    # Dentro de una transacción se podrían leer datos que después se descartan
+    if not database.InTransaction:
+        cache.put(profile)
+    return profile
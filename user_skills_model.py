@@ -1,4 +1,5 @@
 # user_skills_model.py
+from user_profile_cache import get_profile_cache, load_user_profile
 from workana_bot_database_model import WorkanaBotDatabase
 
 
@@ -13,17 +14,16 @@ class UserSkills:
         self._db = Database if Database is not None else WorkanaBotDatabase()
         self._user_db_id: int | None = None
         self._is_registered = False
+        self._skills: list[str] = []
         self._load_user_db_id()
 
     def _load_user_db_id(self) -> None:
-        """Cache the bot_users.id linked to the telegram user (if any)."""
-        result = self._db.execute_query(
-            "SELECT id FROM bot_users WHERE telegram_user_id = ? LIMIT 1",
-            (self.UserID,),
-        )
-        if result:
-            self._user_db_id = int(result[0][0])
+        """Load bot_users.id and current skills from the shared profile cache."""
+        profile = load_user_profile(self.UserID, self._db)
+        if profile.IsRegistered:
+            self._user_db_id = profile.DbID
             self._is_registered = True
+            self._skills = list(profile.Skills)
 
     @property
     def is_registered(self) -> bool:
@@ -38,12 +38,7 @@ class UserSkills:
         return "-".join(skill.strip().lower().split()) if skill else ""
 
     def _exists(self, skill_slug: str) -> bool:
-        user_db_id = self._require_user_id()
-        if user_db_id is None:
-            return False
-        Query = "SELECT 1 FROM user_skills WHERE user_id = ? AND skill_slug = ? LIMIT 1"
-        Result = self._db.execute_query(Query, (user_db_id, skill_slug))
-        return bool(Result)
+        return skill_slug in self._skills
 
     def HasSkill(self, skill: str) -> bool:
         skill_slug = self.normalize_skill(skill)
@@ -53,14 +48,7 @@ class UserSkills:
 
     def GetAll(self) -> list[str]:
         """Returns all skills for the user (normalized)."""
-        user_db_id = self._require_user_id()
-        if user_db_id is None:
-            return []
-        Query = "SELECT skill_slug FROM user_skills WHERE user_id = ?"
-        Result = self._db.execute_query(Query, (user_db_id,))
-        if not Result:
-            return []
-        return [self.normalize_skill(row[0]) for row in Result if row and row[0]]
+        return list(self._skills)
 
     def Add(self, skill: str) -> bool:
         """Add a skill to the user (normalized)."""
@@ -72,8 +60,16 @@ class UserSkills:
             return False
         if self._exists(skill_slug):
             return True
-        Query = "INSERT INTO user_skills (user_id, skill_slug) VALUES (?, ?)"
-        return self._db.execute_non_query(Query, (user_db_id, skill_slug))
+        # IGNORE: si la cache estaba desactualizada, uniq_user_skill evita el duplicado
+        Query = "INSERT IGNORE INTO user_skills (user_id, skill_slug) VALUES (?, ?)"
+        Success = self._db.execute_non_query(Query, (user_db_id, skill_slug))
+        if Success:
+            self._skills.append(skill_slug)
+            if self._db.InTransaction:
+                get_profile_cache().invalidate(self.UserID)
+            else:
+                get_profile_cache().add_skill(self.UserID, skill_slug)
+        return Success
 
     def Remove(self, skill: str) -> bool:
         """Remove a specific skill from the user."""
@@ -84,7 +80,18 @@ class UserSkills:
         if not skill_slug:
             return False
         Query = "DELETE FROM user_skills WHERE user_id = ? AND skill_slug = ?"
-        return self._db.execute_non_query(Query, (user_db_id, skill_slug))
+        Deleted = self._db.execute_rowcount(Query, (user_db_id, skill_slug))
+        if Deleted is None:
+            return False
+        if skill_slug in self._skills:
+            self._skills.remove(skill_slug)
+        # Si el DELETE no encontró la fila la cache compartida no cambia
+        if Deleted > 0:
+            if self._db.InTransaction:
+                get_profile_cache().invalidate(self.UserID)
+            else:
+                get_profile_cache().remove_skill(self.UserID, skill_slug)
+        return True
 
     def ClearAll(self) -> bool:
         """Remove all skills for the user."""
@@ -92,7 +99,11 @@ class UserSkills:
         if user_db_id is None:
             return False
         Query = "DELETE FROM user_skills WHERE user_id = ?"
-        return self._db.execute_non_query(Query, (user_db_id,))
+        Success = self._db.execute_non_query(Query, (user_db_id,))
+        if Success:
+            self._skills = []
+            get_profile_cache().invalidate(self.UserID)
+        return Success
 
     @staticmethod
     def GetAllUsersSkills(Database: WorkanaBotDatabase) -> list[tuple[int, str]]:
@@ -1,9 +1,11 @@
 # config_variables_api_db.py
 import os
+import threading
+import time
 
 import mariadb
 
-import config.env
+from config.env import load_environment
 from local_o_vps import entorno
 
 
@@ -11,7 +13,18 @@ def parse_boolean_value(value: object) -> bool:
     """Normaliza valores booleanos guardados como texto/número."""
     return str(value).strip().lower() in ["1", "true", "t", "yes"]
 
+DEFAULT_VARIABLES_CACHE_TTL_SECONDS = 30.0
+
+
+def _get_cache_ttl() -> float:
+    load_environment()
+    try:
+        return float(os.getenv("VARIABLES_CACHE_TTL_SECONDS", DEFAULT_VARIABLES_CACHE_TTL_SECONDS))
+    except ValueError:
+        return DEFAULT_VARIABLES_CACHE_TTL_SECONDS
+
 def _require_env(name: str, *, allow_empty: bool = False) -> str:
+    load_environment()
     value = os.getenv(name)
     if value is None:
         raise ValueError(f"Missing required environment variable: {name}")
@@ -21,12 +34,24 @@ def _require_env(name: str, *, allow_empty: bool = False) -> str:
 
 
 class VariablesApiController:
-    def __init__(self, environment: str):
+    """Lee y actualiza los flags de la tabla `variables`.
+
+    Todas las variables se cargan con una sola consulta y quedan en cache
+    durante VARIABLES_CACHE_TTL_SECONDS. La conexión se considera viva según el
+    resultado de la última consulta real, sin un SELECT 1 extra por chequeo, y
+    se abre recién en la primera consulta.
+    """
+
+    def __init__(self, environment: str, cache_ttl_seconds: float | None = None):
         self._environment = environment
         self._connection = None
         self._connection_error = None
         self._connection_error_code = None
-        self._connect()
+        self._cache_ttl = _get_cache_ttl() if cache_ttl_seconds is None else cache_ttl_seconds
+        self._variables: dict[str, str] | None = None
+        self._variables_loaded_at = 0.0
+        # Los handlers del bot usan el controlador desde varios threads
+        self._lock = threading.RLock()
 
     def _get_configuration(self) -> dict:
         host = _require_env("DB_HOST")
@@ -46,6 +71,8 @@ class VariablesApiController:
         """Intentar conectar con la base de datos evitando romper la ejecución."""
         try:
             self._connection = mariadb.connect(**self._get_configuration())
+            # Sin autocommit cada SELECT vería la foto de la primera transacción
+            self._connection.autocommit = True
             self._connection_error_code = None
             return self._connection
         except mariadb.Error as e:
@@ -55,25 +82,62 @@ class VariablesApiController:
             print(f"⚠️ No se pudo conectar a la base de datos de variables: {e}")
             return None
 
-    def _get_boolean_variable(self, name: str, *, default_if_missing: bool = False) -> bool:
+    def _mark_query_failed(self, error: mariadb.Error) -> None:
+        """Una consulta fallida deja la conexión descartada; se reintenta en el próximo refresh."""
+        self._connection_error = error
+        self._connection_error_code = "VAR-DB-CONN-001"
+        if self._connection:
+            try:
+                self._connection.close()
+            except mariadb.Error:
+                pass
+        self._connection = None
+
+    def _cache_is_fresh(self) -> bool:
+        return (
+            self._variables is not None
+            and time.monotonic() - self._variables_loaded_at < self._cache_ttl
+        )
+
+    def _refresh_variables(self) -> bool:
+        if not self._connection and not self._connect():
+            return False
         try:
-            if not self._connection:
-                return False
             cursor = self._connection.cursor()
-            cursor.execute("SELECT value FROM variables WHERE name = ? LIMIT 1", (name,))
-            result = cursor.fetchone()
-            if result:
-                return parse_boolean_value(result[0])
-            print(
-                "⚠️ La variable '{name}' no existe en la base de variables; se asume {value}.".format(
-                    name=name,
-                    value="True" if default_if_missing else "False",
-                )
-            )
-            return default_if_missing
+            cursor.execute("SELECT name, value FROM variables")
+            rows = cursor.fetchall()
         except mariadb.Error as e:
-            print(f"❌ Error al consultar la variable '{name}': {e}")
+            print(f"❌ Error al consultar la tabla de variables: {e}")
+            self._mark_query_failed(e)
             return False
+        self._variables = {str(name): value for name, value in rows}
+        self._variables_loaded_at = time.monotonic()
+        return True
+
+    def _get_variables(self) -> dict[str, str] | None:
+        """Variables desde la cache o recargadas; None si la última consulta falló."""
+        with self._lock:
+            if not self._cache_is_fresh() and not self._refresh_variables():
+                return None
+            return self._variables
+
+    def InvalidateCache(self) -> None:
+        with self._lock:
+            self._variables = None
+
+    def _get_boolean_variable(self, name: str, *, default_if_missing: bool = False) -> bool:
+        variables = self._get_variables()
+        if variables is None:
+            return False
+        if name in variables:
+            return parse_boolean_value(variables[name])
+        print(
+            "⚠️ La variable '{name}' no existe en la base de variables; se asume {value}.".format(
+                name=name,
+                value="True" if default_if_missing else "False",
+            )
+        )
+        return default_if_missing
 
     @property
     def ScriptMustRun(self) -> bool:
@@ -86,14 +150,8 @@ class VariablesApiController:
 
     @property
     def IsConnected(self) -> bool:
-        try:
-            if self._connection:
-                cursor = self._connection.cursor()
-                cursor.execute("SELECT 1")
-                return True
-            return False
-        except mariadb.Error:
-            return False
+        # Si la cache venció se recarga: esa consulta es la que confirma la conexión
+        return self._get_variables() is not None
 
     @property
     def ConnectionErrorCode(self) -> str | None:
@@ -112,24 +170,33 @@ class VariablesApiController:
         return self._update_execution_variable("general_scraper_enabled", "false")
 
     def _update_execution_variable(self, name: str, value: str) -> bool:
-        if not self._connection:
-            print("⚠️ No hay conexión a la base de datos para actualizar la variable.")
-            return False
-        try:
-            cursor = self._connection.cursor()
-            cursor.execute(
-                "UPDATE variables SET value = ? WHERE name = ?",
-                (value, name),
-            )
-            self._connection.commit()
+        with self._lock:
+            if not self._connection and not self._connect():
+                print("⚠️ No hay conexión a la base de datos para actualizar la variable.")
+                return False
+            try:
+                cursor = self._connection.cursor()
+                cursor.execute(
+                    "UPDATE variables SET value = ? WHERE name = ?",
+                    (value, name),
+                )
+                self._connection.commit()
+            except mariadb.Error as e:
+                print(f"❌ Error al actualizar la variable '{name}': {e}")
+                self._mark_query_failed(e)
+                self._variables = None
+                return False
+            if self._variables is not None and name in self._variables:
+                self._variables[name] = value
+            else:
+                self._variables = None
             return True
-        except mariadb.Error as e:
-            print(f"❌ Error al actualizar la variable '{name}': {e}")
-            return False
 
     def CloseConnection(self):
-        if self._connection:
-            self._connection.close()
+        with self._lock:
+            if self._connection:
+                self._connection.close()
+                self._connection = None
 
 if __name__ == "__main__":
     controller = VariablesApiController(entorno)
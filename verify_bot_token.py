@@ -2,7 +2,9 @@
 import asyncio
 import os
 from telegram import Bot
-import config.env
+from config.env import load_environment
+
+load_environment()
 
 # Token from environment variables
 TOKEN: str = os.getenv("TELEGRAM_BOT_TOKEN") or os.getenv("TELEGRAM_TOKEN") or ""
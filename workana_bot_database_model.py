@@ -1,14 +1,27 @@
 # monitor_workana/config_workana_bot_db.py
 
 import os
-from typing import Any
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Iterator, Sequence
 
 import mariadb
 
-import config.env
+from config.env import load_environment
+
+
+DEFAULT_POOL_SIZE = 5
+DEFAULT_POOL_TIMEOUT_SECONDS = 10.0
+DEFAULT_POOL_MAX_IDLE_SECONDS = 300.0
+DEFAULT_POOL_VALIDATION_SECONDS = 1.0
+
+# Códigos de cliente que indican que la conexión se perdió (server gone away, etc.)
+_CONNECTION_LOST_ERRNOS = {2006, 2013, 2055}
 
 
 def _require_env(name: str, *, allow_empty: bool = False) -> str:
+    load_environment()
     value = os.getenv(name)
     if value is None:
         raise ValueError(f"Missing required environment variable: {name}")
@@ -16,14 +29,294 @@ def _require_env(name: str, *, allow_empty: bool = False) -> str:
         raise ValueError(f"Missing required environment variable: {name}")
     return value
 
+
+def _env_number(name: str, default: float) -> float:
+    load_environment()
+    value = os.getenv(name)
+    if value is None or value.strip() == "":
+        return default
+    try:
+        return float(value)
+    except ValueError:
+        print(f"⚠️ Valor inválido para {name}: {value!r}; se usa {default}.")
+        return default
+
+
+def _is_connection_error(error: Exception) -> bool:
+    """True cuando el error indica una conexión caída y vale la pena reconectar."""
+    if isinstance(error, mariadb.InterfaceError):
+        return True
+    return (
+        isinstance(error, mariadb.OperationalError)
+        and getattr(error, "errno", None) in _CONNECTION_LOST_ERRNOS
+    )
+
+
+class ConnectionPool:
+    """Pool de conexiones MariaDB de larga vida compartido entre modelos.
+
+    - size: máximo de conexiones abiertas (en uso + ociosas).
+    - max_idle_seconds: las conexiones ociosas más viejas que esto se cierran.
+    - validation_seconds: si una conexión estuvo ociosa más de este tiempo se
+      valida con ping() antes de entregarla; si falla, se reemplaza.
+    """
+
+    def __init__(
+        self,
+        config: dict,
+        size: int = DEFAULT_POOL_SIZE,
+        timeout_seconds: float = DEFAULT_POOL_TIMEOUT_SECONDS,
+        max_idle_seconds: float = DEFAULT_POOL_MAX_IDLE_SECONDS,
+        validation_seconds: float = DEFAULT_POOL_VALIDATION_SECONDS,
+    ):
+        self._config = dict(config, autocommit=True)
+        self._size = max(1, size)
+        self._timeout = timeout_seconds
+        self._max_idle = max_idle_seconds
+        self._validation = validation_seconds
+        self._idle: list[tuple[Any, float]] = []  # (connection, returned_at), LIFO
+        self._open = 0
+        self._condition = threading.Condition()
+
+    @property
+    def Size(self) -> int:
+        return self._size
+
+    @property
+    def OpenConnections(self) -> int:
+        return self._open
+
+    def _close_quietly(self, connection) -> None:
+        try:
+            connection.close()
+        except mariadb.Error:
+            pass
+
+    def _evict_idle(self, now: float) -> list:
+        """Quita del pool las conexiones ociosas vencidas (llamar con el lock tomado)."""
+        expired = [conn for conn, returned_at in self._idle if now - returned_at > self._max_idle]
+        if expired:
+            self._idle = [(c, t) for c, t in self._idle if now - t <= self._max_idle]
+            self._open -= len(expired)
+        return expired
+
+    def _is_healthy(self, connection, idle_for: float) -> bool:
+        if idle_for <= self._validation:
+            return True
+        try:
+            connection.ping()
+            return True
+        except mariadb.Error:
+            return False
+
+    def _new_connection(self):
+        try:
+            return mariadb.connect(**self._config)
+        except mariadb.Error as error:
+            print(f"❌ Error connecting to Workana bot DB: {error}")
+            with self._condition:
+                self._open -= 1
+                self._condition.notify()
+            return None
+
+    def acquire(self):
+        """Entrega una conexión sana o None si no fue posible obtenerla a tiempo."""
+        deadline = time.monotonic() + self._timeout
+        while True:
+            with self._condition:
+                now = time.monotonic()
+                expired = self._evict_idle(now)
+                candidate = None
+                if self._idle:
+                    candidate, returned_at = self._idle.pop()
+                elif self._open < self._size:
+                    self._open += 1
+                else:
+                    remaining = deadline - now
+                    if remaining <= 0:
+                        print("❌ Pool de conexiones agotado: no hay conexiones libres.")
+                        return None
+                    self._condition.wait(remaining)
+                    continue
+
+            for connection in expired:
+                self._close_quietly(connection)
+
+            if candidate is None:
+                return self._new_connection()
+
+            if self._is_healthy(candidate, now - returned_at):
+                return candidate
+
+            # Conexión caída: se descarta y se abre una nueva en su lugar
+            self._close_quietly(candidate)
+            return self._new_connection()
+
+    def release(self, connection, *, discard: bool = False) -> None:
+        """Devuelve la conexión al pool (o la cierra si está rota)."""
+        if connection is None:
+            return
+        with self._condition:
+            if discard:
+                self._open -= 1
+            else:
+                self._idle.append((connection, time.monotonic()))
+            self._condition.notify()
+
+        if discard:
+            self._close_quietly(connection)
+
+    def close_all(self) -> None:
+        with self._condition:
+            idle = [conn for conn, _ in self._idle]
+            self._idle = []
+            self._open -= len(idle)
+        for connection in idle:
+            self._close_quietly(connection)
+
+
+_pools: dict[tuple, ConnectionPool] = {}
+_pools_lock = threading.Lock()
+
+
+def get_shared_pool(config: dict) -> ConnectionPool | None:
+    """Pool compartido por proceso para la configuración dada (None si está deshabilitado).
+
+    DB_POOL_SIZE=0 desactiva el pool y vuelve a una conexión por sentencia.
+    """
+    size = int(_env_number("DB_POOL_SIZE", DEFAULT_POOL_SIZE))
+    if size <= 0:
+        return None
+    key = (config["host"], config["port"], config["database"], config["user"])
+    with _pools_lock:
+        pool = _pools.get(key)
+        if pool is None:
+            pool = ConnectionPool(
+                config,
+                size=size,
+                timeout_seconds=_env_number("DB_POOL_TIMEOUT_SECONDS", DEFAULT_POOL_TIMEOUT_SECONDS),
+                max_idle_seconds=_env_number("DB_POOL_MAX_IDLE_SECONDS", DEFAULT_POOL_MAX_IDLE_SECONDS),
+                validation_seconds=_env_number(
+                    "DB_POOL_VALIDATION_SECONDS", DEFAULT_POOL_VALIDATION_SECONDS
+                ),
+            )
+            _pools[key] = pool
+        return pool
+
+
+def close_shared_pools() -> None:
+    """Cierra las conexiones ociosas de todos los pools (para apagar el proceso)."""
+    with _pools_lock:
+        pools = list(_pools.values())
+        _pools.clear()
+    for pool in pools:
+        pool.close_all()
+
+
+class Transaction:
+    """Unidad de trabajo: una sola conexión, varias sentencias y un único commit.
+
+    Ofrece la misma interfaz execute_* que WorkanaBotDatabase. Si una sentencia
+    de escritura falla, la transacción queda marcada y al salir se hace rollback;
+    las escrituras posteriores se omiten y devuelven False.
+    """
+
+    def __init__(self, connection):
+        self._connection = connection
+        self._failed = connection is None
+        self._committed = False
+
+    @property
+    def IsFailed(self) -> bool:
+        return self._failed
+
+    @property
+    def IsCommitted(self) -> bool:
+        return self._committed
+
+    @property
+    def HasConnection(self) -> bool:
+        """False si no se pudo obtener una conexión (la transacción nace fallida)."""
+        return self._connection is not None
+
+    def mark_failed(self) -> None:
+        """Fuerza el rollback al cerrar la transacción."""
+        self._failed = True
+
+    def execute_scalar(self, sql: str, params: tuple = ()) -> Any:
+        if self._connection is None:
+            return None
+        cursor = self._connection.cursor()
+        cursor.execute(sql, params)
+        result = cursor.fetchone()
+        return result[0] if result else None
+
+    def execute_query(self, sql: str, params: tuple = ()) -> list:
+        if self._connection is None:
+            return []
+        cursor = self._connection.cursor()
+        cursor.execute(sql, params)
+        return cursor.fetchall()
+
+    def execute_non_query(self, sql: str, params: tuple = ()) -> bool:
+        return self.execute_rowcount(sql, params) is not None
+
+    def execute_rowcount(self, sql: str, params: tuple = ()) -> int | None:
+        if self._failed:
+            return None
+        try:
+            cursor = self._connection.cursor()
+            cursor.execute(sql, params)
+            return cursor.rowcount
+        except Exception as error:
+            print(f"❌ SQL Execution Error: {error}")
+            self._failed = True
+            return None
+
+    def execute_many(self, sql: str, seq_params: Sequence[tuple]) -> bool:
+        if self._failed:
+            return False
+        if not seq_params:
+            return True
+        try:
+            cursor = self._connection.cursor()
+            cursor.executemany(sql, list(seq_params))
+            return True
+        except Exception as error:
+            print(f"❌ SQL Execution Error: {error}")
+            self._failed = True
+            return False
+
+    def _finish(self) -> None:
+        if self._connection is None:
+            return
+        if self._failed:
+            self._connection.rollback()
+            return
+        try:
+            self._connection.commit()
+            self._committed = True
+        except mariadb.Error as error:
+            print(f"❌ Error al confirmar la transacción: {error}")
+            self._failed = True
+
+
 class WorkanaBotDatabase:
-    def __init__(self):
+    def __init__(self, use_pool: bool = True):
         self._connection = None
-    
+        self._use_pool = use_pool
+        self._pool: ConnectionPool | None = None
+        self._pool_resolved = False
+        self._transaction: Transaction | None = None
+
     @property
     def IsConnected(self) -> bool:
         return self._connection is not None
 
+    @property
+    def InTransaction(self) -> bool:
+        return self._transaction is not None
+
     def _get_connection_config(self) -> dict:
         host = _require_env("DB_HOST")
         port = int(_require_env("DB_PORT"))
@@ -38,53 +331,176 @@ class WorkanaBotDatabase:
             "password": password,
         }
 
-    def connect(self):
+    def _get_pool(self) -> ConnectionPool | None:
+        if not self._pool_resolved:
+            self._pool = get_shared_pool(self._get_connection_config()) if self._use_pool else None
+            self._pool_resolved = True
+        return self._pool
+
+    def _open_connection(self):
+        pool = self._get_pool()
+        if pool is not None:
+            return pool.acquire()
         try:
-            config = self._get_connection_config()
-            self._connection = mariadb.connect(**config)
+            return mariadb.connect(**self._get_connection_config())
         except mariadb.Error as error:
             print(f"❌ Error connecting to Workana bot DB: {error}")
-            self._connection = None
+            return None
+
+    def _close_connection(self, connection, *, discard: bool = False) -> None:
+        if connection is None:
+            return
+        pool = self._get_pool()
+        if pool is not None:
+            pool.release(connection, discard=discard)
+            return
+        try:
+            connection.close()
+        except mariadb.Error:
+            pass
+
+    def connect(self):
+        """Reserva una conexión para esta instancia hasta llamar a disconnect().
+
+        Mientras la conexión esté reservada, execute_* la reutilizan en lugar de
+        pedir una nueva por sentencia.
+        """
+        if self._connection is not None:
+            return
+        self._connection = self._open_connection()
 
     def disconnect(self):
         if self._connection:
-            self._connection.close()
+            self._close_connection(self._connection)
             self._connection = None
 
-    def execute_scalar(self, sql: str, params: tuple = ()) -> Any:
+    @contextmanager
+    def connection(self) -> Iterator["WorkanaBotDatabase"]:
+        """connect() con liberación garantizada: devuelve la conexión al pool al
+        salir del bloque aunque haya una excepción o un return temprano.
+
+        Si la instancia ya tenía una conexión reservada, la deja reservada.
+        """
+        held = self._connection is not None
         self.connect()
-        if not self._connection:
-            return None
-        cursor = self._connection.cursor()
-        cursor.execute(sql, params)
-        result = cursor.fetchone()
-        self.disconnect()
-        return result[0] if result else None
+        try:
+            yield self
+        finally:
+            if not held:
+                self.disconnect()
+
+    def _run(self, handler, sql: str, params: tuple, default: Any) -> Any:
+        """Ejecuta handler(cursor) en una conexión reservada o prestada del pool.
+
+        Si la conexión resulta estar caída se reintenta una vez con otra nueva.
+        """
+        held = self._connection is not None
+        for attempt in range(2):
+            connection = self._connection if held else self._open_connection()
+            if connection is None:
+                return default
+            broken = False
+            try:
+                cursor = connection.cursor()
+                cursor.execute(sql, params)
+                return handler(connection, cursor)
+            except mariadb.Error as error:
+                broken = _is_connection_error(error)
+                if not broken or attempt == 1:
+                    raise
+                print(f"⚠️ Conexión perdida con la DB, reintentando: {error}")
+            finally:
+                if broken and held:
+                    self._close_connection(connection, discard=True)
+                    self._connection = self._open_connection()
+                elif not held:
+                    self._close_connection(connection, discard=broken)
+        return default
+
+    @contextmanager
+    def transaction(self) -> Iterator[Transaction]:
+        """Agrupa sentencias en una transacción con un único commit.
+
+        Mientras está abierta, las llamadas execute_* de esta instancia (y de los
+        modelos que la usan) se ejecutan dentro de ella. Las transacciones
+        anidadas se unen a la exterior.
+        """
+        if self._transaction is not None:
+            yield self._transaction
+            return
+
+        held = self._connection is not None
+        connection = self._connection if held else self._open_connection()
+        tx = Transaction(connection)
+        broken = False
+        self._transaction = tx
+        try:
+            if connection is not None:
+                connection.begin()
+            yield tx
+        except BaseException:
+            if connection is not None:
+                try:
+                    connection.rollback()
+                except mariadb.Error as error:
+                    broken = _is_connection_error(error)
+            tx.mark_failed()
+            raise
+        else:
+            try:
+                tx._finish()
+            except mariadb.Error as error:
+                print(f"❌ Error al cerrar la transacción: {error}")
+                broken = _is_connection_error(error)
+        finally:
+            self._transaction = None
+            if not held:
+                self._close_connection(connection, discard=broken)
+
+    def execute_scalar(self, sql: str, params: tuple = ()) -> Any:
+        if self._transaction is not None:
+            return self._transaction.execute_scalar(sql, params)
+
+        def handler(connection, cursor):
+            result = cursor.fetchone()
+            return result[0] if result else None
+
+        return self._run(handler, sql, params, None)
 
     def execute_query(self, sql: str, params: tuple = ()) -> list:
-        self.connect()
-        if not self._connection:
-            return []
-        cursor = self._connection.cursor()
-        cursor.execute(sql, params)
-        result = cursor.fetchall()
-        self.disconnect()
-        return result
+        if self._transaction is not None:
+            return self._transaction.execute_query(sql, params)
+        return self._run(lambda connection, cursor: cursor.fetchall(), sql, params, [])
 
     def execute_non_query(self, sql: str, params: tuple = ()) -> bool:
-        self.connect()
-        if not self._connection:
-            return False
-        cursor = self._connection.cursor()
+        return self.execute_rowcount(sql, params) is not None
+
+    def execute_rowcount(self, sql: str, params: tuple = ()) -> int | None:
+        """Como execute_non_query, pero devuelve las filas afectadas (None si falló)."""
+        if self._transaction is not None:
+            return self._transaction.execute_rowcount(sql, params)
+
+        def handler(connection, cursor):
+            # Las conexiones del pool trabajan en autocommit; commit solo hace falta sin pool
+            if not connection.autocommit:
+                connection.commit()
+            return cursor.rowcount
+
         try:
-            cursor.execute(sql, params)
-            self._connection.commit()
-            return True
+            return self._run(handler, sql, params, None)
         except Exception as error:
             print(f"❌ SQL Execution Error: {error}")
-            return False
-        finally:
-            self.disconnect()
+            return None
+
+    def execute_many(self, sql: str, seq_params: Sequence[tuple]) -> bool:
+        """Ejecuta la misma sentencia para cada juego de parámetros en un solo envío."""
+        if self._transaction is not None:
+            return self._transaction.execute_many(sql, seq_params)
+        if not seq_params:
+            return True
+        with self.transaction() as tx:
+            tx.execute_many(sql, seq_params)
+        return tx.IsCommitted
 
 # 🔽 MAIN PARA PRUEBA MANUAL DE LA CONEXIÓN
 if __name__ == "__main__":
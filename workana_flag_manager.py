@@ -1,18 +1,39 @@
 # workana_flag_manager.py
 # Controla la ejecución del script Workana según la base de datos
 
+import threading
+
 from variables_api_db import VariablesApiController
 from local_o_vps import entorno
 
-config = VariablesApiController(entorno)
+_config: VariablesApiController | None = None
+_config_lock = threading.Lock()
+
+
+def _get_config() -> VariablesApiController:
+    """Crea el controlador en el primer uso: importar el módulo no abre conexiones."""
+    global _config
+    with _config_lock:
+        if _config is None:
+            _config = VariablesApiController(entorno)
+        return _config
+
+
+def __getattr__(name: str):
+    # Compatibilidad con quienes usaban workana_flag_manager.config
+    if name == "config":
+        return _get_config()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 def debe_ejecutarse() -> bool:
-    return config.ScriptMustRun
+    return _get_config().ScriptMustRun
 
 
 def debe_scrapear_general() -> bool:
     """Indica si debe ejecutarse el scraper general según la variable remota."""
 
+    config = _get_config()
     if not config.IsConnected:
         print(
             "⚠️ No se pudo contactar la base de variables; se asume habilitado el scraper general."
@@ -25,21 +46,22 @@ def debe_scrapear_general() -> bool:
 def estado_remoto_scraper() -> bool | None:
     """Return the remote scraper flag when available, otherwise None."""
 
+    config = _get_config()
     if not config.IsConnected:
         return None
     return config.GeneralScraperEnabled
 
 def activar_script() -> bool:
-    return config.StartScraping()
+    return _get_config().StartScraping()
 
 def desactivar_script() -> bool:
-    return config.StopScraping()
+    return _get_config().StopScraping()
 
 def tiene_conexion_config() -> bool:
-    return config.IsConnected
+    return _get_config().IsConnected
 
 def obtener_codigo_error_conexion() -> str:
-    return config.ConnectionErrorCode or "VAR-DB-CONN-001"
+    return _get_config().ConnectionErrorCode or "VAR-DB-CONN-001"
 
 if __name__ == "__main__":
     estado_actual = debe_ejecutarse()
@@ -0,0 +1,104 @@
+# workana_listing_parser.py
+"""Parseo del listado de Workana a models.Project sin navegador (BeautifulSoup).
+
+Usa los mismos selectores que el scraper de Selenium para que ambos caminos
+produzcan objetos Project/Skill equivalentes. Las urls de los proyectos salen en
+forma canónica (sin ?ref=..., ver project_url.py).
+"""
+from typing import Any, Dict, List, Optional
+from urllib.parse import parse_qs, urljoin, urlparse
+
+from bs4 import BeautifulSoup
+
+from models import Project, Skill
+from project_url import canonicalize_project_url
+
+WORKANA_BASE_URL = "https://www.workana.com"
+CARD_SELECTOR = ".project-item.js-project"
+TITLE_SELECTOR = ".project-title"
+DESCRIPTION_SELECTOR = ".html-desc.project-details"
+LINK_SELECTOR = "a[href^='/job/']"
+SKILL_SELECTOR = "div.skills a.skill"
+
+
+def parse_skill_slug(href: str) -> str:
+    """Extrae el slug del parámetro `skills` del enlace de la skill."""
+    if not href:
+        return ""
+    return parse_qs(urlparse(href).query).get("skills", [""])[0]
+
+
+def build_skill(name: str, href: str) -> Skill:
+    return Skill(name=name.strip(), slug=parse_skill_slug(href), href=href)
+
+
+def parse_listing_html(html: str, base_url: str = WORKANA_BASE_URL) -> Optional[List[Project]]:
+    """
+    Convierte el HTML del listado en proyectos.
+    Devuelve None si el HTML no contiene tarjetas (p. ej. el listado se
+    renderiza con JavaScript) para que el llamador use Selenium.
+    """
+    soup = BeautifulSoup(html, "html.parser")
+    cards = soup.select(CARD_SELECTOR)
+    if not cards:
+        return None
+
+    results: List[Project] = []
+    for card in cards:
+        title_node = card.select_one(TITLE_SELECTOR)
+        title = title_node.get_text(" ", strip=True) if title_node else ""
+        if not title:
+            continue
+        link_node = card.select_one(LINK_SELECTOR)
+        link = link_node.get("href") if link_node else None
+        if not link:
+            continue
+        desc_node = card.select_one(DESCRIPTION_SELECTOR)
+        desc = desc_node.get_text("\n", strip=True) if desc_node else ""
+
+        skills: List[Skill] = []
+        for node in card.select(SKILL_SELECTOR):
+            name_node = node.find("h3")
+            name = name_node.get_text(strip=True) if name_node else ""
+            if not name:
+                continue
+            skills.append(build_skill(name, urljoin(base_url, node.get("href") or "")))
+
+        results.append(
+            Project(
+                Title=title,
+                Description=desc,
+                Url=canonicalize_project_url(urljoin(base_url, link)),
+                Skills=skills,
+            )
+        )
+    return results
+
+
+def projects_from_card_payload(
+    cards: Optional[List[Dict[str, Any]]], base_url: str = WORKANA_BASE_URL
+) -> List[Project]:
+    """
+    Convierte el JSON devuelto por la extracción en página de Selenium
+    ({title, desc, href, skills: [{name, href}]}) en proyectos.
+    """
+    results: List[Project] = []
+    for card in cards or []:
+        title = (card.get("title") or "").strip()
+        href = card.get("href") or ""
+        if not title or not href:
+            continue
+        skills = [
+            build_skill(skill.get("name") or "", urljoin(base_url, skill.get("href") or ""))
+            for skill in card.get("skills") or []
+            if (skill.get("name") or "").strip()
+        ]
+        results.append(
+            Project(
+                Title=title,
+                Description=(card.get("desc") or "").strip(),
+                Url=canonicalize_project_url(urljoin(base_url, href)),
+                Skills=skills,
+            )
+        )
+    return results